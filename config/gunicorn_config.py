@@ -0,0 +1,43 @@
+"""
+gunicorn configuration for AMY, used with `gunicorn --config python:config.gunicorn_config`.
+
+Settings can be changed with environment variables:
+
+* `AMY_GUNICORN_WORKERS` - number of worker processes (default: 4),
+* `AMY_GUNICORN_WORKER_CLASS` - worker class (default: `sync`),
+* `AMY_GUNICORN_THREADS` - threads per worker; more than 1 switches `sync`
+  workers to `gthread` (default: 1),
+* `AMY_GUNICORN_PRELOAD` - load and warm up the application in the master process
+  before forking workers, so they share its memory (default: true),
+* `AMY_GUNICORN_WARM_RESOURCES` - comma-separated names of lazy resources created
+  in the master process when preloading (default: `iata_airports`),
+* `AMY_GUNICORN_BIND` - address to listen on (default: `0.0.0.0:80`).
+"""
+
+import os
+from typing import Any
+
+
+def env_bool(name: str, default: bool) -> bool:
+    return os.environ.get(name, str(default)).lower() in ("1", "true", "yes", "on")
+
+
+workers = int(os.environ.get("AMY_GUNICORN_WORKERS", 4))
+worker_class = os.environ.get("AMY_GUNICORN_WORKER_CLASS", "sync")
+threads = int(os.environ.get("AMY_GUNICORN_THREADS", 1))
+preload_app = env_bool("AMY_GUNICORN_PRELOAD", True)
+bind = os.environ.get("AMY_GUNICORN_BIND", "0.0.0.0:80")
+accesslog = "-"
+capture_output = True
+raw_env = ["DJANGO_SETTINGS_MODULE=config.settings"]
+
+_warm_resources = [name for name in os.environ.get("AMY_GUNICORN_WARM_RESOURCES", "iata_airports").split(",") if name]
+wsgi_app = f"config.wsgi:create_application({', '.join(repr(name) for name in _warm_resources)})"
+
+
+def pre_fork(server: Any, worker: Any) -> None:
+    """Workers must not share database connections with the master process."""
+    if server.cfg.preload_app:
+        from django.db import connections
+
+        connections.close_all()
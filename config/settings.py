@@ -51,6 +51,7 @@ env = environ.Env(
     ),
     AMY_SITE_BANNER=(str, "local"),  # should be "local", "testing", or "production"
     AMY_EMAIL_ATTACHMENTS_S3_BUCKET_NAME=(str, "carpentries-amy-email-attachments-staging"),
+    AMY_INSTRUMENTATION_ENABLED=(bool, False),
 )
 
 # OS environment variables take precedence over variables from .env
@@ -278,6 +279,7 @@ CACHES = {
 # https://docs.djangoproject.com/en/dev/ref/settings/#middleware
 MIDDLEWARE = [
     "src.workshops.middleware.version_check.VersionCheckMiddleware",
+    "src.workshops.middleware.instrumentation.InstrumentationMiddleware",
     "debug_toolbar.middleware.DebugToolbarMiddleware",
     "reversion.middleware.RevisionMiddleware",
     "django.middleware.security.SecurityMiddleware",
@@ -570,6 +572,12 @@ DEBUG_TOOLBAR_PANELS = [
     "flags.panels.FlagChecksPanel",
 ]
 
+# Instrumentation
+# -----------------------------------------------------------------------------
+# Per-request SQL query count and latency metrics, see
+# `src.workshops.middleware.instrumentation.InstrumentationMiddleware`.
+INSTRUMENTATION_ENABLED = env("AMY_INSTRUMENTATION_ENABLED")
+
 # Django-contrib-comments
 # -----------------------------------------------------------------------------
 # https://django-contrib-comments.readthedocs.io/en/latest/settings.html
@@ -659,6 +667,13 @@ FLAGS = {
     ],
 }
 
+# FlagState rows from the database are cached per process, see
+# `src.workshops.utils.feature_flags.CachedDatabaseFlagsSource`.
+FLAG_SOURCES = (
+    "flags.sources.SettingsFlagsSource",
+    "src.workshops.utils.feature_flags.CachedDatabaseFlagsSource",
+)
+
 # Instructor Certificates
 # -----------------------------------------------------------------------------
 CERTIFICATE_SIGNATURE = "SherAaron Hurt (Director of Workshops and Instruction)"
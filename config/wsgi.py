@@ -7,9 +7,11 @@ For more information on this file, see
 https://docs.djangoproject.com/en/2.1/howto/deployment/wsgi/
 """
 
+import logging
 import os
 import sys
 
+from django.core.handlers.wsgi import WSGIHandler
 from django.core.wsgi import get_wsgi_application
 
 # This allows easy placement of apps within the interior
@@ -27,6 +29,21 @@ os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
 # file. This includes Django's development server, if the WSGI_APPLICATION
 # setting points here.
 application = get_wsgi_application()
+logger = logging.getLogger("amy")
+
+
+def create_application(*resources: str) -> WSGIHandler:
+    """Application factory for gunicorn (see `config/gunicorn_config.py`).
+
+    With `preload_app` it's called once in the master process, so process-wide
+    caches warmed here are shared by all forked workers. Names of lazy resources
+    (see `src.workshops.utils.resources`) to create upfront can be given."""
+    from src.workshops.utils.warmup import warm_up
+
+    timings = warm_up(resources)
+    logger.info("Application warmed up: " + ", ".join(f"{step}={duration:.1f}ms" for step, duration in timings.items()))
+    return application
+
 
 # Apply WSGI middleware here.
 # from helloworld.wsgi import HelloWorldApplication
@@ -3,3 +3,8 @@ from django.apps import AppConfig
 
 class ApiConfig(AppConfig):
     name = "src.api"
+
+    def ready(self) -> None:
+        from src.api.change_feed import connect_receivers
+
+        connect_receivers()
@@ -0,0 +1,71 @@
+"""Change feed of models exposed via API v2.
+
+Saving or deleting an instance of a tracked model writes a `ChangeFeedEntry` in
+the same transaction (outbox pattern), so entries are committed or rolled back
+together with the change. Consumers read the feed with `/api/v2/changes?since=<cursor>`.
+
+Bulk operations (`QuerySet.update()`, `bulk_create()`, `bulk_update()`) and M2M
+changes don't send `post_save`/`post_delete` signals and aren't recorded, unless
+recorded explicitly with `record_bulk_create()`."""
+
+from collections.abc import Iterable
+from typing import Any
+
+from django.apps import apps
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import Model
+from django.db.models.signals import post_delete, post_save
+
+from src.api.models import ChangeFeedEntry
+
+TRACKED_MODELS = (
+    "emails.Attachment",
+    "emails.ScheduledEmail",
+    "extrequests.SelfOrganisedSubmission",
+    "fiscal.Consortium",
+    "fiscal.Partnership",
+    "recruitment.InstructorRecruitmentSignup",
+    "workshops.Award",
+    "workshops.Event",
+    "workshops.Membership",
+    "workshops.Organization",
+    "workshops.Person",
+    "workshops.Task",
+    "workshops.TrainingProgress",
+    "workshops.TrainingRequirement",
+)
+
+
+def record_change(model: type[Model], instance: Model, action: ChangeFeedEntry.Action) -> ChangeFeedEntry:
+    return ChangeFeedEntry.objects.create(
+        content_type=ContentType.objects.get_for_model(model),
+        object_pk=str(instance.pk),
+        action=action,
+    )
+
+
+def record_bulk_create(model: type[Model], instances: Iterable[Model]) -> None:
+    """Record instances created with `bulk_create()` with a single query."""
+    content_type = ContentType.objects.get_for_model(model)
+    ChangeFeedEntry.objects.bulk_create(
+        ChangeFeedEntry(content_type=content_type, object_pk=str(instance.pk), action=ChangeFeedEntry.Action.CREATED)
+        for instance in instances
+    )
+
+
+def record_save(sender: type[Model], instance: Model, created: bool, raw: bool = False, **kwargs: Any) -> None:
+    if raw:
+        # fixtures loading
+        return
+    record_change(sender, instance, ChangeFeedEntry.Action.CREATED if created else ChangeFeedEntry.Action.UPDATED)
+
+
+def record_delete(sender: type[Model], instance: Model, **kwargs: Any) -> None:
+    record_change(sender, instance, ChangeFeedEntry.Action.DELETED)
+
+
+def connect_receivers() -> None:
+    for label in TRACKED_MODELS:
+        model = apps.get_model(label)
+        post_save.connect(record_save, sender=model, dispatch_uid=f"change_feed_save_{label}")
+        post_delete.connect(record_delete, sender=model, dispatch_uid=f"change_feed_delete_{label}")
@@ -0,0 +1,127 @@
+"""Conditional GET (`ETag` / `Last-Modified`) for API viewsets.
+
+Viewsets that declare `last_modified_fields` get a cheap validator computed with
+a single aggregate query (row count and the newest timestamp of each field) over
+the filtered queryset, so unchanged pages and objects are answered with
+`304 Not Modified` before anything is serialized. The fields must cover every
+row that contributes to the serialized representation; related rows can be
+referenced with lookups, e.g. `attachments__last_updated_at`.
+
+Other viewsets fall back to an `ETag` computed from the rendered response, which
+only saves bandwidth."""
+
+from datetime import datetime
+from hashlib import md5
+from typing import Any
+
+from django.db.models import Count, Max, Model, QuerySet
+from django.db.models.constants import LOOKUP_SEP
+from django.http import HttpResponseBase
+from django.utils.cache import get_conditional_response, patch_cache_control, set_response_etag
+from django.utils.http import http_date, quote_etag
+from rest_framework import viewsets
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+CONDITIONAL_ACTIONS = ("list", "retrieve")
+
+
+class ConditionalGetMixin[M: Model](viewsets.ReadOnlyModelViewSet[M]):
+    # Timestamp fields or lookups used to compute the validator. Leave empty if the
+    # serialized representation depends on rows without timestamps.
+    last_modified_fields: tuple[str, ...] = ()
+    # Responses are only for authenticated users and must always be revalidated.
+    cache_control: dict[str, bool] = {"private": True, "no_cache": True}
+
+    def get_validators(self, queryset: QuerySet[M], *, single: bool) -> tuple[str, datetime | None]:
+        """Return an ETag and Last-Modified date of the resource represented
+        by the queryset.
+
+        Counting rows (including joined related rows) catches deletions, and
+        max timestamps catch additions and updates. Last-Modified is only
+        returned for single objects without related lookups, since it can't
+        reflect deleted rows."""
+        aggregates = {f"max_{i}": Max(field) for i, field in enumerate(self.last_modified_fields)}
+        values = queryset.order_by().aggregate(rows=Count("*"), **aggregates)
+        timestamps = [values[f"max_{i}"] for i in range(len(self.last_modified_fields))]
+
+        request = self.request
+        key = repr(
+            (
+                request.path,
+                sorted(request.query_params.lists()),
+                request.accepted_renderer.format,
+                values["rows"],
+                [timestamp.isoformat() if timestamp else None for timestamp in timestamps],
+            )
+        )
+        etag = quote_etag(md5(key.encode(), usedforsecurity=False).hexdigest())
+
+        last_modified = None
+        if single and not any(LOOKUP_SEP in field for field in self.last_modified_fields):
+            last_modified = max((timestamp for timestamp in timestamps if timestamp), default=None)
+
+        return etag, last_modified
+
+    def conditional_response(self, queryset: QuerySet[M], *, single: bool) -> HttpResponseBase | None:
+        """Return `304 Not Modified` response if client's copy is still valid,
+        otherwise store validators to be included in the full response."""
+        etag, last_modified = self.get_validators(queryset, single=single)
+        self._etag = etag
+        self._last_modified = last_modified
+
+        not_modified = get_conditional_response(
+            self.request,
+            etag=etag,
+            last_modified=int(last_modified.timestamp()) if last_modified else None,
+        )
+        if not_modified is not None:
+            self.set_validators(not_modified)
+        return not_modified
+
+    def set_validators(self, response: HttpResponseBase) -> None:
+        response.headers["ETag"] = self._etag
+        if self._last_modified:
+            response.headers["Last-Modified"] = http_date(self._last_modified.timestamp())
+
+    def list(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        if self.last_modified_fields:
+            queryset = self.filter_queryset(self.get_queryset())
+            if (not_modified := self.conditional_response(queryset, single=False)) is not None:
+                return not_modified  # type: ignore[return-value]
+
+        return super().list(request, *args, **kwargs)
+
+    def retrieve(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        if self.last_modified_fields:
+            lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+            queryset = self.filter_queryset(self.get_queryset()).filter(
+                **{self.lookup_field: self.kwargs[lookup_url_kwarg]}
+            )
+            if (not_modified := self.conditional_response(queryset, single=True)) is not None:
+                return not_modified  # type: ignore[return-value]
+
+        return super().retrieve(request, *args, **kwargs)
+
+    def finalize_response(self, request: Request, response: HttpResponseBase, *args: Any, **kwargs: Any) -> Any:
+        response = super().finalize_response(request, response, *args, **kwargs)
+
+        if (
+            self.action not in CONDITIONAL_ACTIONS
+            or request.method not in ("GET", "HEAD")
+            or response.status_code not in (200, 304)
+        ):
+            return response
+
+        patch_cache_control(response, **self.cache_control)
+        if response.status_code == 304:
+            return response
+
+        if self.last_modified_fields:
+            self.set_validators(response)
+        elif isinstance(response, Response):
+            response.render()
+            set_response_etag(response)
+            return get_conditional_response(request, etag=response.get("ETag"), response=response)
+
+        return response
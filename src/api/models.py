@@ -0,0 +1,103 @@
+from dataclasses import dataclass
+from typing import ClassVar, Self
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import models
+from django.db.models.functions import Cast
+
+from src.workshops.mixins import CreatedMixin
+
+
+def current_transaction_id() -> Cast:
+    """ID of the current Postgres transaction (assigned on first write)."""
+    return Cast(
+        Cast(models.Func(function="pg_current_xact_id", output_field=models.TextField()), models.TextField()),
+        models.BigIntegerField(),
+    )
+
+
+def oldest_running_transaction_id() -> Cast:
+    """Lowest ID of transactions still running in the current snapshot. All rows
+    written by transactions with lower IDs are already committed (or rolled back)."""
+    return Cast(
+        Cast(
+            models.Func(
+                models.Func(function="pg_current_snapshot", output_field=models.TextField()),
+                function="pg_snapshot_xmin",
+                output_field=models.TextField(),
+            ),
+            models.TextField(),
+        ),
+        models.BigIntegerField(),
+    )
+
+
+@dataclass(frozen=True)
+class ChangeFeedCursor:
+    """Position in the change feed: `<transaction ID>.<entry ID>`."""
+
+    transaction_id: int
+    entry_id: int
+
+    SEPARATOR: ClassVar[str] = "."
+
+    def __str__(self) -> str:
+        return f"{self.transaction_id}{self.SEPARATOR}{self.entry_id}"
+
+    @classmethod
+    def parse(cls, value: str) -> Self:
+        """Raise `ValueError` for malformed cursors."""
+        transaction_id, entry_id = value.split(cls.SEPARATOR)
+        if not transaction_id.isdigit() or not entry_id.isdigit():
+            raise ValueError(f"Invalid cursor {value!r}")
+        return cls(int(transaction_id), int(entry_id))
+
+
+class ChangeFeedEntryQuerySet(models.QuerySet["ChangeFeedEntry"]):
+    def visible(self) -> Self:
+        """Entries from committed transactions only.
+
+        Entry IDs (and transaction IDs) are assigned when rows are written, not when
+        they are committed. Without this filter a reader could pass over an entry of
+        a long transaction that commits after entries with higher IDs were read."""
+        return self.filter(transaction_id__lt=oldest_running_transaction_id())
+
+    def after(self, cursor: ChangeFeedCursor | None) -> Self:
+        qs = self.order_by("transaction_id", "id")
+        if cursor is None:
+            return qs
+
+        # the first condition allows using range scan over the cursor index
+        return qs.filter(transaction_id__gte=cursor.transaction_id).filter(
+            models.Q(transaction_id__gt=cursor.transaction_id) | models.Q(id__gt=cursor.entry_id)
+        )
+
+
+class ChangeFeedEntry(CreatedMixin, models.Model):
+    """Change of a model instance exposed via API, written in the same transaction
+    as the change itself (outbox). See `src.api.change_feed`."""
+
+    class Action(models.TextChoices):
+        CREATED = "created"
+        UPDATED = "updated"
+        DELETED = "deleted"
+
+    id = models.BigAutoField(primary_key=True)
+    transaction_id = models.BigIntegerField(db_default=current_transaction_id(), editable=False)
+    content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
+    object_pk = models.CharField(max_length=255)
+    action = models.CharField(max_length=10, choices=Action.choices)
+
+    objects = ChangeFeedEntryQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["transaction_id", "id"], name="change_feed_cursor_idx"),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.action} {self.content_type_id}:{self.object_pk}"
+
+    @property
+    def cursor(self) -> ChangeFeedCursor:
+        return ChangeFeedCursor(self.transaction_id, self.id)
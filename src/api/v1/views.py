@@ -15,6 +15,7 @@ from rest_framework.reverse import reverse
 from rest_framework.settings import api_settings
 from rest_framework.views import APIView
 
+from src.api.conditional import ConditionalGetMixin
 from src.api.v1.filters import (
     EventFilter,
     PersonFilter,
@@ -202,7 +203,7 @@ class TrainingRequests(ListAPIView[TrainingRequest]):
 # ----------------------
 
 
-class OrganizationViewSet(viewsets.ReadOnlyModelViewSet[Organization]):
+class OrganizationViewSet(ConditionalGetMixin[Organization], viewsets.ReadOnlyModelViewSet[Organization]):
     """List many hosts or retrieve only one."""
 
     permission_classes = (IsAuthenticated, IsAdmin)
@@ -213,7 +214,7 @@ class OrganizationViewSet(viewsets.ReadOnlyModelViewSet[Organization]):
     pagination_class = StandardResultsSetPagination
 
 
-class EventViewSet(viewsets.ReadOnlyModelViewSet[Event]):
+class EventViewSet(ConditionalGetMixin[Event], viewsets.ReadOnlyModelViewSet[Event]):
     """List many events or retrieve only one."""
 
     permission_classes = (IsAuthenticated, IsAdmin)
@@ -224,7 +225,7 @@ class EventViewSet(viewsets.ReadOnlyModelViewSet[Event]):
     filterset_class = EventFilter
 
 
-class TaskViewSet(viewsets.ReadOnlyModelViewSet[Task]):
+class TaskViewSet(ConditionalGetMixin[Task], viewsets.ReadOnlyModelViewSet[Task]):
     """List tasks belonging to specific event."""
 
     permission_classes = (IsAuthenticated, IsAdmin)
@@ -248,7 +249,7 @@ class TaskViewSet(viewsets.ReadOnlyModelViewSet[Task]):
         return super().retrieve(request, pk=pk)
 
 
-class TermViewSet(viewsets.ReadOnlyModelViewSet[Term]):
+class TermViewSet(ConditionalGetMixin[Term], viewsets.ReadOnlyModelViewSet[Term]):
     """List many active terms or retrieve only one active term."""
 
     permission_classes = (IsAuthenticated, IsAdmin)
@@ -257,7 +258,7 @@ class TermViewSet(viewsets.ReadOnlyModelViewSet[Term]):
     pagination_class = StandardResultsSetPagination
 
 
-class PersonViewSet(viewsets.ReadOnlyModelViewSet[Person]):
+class PersonViewSet(ConditionalGetMixin[Person], viewsets.ReadOnlyModelViewSet[Person]):
     """List many people or retrieve only one person."""
 
     permission_classes = (IsAuthenticated, IsAdmin)
@@ -267,7 +268,7 @@ class PersonViewSet(viewsets.ReadOnlyModelViewSet[Person]):
     filterset_class = PersonFilter
 
 
-class AwardViewSet(viewsets.ReadOnlyModelViewSet[Award]):
+class AwardViewSet(ConditionalGetMixin[Award], viewsets.ReadOnlyModelViewSet[Award]):
     """List awards belonging to specific person."""
 
     permission_classes = (IsAuthenticated, IsAdmin)
@@ -289,7 +290,7 @@ class AwardViewSet(viewsets.ReadOnlyModelViewSet[Award]):
         return super().retrieve(request, pk=pk)
 
 
-class PersonTaskViewSet(viewsets.ReadOnlyModelViewSet[Task]):
+class PersonTaskViewSet(ConditionalGetMixin[Task], viewsets.ReadOnlyModelViewSet[Task]):
     """List tasks done by specific person."""
 
     permission_classes = (IsAuthenticated, IsAdmin)
@@ -311,7 +312,7 @@ class PersonTaskViewSet(viewsets.ReadOnlyModelViewSet[Task]):
         return super().retrieve(request, pk=pk)
 
 
-class PersonConsentViewSet(viewsets.ReadOnlyModelViewSet[Consent]):
+class PersonConsentViewSet(ConditionalGetMixin[Consent], viewsets.ReadOnlyModelViewSet[Consent]):
     """List consents agreed to by a specific person."""
 
     permission_classes = (IsAuthenticated, IsAdmin)
@@ -333,7 +334,7 @@ class PersonConsentViewSet(viewsets.ReadOnlyModelViewSet[Consent]):
         return super().retrieve(request, pk=pk)
 
 
-class TrainingProgressViewSet(viewsets.ReadOnlyModelViewSet[TrainingProgress]):
+class TrainingProgressViewSet(ConditionalGetMixin[TrainingProgress], viewsets.ReadOnlyModelViewSet[TrainingProgress]):
     """List training progresses belonging to specific person."""
 
     permission_classes = (IsAuthenticated, IsAdmin)
@@ -355,7 +356,9 @@ class TrainingProgressViewSet(viewsets.ReadOnlyModelViewSet[TrainingProgress]):
         return super().retrieve(request, pk=pk)
 
 
-class CommunityRoleConfigViewSet(viewsets.ReadOnlyModelViewSet[CommunityRoleConfig]):
+class CommunityRoleConfigViewSet(
+    ConditionalGetMixin[CommunityRoleConfig], viewsets.ReadOnlyModelViewSet[CommunityRoleConfig]
+):
     """List existing Community Role Configurations."""
 
     permission_classes = (IsAuthenticated,)
@@ -0,0 +1,97 @@
+"""Derive `select_related` and `prefetch_related` lookups from serializer fields.
+
+Each serializer field's `source` is followed through model relations:
+to-one relations are joined with `select_related`, and everything behind
+a to-many relation is loaded with `prefetch_related`. Nested serializers are
+inspected recursively.
+
+Values that can't be derived from model relations (e.g. counters computed by model
+properties) should be annotated in serializer's `setup_eager_loading(queryset)`
+static method."""
+
+from dataclasses import dataclass, field
+from functools import cache
+from typing import Any
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Model, QuerySet
+from django.db.models.constants import LOOKUP_SEP
+from rest_framework.relations import RelatedField
+from rest_framework.serializers import BaseSerializer, ListSerializer
+
+
+@dataclass
+class RelatedLookups:
+    select_related: set[str] = field(default_factory=set)
+    prefetch_related: set[str] = field(default_factory=set)
+
+
+def collect_related_lookups(
+    serializer: BaseSerializer[Any],
+    model: type[Model],
+    lookups: RelatedLookups,
+    prefix: str = "",
+    prefetch: bool = False,
+) -> None:
+    for serializer_field in serializer.fields.values():  # type: ignore[attr-defined]
+        if serializer_field.source == "*":
+            continue
+
+        path = prefix
+        related_model = model
+        field_prefetch = prefetch
+        source_attrs = serializer_field.source_attrs
+
+        for i, attr in enumerate(source_attrs):
+            try:
+                model_field = related_model._meta.get_field(attr)
+            except FieldDoesNotExist:
+                # property, method or annotation
+                break
+
+            if not model_field.is_relation or model_field.related_model is None:
+                # regular field or a generic foreign key
+                break
+
+            is_last = i == len(source_attrs) - 1
+            if is_last and isinstance(serializer_field, RelatedField) and serializer_field.use_pk_only_optimization():
+                # value is read from `<relation>_id` column
+                break
+
+            path = f"{path}{LOOKUP_SEP}{attr}" if path else attr
+            field_prefetch = field_prefetch or model_field.many_to_many or model_field.one_to_many
+            if field_prefetch:
+                lookups.prefetch_related.add(path)
+            else:
+                lookups.select_related.add(path)
+            related_model = model_field.related_model
+
+        else:
+            # the whole source is a relation: look into nested serializers
+            nested = serializer_field.child if isinstance(serializer_field, ListSerializer) else serializer_field
+            if isinstance(nested, BaseSerializer) and path:
+                collect_related_lookups(nested, related_model, lookups, prefix=path, prefetch=field_prefetch)
+
+
+@cache
+def get_related_lookups(serializer_class: type[BaseSerializer[Any]]) -> RelatedLookups:
+    serializer = serializer_class()
+    lookups = RelatedLookups()
+    collect_related_lookups(serializer, serializer.Meta.model, lookups)  # type: ignore[attr-defined]
+    return lookups
+
+
+def eager_load[M: Model](queryset: QuerySet[M], serializer_class: type[BaseSerializer[Any]]) -> QuerySet[M]:
+    """Load all relations used by the serializer, and apply its
+    `setup_eager_loading`, if defined."""
+    lookups = get_related_lookups(serializer_class)
+    if lookups.select_related:
+        queryset = queryset.select_related(*sorted(lookups.select_related))
+    if lookups.prefetch_related:
+        queryset = queryset.prefetch_related(*sorted(lookups.prefetch_related))
+
+    setup_eager_loading = getattr(serializer_class, "setup_eager_loading", None)
+    if setup_eager_loading is not None:
+        queryset = setup_eager_loading(queryset)
+
+    return queryset
@@ -1,8 +1,10 @@
 from typing import TypeVar
 
 from django.contrib.contenttypes.models import ContentType
+from django.db.models import QuerySet
 from rest_framework import serializers
 
+from src.api.models import ChangeFeedCursor, ChangeFeedEntry
 from src.emails.models import MAX_LENGTH, Attachment, EmailTemplate, ScheduledEmail
 from src.extrequests.models import SelfOrganisedSubmission
 from src.fiscal.models import Consortium, Partnership, PartnershipTier
@@ -17,6 +19,7 @@ from src.workshops.models import (
     Language,
     Lesson,
     Membership,
+    MembershipQuerySet,
     Organization,
     Person,
     Role,
@@ -29,6 +32,9 @@ from src.workshops.models import (
 
 _IN = TypeVar("_IN")  # Instance Type
 
+CHANGE_FEED_DEFAULT_LIMIT = 100
+CHANGE_FEED_MAX_LIMIT = 1000
+
 
 class AwardSerializer(serializers.ModelSerializer[Award]):
     person = serializers.SlugRelatedField[Person](read_only=True, slug_field="username")
@@ -225,9 +231,16 @@ class MembershipSerializer(serializers.ModelSerializer[Membership]):
             "inhouse_instructor_training_seats_remaining",
         )
 
+    @staticmethod
+    def setup_eager_loading(queryset: MembershipQuerySet) -> QuerySet[Membership]:
+        # counters are calculated from these annotations
+        return queryset.annotate_with_workshop_counts()
+
 
 class ConsortiumSerializer(serializers.ModelSerializer[Consortium]):
-    organizations = serializers.SlugRelatedField[Organization](many=True, read_only=True, slug_field="domain")
+    organizations = serializers.SlugRelatedField[Organization](
+        many=True, read_only=True, slug_field="domain", source="organisations"
+    )
 
     class Meta:
         model = Consortium
@@ -474,3 +487,35 @@ class SelfOrganisedSubmissionSerializer(serializers.ModelSerializer[SelfOrganise
             "country",
             "language",
         )
+
+
+class ChangeFeedQuerySerializer(serializers.Serializer[_IN]):
+    since = serializers.CharField(required=False)
+    limit = serializers.IntegerField(min_value=1, max_value=CHANGE_FEED_MAX_LIMIT, default=CHANGE_FEED_DEFAULT_LIMIT)
+
+    def validate_since(self, value: str) -> ChangeFeedCursor:
+        try:
+            return ChangeFeedCursor.parse(value)
+        except ValueError as exc:
+            raise serializers.ValidationError("Invalid cursor.") from exc
+
+
+class ChangeFeedEntrySerializer(serializers.ModelSerializer[ChangeFeedEntry]):
+    cursor = serializers.CharField(read_only=True)
+    model = serializers.SerializerMethodField()
+    pk = serializers.CharField(read_only=True, source="object_pk")
+
+    class Meta:
+        model = ChangeFeedEntry
+        fields = (
+            "cursor",
+            "model",
+            "pk",
+            "action",
+            "created_at",
+        )
+
+    def get_model(self, obj: ChangeFeedEntry) -> str:
+        # content types are cached, no need to join them
+        content_type = ContentType.objects.get_for_id(obj.content_type_id)
+        return f"{content_type.app_label}.{content_type.model}"
@@ -0,0 +1,186 @@
+import threading
+from typing import Any
+
+from django.db import connection, transaction
+from django.test import TransactionTestCase
+from django.urls import reverse
+
+from src.api.models import ChangeFeedCursor, ChangeFeedEntry
+from src.workshops.models import Organization, Person
+from src.workshops.tests.base import SuperuserMixin
+
+
+# Entries written in a transaction that's still running are not visible in the feed,
+# so these tests can't run inside `TestCase` transaction.
+class TestChangeFeed(SuperuserMixin, TransactionTestCase):
+    def setUp(self) -> None:
+        self._setUpSuperuser()
+        self.client.force_login(self.admin)
+        self.since = str(ChangeFeedEntry.objects.order_by("transaction_id", "id").last().cursor)  # type: ignore
+        self.url = reverse("api-v2:changes")
+
+    def read_feed(self, **params: Any) -> Any:
+        response = self.client.get(self.url, {"since": self.since} | params, headers={"accept": "application/json"})
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_actions(self) -> None:
+        # Arrange
+        person = Person.objects.create(personal="Harry", family="Potter", email="harry@potter.com", username="harry")
+        person.personal = "Harold"
+        person.save()
+        person_pk = person.pk
+        person.delete()
+
+        # Act
+        feed = self.read_feed()
+
+        # Assert
+        self.assertEqual(
+            [(entry["model"], entry["pk"], entry["action"]) for entry in feed["results"]],
+            [
+                ("workshops.person", str(person_pk), "created"),
+                ("workshops.person", str(person_pk), "updated"),
+                ("workshops.person", str(person_pk), "deleted"),
+            ],
+        )
+        self.assertEqual(feed["cursor"], feed["results"][-1]["cursor"])
+        self.assertFalse(feed["has_more"])
+
+    def test_untracked_models_not_recorded(self) -> None:
+        # Arrange
+        ChangeFeedEntry.objects.all().delete()
+
+        # Act
+        self.admin.groups.create(name="test group")
+
+        # Assert
+        self.assertFalse(ChangeFeedEntry.objects.exists())
+
+    def test_rolled_back_changes_not_recorded(self) -> None:
+        # Arrange
+        with self.assertRaises(ValueError), transaction.atomic():
+            Organization.objects.create(domain="example.org", fullname="Example")
+            raise ValueError()
+
+        # Act
+        feed = self.read_feed()
+
+        # Assert
+        self.assertEqual(feed["results"], [])
+        self.assertEqual(feed["cursor"], self.since)
+
+    def test_batches_in_order(self) -> None:
+        # Arrange
+        organizations = [
+            Organization.objects.create(domain=f"example{i}.org", fullname=f"Example {i}") for i in range(5)
+        ]
+
+        # Act
+        batches = []
+        feed = {"cursor": self.since, "has_more": True}
+        while feed["has_more"]:
+            feed = self.read_feed(since=feed["cursor"], limit=2)
+            batches.append([entry["pk"] for entry in feed["results"]])
+
+        # Assert
+        self.assertEqual(
+            batches,
+            [
+                [str(organizations[0].pk), str(organizations[1].pk)],
+                [str(organizations[2].pk), str(organizations[3].pk)],
+                [str(organizations[4].pk)],
+            ],
+        )
+
+    def test_caught_up(self) -> None:
+        # Arrange
+        Organization.objects.create(domain="example.org", fullname="Example")
+        cursor = self.read_feed()["cursor"]
+
+        # Act
+        feed = self.read_feed(since=cursor)
+
+        # Assert
+        self.assertEqual(feed, {"cursor": cursor, "has_more": False, "results": []})
+
+    def test_invalid_query(self) -> None:
+        for params in [{"since": "abc"}, {"since": "1.2.3"}, {"since": "-1.5"}, {"limit": 0}, {"limit": 1001}]:
+            with self.subTest(params):
+                # Act
+                response = self.client.get(self.url, params, headers={"accept": "application/json"})
+
+                # Assert
+                self.assertEqual(response.status_code, 400)
+
+    def test_authentication_required(self) -> None:
+        # Arrange
+        self.client.logout()
+
+        # Act
+        response = self.client.get(self.url, headers={"accept": "application/json"})
+
+        # Assert
+        self.assertIn(response.status_code, (401, 403))
+
+
+class TestChangeFeedConcurrentWriters(TransactionTestCase):
+    def test_no_gaps(self) -> None:
+        """Entry of a transaction that commits after a newer transaction must not be
+        skipped by a reader that has already seen the newer one."""
+        # Arrange
+        written = threading.Event()
+        release = threading.Event()
+        slow_writer_result: dict[str, Person] = {}
+
+        def slow_writer() -> None:
+            try:
+                with transaction.atomic():
+                    slow_writer_result["person"] = Person.objects.create(
+                        personal="Slow", family="Writer", email="slow@example.org", username="slow"
+                    )
+                    written.set()
+                    release.wait(timeout=10)
+            finally:
+                connection.close()
+
+        thread = threading.Thread(target=slow_writer)
+        thread.start()
+        self.assertTrue(written.wait(timeout=10))
+        fast = Person.objects.create(personal="Fast", family="Writer", email="fast@example.org", username="fast")
+
+        # Act
+        entries_while_running = list(ChangeFeedEntry.objects.visible().after(None))
+        release.set()
+        thread.join()
+        entries_after_commit = list(ChangeFeedEntry.objects.visible().after(None))
+
+        # Assert
+        self.assertEqual(entries_while_running, [])
+        self.assertEqual(
+            [entry.object_pk for entry in entries_after_commit],
+            [str(slow_writer_result["person"].pk), str(fast.pk)],
+        )
+
+
+class TestChangeFeedCursor(TransactionTestCase):
+    def test_parse(self) -> None:
+        # Act
+        cursor = ChangeFeedCursor.parse("123.45")
+
+        # Assert
+        self.assertEqual(cursor, ChangeFeedCursor(transaction_id=123, entry_id=45))
+        self.assertEqual(str(cursor), "123.45")
+
+    def test_after(self) -> None:
+        # Arrange
+        organizations = [
+            Organization.objects.create(domain=f"example{i}.org", fullname=f"Example {i}") for i in range(3)
+        ]
+        first = ChangeFeedEntry.objects.get(object_pk=str(organizations[0].pk))
+
+        # Act
+        entries = ChangeFeedEntry.objects.visible().after(first.cursor)
+
+        # Assert
+        self.assertEqual([entry.object_pk for entry in entries], [str(org.pk) for org in organizations[1:]])
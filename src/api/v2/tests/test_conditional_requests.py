@@ -0,0 +1,212 @@
+from datetime import UTC, datetime
+from typing import Any
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils.http import http_date
+
+from src.emails.models import Attachment, ScheduledEmail
+from src.workshops.models import Event, Organization, Person
+from src.workshops.tests.base import SuperuserMixin
+
+
+class TestConditionalRequests(SuperuserMixin, TestCase):
+    def setUp(self) -> None:
+        self._setUpSuperuser()
+        self.client.force_login(self.admin)
+        self.headers = {"accept": "application/json"}
+
+        self.harry = Person.objects.create(
+            personal="Harry",
+            family="Potter",
+            email="harry@potter.com",
+            username="potter_harry",
+        )
+        self.email = ScheduledEmail.objects.create(
+            scheduled_at=datetime(2030, 1, 1, tzinfo=UTC),
+            to_header=["harry@potter.com"],
+            from_header="workshops@carpentries.org",
+            cc_header=[],
+            bcc_header=[],
+            subject="Test",
+            body="Test",
+        )
+        self.attachment = Attachment.objects.create(email=self.email, filename="file.pdf", s3_path="path/file.pdf")
+
+    def get(self, url: str, **headers: str) -> Any:
+        return self.client.get(url, headers=self.headers | headers)
+
+    def test_detail__not_modified(self) -> None:
+        # Arrange
+        url = reverse("api-v2:person-detail", args=[self.harry.pk])
+        etag = self.get(url)["ETag"]
+
+        # Act
+        response = self.get(url, if_none_match=etag)
+
+        # Assert
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+        self.assertIn("no-cache", response["Cache-Control"])
+        self.assertIn("private", response["Cache-Control"])
+
+    def test_detail__not_modified_skips_serialization(self) -> None:
+        # Arrange
+        url = reverse("api-v2:scheduledemail-detail", args=[self.email.pk])
+        etag = self.get(url)["ETag"]
+
+        # Act
+        with CaptureQueriesContext(connection) as full_queries:
+            self.get(url)
+        with CaptureQueriesContext(connection) as conditional_queries:
+            response = self.get(url, if_none_match=etag)
+
+        # Assert
+        self.assertEqual(response.status_code, 304)
+        # validator query replaces fetching the email and prefetching attachments
+        self.assertEqual(len(conditional_queries), len(full_queries) - 1)
+
+    def test_detail__last_modified(self) -> None:
+        # Arrange
+        url = reverse("api-v2:person-detail", args=[self.harry.pk])
+
+        # Act
+        response = self.get(url)
+        not_modified = self.get(url, if_modified_since=response["Last-Modified"])
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Last-Modified"], http_date(self.harry.last_updated_at.timestamp()))
+        self.assertEqual(not_modified.status_code, 304)
+
+    def test_detail__invalidated_after_update(self) -> None:
+        # Arrange
+        url = reverse("api-v2:person-detail", args=[self.harry.pk])
+        etag = self.get(url)["ETag"]
+        self.harry.personal = "Harold"
+        self.harry.save()
+
+        # Act
+        response = self.get(url, if_none_match=etag)
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(response.json()["personal"], "Harold")
+
+    def test_detail__not_found(self) -> None:
+        # Arrange
+        url = reverse("api-v2:person-detail", args=[self.harry.pk + 1000])
+
+        # Act
+        response = self.get(url)
+
+        # Assert
+        self.assertEqual(response.status_code, 404)
+        self.assertFalse(response.has_header("ETag"))
+
+    def test_list__not_modified(self) -> None:
+        # Arrange
+        url = reverse("api-v2:person-list")
+        etag = self.get(url)["ETag"]
+
+        # Act
+        response = self.get(url, if_none_match=etag)
+
+        # Assert
+        self.assertEqual(response.status_code, 304)
+        self.assertFalse(response.has_header("Last-Modified"))
+
+    def test_list__validator_depends_on_query_params(self) -> None:
+        # Arrange
+        url = reverse("api-v2:person-list")
+        etag = self.get(url)["ETag"]
+
+        # Act
+        response = self.get(f"{url}?page_size=1", if_none_match=etag)
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_list__invalidated_after_update(self) -> None:
+        # Arrange
+        url = reverse("api-v2:person-list")
+        etag = self.get(url)["ETag"]
+        self.harry.personal = "Harold"
+        self.harry.save()
+
+        # Act
+        response = self.get(url, if_none_match=etag)
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_list__invalidated_after_delete(self) -> None:
+        # Arrange
+        url = reverse("api-v2:person-list")
+        etag = self.get(url)["ETag"]
+        self.harry.delete()
+
+        # Act
+        response = self.get(url, if_none_match=etag)
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_list__invalidated_after_related_update(self) -> None:
+        # Arrange
+        url = reverse("api-v2:scheduledemail-list")
+        etag = self.get(url)["ETag"]
+        self.attachment.presigned_url = "https://example.org/file.pdf"
+        self.attachment.save()
+
+        # Act
+        response = self.get(url, if_none_match=etag)
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_content_etag__not_modified(self) -> None:
+        """Models without `last_updated_at` get an ETag computed from the response."""
+        # Arrange
+        host = Organization.objects.create(domain="example.org", fullname="Example")
+        event = Event.objects.create(slug="2030-01-01-test", host=host)
+        url = reverse("api-v2:event-detail", args=[event.pk])
+        etag = self.get(url)["ETag"]
+
+        # Act
+        response = self.get(url, if_none_match=etag)
+        event.venue = "Hogwarts"
+        event.save()
+        response_after_update = self.get(url, if_none_match=etag)
+
+        # Assert
+        self.assertEqual(response.status_code, 304)
+        self.assertIn("no-cache", response["Cache-Control"])
+        self.assertEqual(response_after_update.status_code, 200)
+        self.assertNotEqual(response_after_update["ETag"], etag)
+
+    def test_content_etag__api_v1(self) -> None:
+        # Arrange
+        url = reverse("api-v1:person-detail", args=[self.harry.pk])
+        etag = self.get(url)["ETag"]
+
+        # Act
+        response = self.get(url, if_none_match=etag)
+
+        # Assert
+        self.assertEqual(response.status_code, 304)
+
+    def test_actions_not_conditional(self) -> None:
+        # Act
+        response = self.get(reverse("api-v2:scheduledemail-scheduled-to-run"))
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.has_header("ETag"))
@@ -0,0 +1,193 @@
+from datetime import date, timedelta
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from src.api.v2.eager_loading import get_related_lookups
+from src.api.v2.serializers import (
+    EventSerializer,
+    InstructorRecruitmentSignupSerializer,
+    ScheduledEmailSerializer,
+)
+from src.api.v2.urls import router
+from src.emails.models import Attachment, ScheduledEmail
+from src.extrequests.models import SelfOrganisedSubmission
+from src.fiscal.models import Consortium, Partnership, PartnershipTier
+from src.offering.models import Account
+from src.recruitment.models import InstructorRecruitment, InstructorRecruitmentSignup
+from src.workshops.models import (
+    Event,
+    Membership,
+    Role,
+    Task,
+    TrainingProgress,
+    TrainingRequirement,
+)
+from src.workshops.tests.base import TestBase
+
+# Number of queries a list endpoint may run, regardless of page size. Includes
+# session, user and pagination count queries.
+QUERY_BUDGET = 12
+
+
+class TestEagerLoading(TestCase):
+    def test_related_lookups(self) -> None:
+        # Act
+        lookups = get_related_lookups(EventSerializer)
+
+        # Assert
+        self.assertEqual(
+            lookups.select_related,
+            {"host", "sponsor", "membership", "administrator", "language", "assigned_to"},
+        )
+        self.assertEqual(lookups.prefetch_related, {"tags", "curricula", "lessons"})
+
+    def test_related_lookups__nested_source(self) -> None:
+        # Act
+        lookups = get_related_lookups(InstructorRecruitmentSignupSerializer)
+
+        # Assert
+        # `recruitment` is serialized as PK, but it's needed for `recruitment.event.slug`
+        self.assertEqual(lookups.select_related, {"recruitment", "recruitment__event", "person"})
+        self.assertEqual(lookups.prefetch_related, set())
+
+    def test_related_lookups__nested_serializer(self) -> None:
+        # Act
+        lookups = get_related_lookups(ScheduledEmailSerializer)
+
+        # Assert
+        self.assertEqual(lookups.select_related, {"template", "generic_relation_content_type"})
+        self.assertEqual(lookups.prefetch_related, {"attachments"})
+
+
+class TestListEndpointsQueryBudget(TestBase):
+    def setUp(self) -> None:
+        super().setUp()
+        self._setUpRoles()
+        self._setUpEvents()
+        self._setUpLanguages()
+        self._setUpSingleInstructorBadges()
+        self._setUpUsersAndLogin()
+
+        self.setUpMemberships()
+        self.setUpPartnerships()
+        self.setUpRecruitments()
+        self.setUpTrainingProgresses()
+        self.setUpSelfOrganisedSubmissions()
+        self.setUpScheduledEmails()
+
+    def setUpMemberships(self) -> None:
+        """Memberships with events and learner seats, so that their counters are
+        non-trivial."""
+        learner = Role.objects.get(name="learner")
+        instructor = Role.objects.get(name="instructor")
+        events = Event.objects.all()[:3]
+        for i, event in enumerate(events):
+            membership = Membership.objects.create(
+                name=f"Test Membership {i}",
+                variant="gold",
+                agreement_start=date(2024, 1, 1),
+                agreement_end=date(2024, 12, 31),
+                contribution_type="financial",
+            )
+            event.membership = membership
+            event.save()
+            Task.objects.create(event=event, person=self.hermione, role=instructor)
+            Task.objects.create(event=event, person=self.spiderman, role=learner, seat_membership=membership)
+            Task.objects.create(event=event, person=self.ironman, role=learner, seat_membership=membership)
+
+    def setUpPartnerships(self) -> None:
+        tier = PartnershipTier.objects.create(name="gold", credits=100)
+        for i in range(2):
+            consortium = Consortium.objects.create(name=f"Test Consortium {i}", description="")
+            consortium.organisations.set([self.org_alpha, self.org_beta])
+            account = Account.objects.create(
+                account_type=Account.AccountTypeChoices.CONSORTIUM,
+                generic_relation=consortium,
+            )
+            Partnership.objects.create(
+                name=f"Test Partnership {i}",
+                tier=tier,
+                credits=100,
+                account=account,
+                registration_code=f"test-partnership-{i}",
+                agreement_start=date(2024, 1, 1),
+                agreement_end=date(2024, 12, 31),
+                agreement_link="https://example.org/agreement",
+                public_status="public",
+                partner_consortium=consortium,
+            )
+
+    def setUpRecruitments(self) -> None:
+        for event in Event.objects.all()[:2]:
+            recruitment = InstructorRecruitment.objects.create(event=event, notes="Test notes")
+            InstructorRecruitmentSignup.objects.create(recruitment=recruitment, person=self.hermione)
+            InstructorRecruitmentSignup.objects.create(recruitment=recruitment, person=self.harry)
+
+    def setUpTrainingProgresses(self) -> None:
+        for trainee in [self.spiderman, self.ironman, self.blackwidow]:
+            TrainingProgress.objects.create(
+                trainee=trainee,
+                requirement=TrainingRequirement.objects.get(name="Training"),
+                state="p",
+                event=Event.objects.first(),
+            )
+
+    def setUpSelfOrganisedSubmissions(self) -> None:
+        for personal in ["Harry", "Hermione"]:
+            SelfOrganisedSubmission.objects.create(
+                state="p",
+                personal=personal,
+                family="Potter",
+                email=f"{personal.lower()}@hogwarts.edu",
+                institution_other_name="Hogwarts",
+                workshop_url="",
+                workshop_format="",
+                workshop_format_other="",
+                workshop_types_other_explain="",
+                language=self.english,
+            )
+
+    def setUpScheduledEmails(self) -> None:
+        for i in range(3):
+            email = ScheduledEmail.objects.create(
+                scheduled_at=timezone.now() + timedelta(hours=i),
+                to_header=["harry@potter.com"],
+                from_header="workshops@carpentries.org",
+                cc_header=[],
+                bcc_header=[],
+                subject="Test",
+                body="Test",
+            )
+            Attachment.objects.bulk_create(
+                [Attachment(email=email, filename=f"file{j}.pdf", s3_path=f"path/file{j}.pdf") for j in range(2)]
+            )
+
+    def count_queries(self, url: str) -> int:
+        headers = {"accept": "application/json"}
+        # warm-up request: fills in-process caches (e.g. feature flags, content types)
+        self.client.get(url, headers=headers)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, headers=headers)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertGreater(response.json()["count"], 1, "need more than 1 object to compare page sizes")
+        return len(queries.captured_queries)
+
+    def test_list_endpoints(self) -> None:
+        for prefix, _, basename in router.registry:
+            with self.subTest(prefix):
+                # Arrange
+                url = reverse(f"api-v2:{basename}-list")
+
+                # Act
+                single = self.count_queries(f"{url}?page_size=1")
+                many = self.count_queries(f"{url}?page_size=1000")
+
+                # Assert
+                self.assertEqual(single, many)
+                self.assertLessEqual(many, QUERY_BUDGET)
@@ -23,5 +23,6 @@ router.register("trainingrequirement", views.TrainingRequirementViewSet)
 
 
 urlpatterns = [
+    path("changes", views.ChangeFeedView.as_view(), name="changes"),
     path("", include(router.urls)),
 ]
@@ -1,5 +1,6 @@
 from typing import Any
 
+from django.db.models import Model, QuerySet
 from django.utils import timezone
 from knox.auth import TokenAuthentication
 from rest_framework import viewsets
@@ -9,12 +10,18 @@ from rest_framework.pagination import PageNumberPagination
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.request import Request
 from rest_framework.response import Response
+from rest_framework.views import APIView
 
+from src.api.conditional import ConditionalGetMixin
+from src.api.models import ChangeFeedCursor, ChangeFeedEntry
+from src.api.v2.eager_loading import eager_load
 from src.api.v2.permissions import ApiAccessPermission
 from src.api.v2.serializers import (
     AttachmentPresignedUrlPayloadSerializer,
     AttachmentSerializer,
     AwardSerializer,
+    ChangeFeedEntrySerializer,
+    ChangeFeedQuerySerializer,
     ConsortiumSerializer,
     EventSerializer,
     InstructorRecruitmentSignupSerializer,
@@ -46,6 +53,13 @@ from src.workshops.models import (
 )
 
 
+class EagerLoadingViewSet[M: Model](viewsets.ReadOnlyModelViewSet[M]):
+    """Load relations used by the serializer, see `src.api.v2.eager_loading`."""
+
+    def get_queryset(self) -> QuerySet[M]:
+        return eager_load(super().get_queryset(), self.get_serializer_class())
+
+
 class AuthenticatedRequest(Request):
     user: Person
 
@@ -56,7 +70,7 @@ class StandardResultsSetPagination(PageNumberPagination):
     max_page_size = 1000
 
 
-class AwardViewSet(viewsets.ReadOnlyModelViewSet[Award]):
+class AwardViewSet(ConditionalGetMixin[Award], EagerLoadingViewSet[Award]):
     authentication_classes = (
         TokenAuthentication,
         SessionAuthentication,
@@ -65,12 +79,12 @@ class AwardViewSet(viewsets.ReadOnlyModelViewSet[Award]):
         IsAuthenticated,
         ApiAccessPermission,
     )
-    queryset = Award.objects.select_related("person", "badge", "event", "awarded_by").order_by("pk").all()
+    queryset = Award.objects.order_by("pk").all()
     serializer_class = AwardSerializer
     pagination_class = StandardResultsSetPagination
 
 
-class OrganizationViewSet(viewsets.ReadOnlyModelViewSet[Organization]):
+class OrganizationViewSet(ConditionalGetMixin[Organization], EagerLoadingViewSet[Organization]):
     authentication_classes = (
         TokenAuthentication,
         SessionAuthentication,
@@ -79,12 +93,12 @@ class OrganizationViewSet(viewsets.ReadOnlyModelViewSet[Organization]):
         IsAuthenticated,
         ApiAccessPermission,
     )
-    queryset = Organization.objects.prefetch_related("affiliated_organizations").order_by("pk").all()
+    queryset = Organization.objects.order_by("pk").all()
     serializer_class = OrganizationSerializer
     pagination_class = StandardResultsSetPagination
 
 
-class EventViewSet(viewsets.ReadOnlyModelViewSet[Event]):
+class EventViewSet(ConditionalGetMixin[Event], EagerLoadingViewSet[Event]):
     authentication_classes = (
         TokenAuthentication,
         SessionAuthentication,
@@ -93,17 +107,14 @@ class EventViewSet(viewsets.ReadOnlyModelViewSet[Event]):
         IsAuthenticated,
         ApiAccessPermission,
     )
-    queryset = (
-        Event.objects.select_related("host", "sponsor", "membership", "administrator", "language", "assigned_to")
-        .prefetch_related("tags", "curricula", "lessons")
-        .order_by("pk")
-        .all()
-    )
+    queryset = Event.objects.order_by("pk").all()
     serializer_class = EventSerializer
     pagination_class = StandardResultsSetPagination
 
 
-class InstructorRecruitmentSignupViewSet(viewsets.ReadOnlyModelViewSet[InstructorRecruitmentSignup]):
+class InstructorRecruitmentSignupViewSet(
+    ConditionalGetMixin[InstructorRecruitmentSignup], EagerLoadingViewSet[InstructorRecruitmentSignup]
+):
     authentication_classes = (
         TokenAuthentication,
         SessionAuthentication,
@@ -112,16 +123,12 @@ class InstructorRecruitmentSignupViewSet(viewsets.ReadOnlyModelViewSet[Instructo
         IsAuthenticated,
         ApiAccessPermission,
     )
-    queryset = (
-        InstructorRecruitmentSignup.objects.select_related("recruitment", "recruitment__event", "person")
-        .order_by("pk")
-        .all()
-    )
+    queryset = InstructorRecruitmentSignup.objects.order_by("pk").all()
     serializer_class = InstructorRecruitmentSignupSerializer
     pagination_class = StandardResultsSetPagination
 
 
-class MembershipViewSet(viewsets.ReadOnlyModelViewSet[Membership]):
+class MembershipViewSet(ConditionalGetMixin[Membership], EagerLoadingViewSet[Membership]):
     authentication_classes = (
         TokenAuthentication,
         SessionAuthentication,
@@ -130,12 +137,12 @@ class MembershipViewSet(viewsets.ReadOnlyModelViewSet[Membership]):
         IsAuthenticated,
         ApiAccessPermission,
     )
-    queryset = Membership.objects.prefetch_related("organizations", "persons").order_by("pk").all()
+    queryset = Membership.objects.order_by("pk").all()
     serializer_class = MembershipSerializer
     pagination_class = StandardResultsSetPagination
 
 
-class PersonViewSet(viewsets.ReadOnlyModelViewSet[Person]):
+class PersonViewSet(ConditionalGetMixin[Person], EagerLoadingViewSet[Person]):
     authentication_classes = (
         TokenAuthentication,
         SessionAuthentication,
@@ -144,12 +151,13 @@ class PersonViewSet(viewsets.ReadOnlyModelViewSet[Person]):
         IsAuthenticated,
         ApiAccessPermission,
     )
-    queryset = Person.objects.all()
+    queryset = Person.objects.order_by("pk").all()
     serializer_class = PersonSerializer
     pagination_class = StandardResultsSetPagination
+    last_modified_fields = ("last_updated_at",)
 
 
-class ConsortiumViewSet(viewsets.ReadOnlyModelViewSet[Consortium]):
+class ConsortiumViewSet(ConditionalGetMixin[Consortium], EagerLoadingViewSet[Consortium]):
     authentication_classes = (
         TokenAuthentication,
         SessionAuthentication,
@@ -158,12 +166,12 @@ class ConsortiumViewSet(viewsets.ReadOnlyModelViewSet[Consortium]):
         IsAuthenticated,
         ApiAccessPermission,
     )
-    queryset = Consortium.objects.prefetch_related("organisations").order_by("pk").all()
+    queryset = Consortium.objects.order_by("pk").all()
     serializer_class = ConsortiumSerializer
     pagination_class = StandardResultsSetPagination
 
 
-class PartnershipViewSet(viewsets.ReadOnlyModelViewSet[Partnership]):
+class PartnershipViewSet(ConditionalGetMixin[Partnership], EagerLoadingViewSet[Partnership]):
     authentication_classes = (
         TokenAuthentication,
         SessionAuthentication,
@@ -172,18 +180,12 @@ class PartnershipViewSet(viewsets.ReadOnlyModelViewSet[Partnership]):
         IsAuthenticated,
         ApiAccessPermission,
     )
-    queryset = (
-        Partnership.objects.select_related(
-            "tier", "account", "rolled_to_partnership", "partner_consortium", "partner_organisation"
-        )
-        .order_by("pk")
-        .all()
-    )
+    queryset = Partnership.objects.order_by("pk").all()
     serializer_class = PartnershipSerializer
     pagination_class = StandardResultsSetPagination
 
 
-class ScheduledEmailViewSet(viewsets.ReadOnlyModelViewSet[ScheduledEmail]):
+class ScheduledEmailViewSet(ConditionalGetMixin[ScheduledEmail], EagerLoadingViewSet[ScheduledEmail]):
     authentication_classes = (
         TokenAuthentication,
         SessionAuthentication,
@@ -192,19 +194,22 @@ class ScheduledEmailViewSet(viewsets.ReadOnlyModelViewSet[ScheduledEmail]):
         IsAuthenticated,
         ApiAccessPermission,
     )
-    queryset = (
-        ScheduledEmail.objects.select_related("template", "generic_relation_content_type").order_by("created_at").all()
-    )
+    queryset = ScheduledEmail.objects.order_by("created_at").all()
     serializer_class = ScheduledEmailSerializer
     pagination_class = StandardResultsSetPagination
+    last_modified_fields = ("last_updated_at", "attachments__last_updated_at")
 
     @action(detail=False)
     def scheduled_to_run(self, request: Request) -> Response:
         now = timezone.now()
-        scheduled_emails = ScheduledEmail.objects.filter(
-            state__in=[ScheduledEmailStatus.SCHEDULED, ScheduledEmailStatus.FAILED],
-            scheduled_at__lte=now,
-        ).order_by("-created_at")
+        scheduled_emails = (
+            self.get_queryset()
+            .filter(
+                state__in=[ScheduledEmailStatus.SCHEDULED, ScheduledEmailStatus.FAILED],
+                scheduled_at__lte=now,
+            )
+            .order_by("-created_at")
+        )
 
         page = self.paginate_queryset(scheduled_emails)
         if page is not None:
@@ -254,7 +259,7 @@ class ScheduledEmailViewSet(viewsets.ReadOnlyModelViewSet[ScheduledEmail]):
         return Response(self.get_serializer(locked_email).data)
 
 
-class AttachmentViewSet(viewsets.ReadOnlyModelViewSet[Attachment]):
+class AttachmentViewSet(ConditionalGetMixin[Attachment], EagerLoadingViewSet[Attachment]):
     authentication_classes = (
         TokenAuthentication,
         SessionAuthentication,
@@ -266,6 +271,7 @@ class AttachmentViewSet(viewsets.ReadOnlyModelViewSet[Attachment]):
     queryset = Attachment.objects.order_by("created_at").all()
     serializer_class = AttachmentSerializer
     pagination_class = StandardResultsSetPagination
+    last_modified_fields = ("last_updated_at",)
 
     @action(detail=True, methods=["post"])
     def generate_presigned_url(self, request: Request, pk: str | None = None) -> Response:
@@ -282,7 +288,7 @@ class AttachmentViewSet(viewsets.ReadOnlyModelViewSet[Attachment]):
         return Response(self.get_serializer(attachment_with_presigned_url).data)
 
 
-class TaskViewSet(viewsets.ReadOnlyModelViewSet[Task]):
+class TaskViewSet(ConditionalGetMixin[Task], EagerLoadingViewSet[Task]):
     authentication_classes = (
         TokenAuthentication,
         SessionAuthentication,
@@ -291,12 +297,12 @@ class TaskViewSet(viewsets.ReadOnlyModelViewSet[Task]):
         IsAuthenticated,
         ApiAccessPermission,
     )
-    queryset = Task.objects.select_related("person", "event", "role", "seat_membership").order_by("pk").all()
+    queryset = Task.objects.order_by("pk").all()
     serializer_class = TaskSerializer
     pagination_class = StandardResultsSetPagination
 
 
-class TrainingProgressViewSet(viewsets.ReadOnlyModelViewSet[TrainingProgress]):
+class TrainingProgressViewSet(ConditionalGetMixin[TrainingProgress], EagerLoadingViewSet[TrainingProgress]):
     authentication_classes = (
         TokenAuthentication,
         SessionAuthentication,
@@ -305,16 +311,12 @@ class TrainingProgressViewSet(viewsets.ReadOnlyModelViewSet[TrainingProgress]):
         IsAuthenticated,
         ApiAccessPermission,
     )
-    queryset = (
-        TrainingProgress.objects.select_related("trainee", "requirement", "involvement_type", "event")
-        .order_by("pk")
-        .all()
-    )
+    queryset = TrainingProgress.objects.order_by("pk").all()
     serializer_class = TrainingProgressSerializer
     pagination_class = StandardResultsSetPagination
 
 
-class TrainingRequirementViewSet(viewsets.ReadOnlyModelViewSet[TrainingRequirement]):
+class TrainingRequirementViewSet(ConditionalGetMixin[TrainingRequirement], EagerLoadingViewSet[TrainingRequirement]):
     authentication_classes = (
         TokenAuthentication,
         SessionAuthentication,
@@ -328,7 +330,9 @@ class TrainingRequirementViewSet(viewsets.ReadOnlyModelViewSet[TrainingRequireme
     pagination_class = StandardResultsSetPagination
 
 
-class SelfOrganisedSubmissionViewSet(viewsets.ReadOnlyModelViewSet[SelfOrganisedSubmission]):
+class SelfOrganisedSubmissionViewSet(
+    ConditionalGetMixin[SelfOrganisedSubmission], EagerLoadingViewSet[SelfOrganisedSubmission]
+):
     authentication_classes = (
         TokenAuthentication,
         SessionAuthentication,
@@ -341,3 +345,39 @@ class SelfOrganisedSubmissionViewSet(viewsets.ReadOnlyModelViewSet[SelfOrganised
     queryset = SelfOrganisedSubmission.objects.order_by("pk").all()
     serializer_class = SelfOrganisedSubmissionSerializer
     pagination_class = StandardResultsSetPagination
+
+
+class ChangeFeedView(APIView):
+    """Changes of API resources in commit order, see `src.api.change_feed`.
+
+    Pass `cursor` from the response as `since` to get the next batch; when
+    `has_more` is false, the consumer caught up and should poll again later."""
+
+    authentication_classes = (
+        TokenAuthentication,
+        SessionAuthentication,
+    )
+    permission_classes = (
+        IsAuthenticated,
+        ApiAccessPermission,
+    )
+
+    def get(self, request: Request) -> Response:
+        query = ChangeFeedQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        since: ChangeFeedCursor | None = query.validated_data.get("since")
+        limit: int = query.validated_data["limit"]
+
+        # one extra entry tells if there are more
+        entries = list(ChangeFeedEntry.objects.visible().after(since)[: limit + 1])
+        has_more = len(entries) > limit
+        entries = entries[:limit]
+        cursor = entries[-1].cursor if entries else since
+
+        return Response(
+            {
+                "cursor": str(cursor) if cursor else None,
+                "has_more": has_more,
+                "results": ChangeFeedEntrySerializer(entries, many=True).data,
+            }
+        )
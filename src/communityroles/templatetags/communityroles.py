@@ -1,20 +1,52 @@
+from collections.abc import Iterable
+from typing import Any
+
 from django import template
 
 from src.communityroles.models import CommunityRole
 from src.workshops.models import Person
 from src.workshops.utils.dates import human_daterange
+from src.workshops.utils.loaders import BatchLoader
 
 register = template.Library()
 
 
-@register.simple_tag
-def get_community_role(person: Person, role_name: str) -> CommunityRole | None:
-    try:
-        return CommunityRole.objects.get(person=person, config__name=role_name)
-    except CommunityRole.DoesNotExist:
+class CommunityRoleLoader(BatchLoader[tuple[int, str], CommunityRole | None]):
+    """Community roles by (person ID, role name)."""
+
+    def batch_load(self, keys: set[tuple[int, str]]) -> dict[tuple[int, str], CommunityRole | None]:
+        person_ids = {person_id for person_id, _ in keys}
+        role_names = {role_name for _, role_name in keys}
+        roles = (
+            CommunityRole.objects.filter(person_id__in=person_ids, config__name__in=role_names)
+            .select_related("config")
+            .order_by("pk")
+        )
+        # in case of multiple roles with the same config, the newest one is used
+        return {
+            (role.person_id, role.config.name): role for role in roles if (role.person_id, role.config.name) in keys
+        }
+
+    def missing(self, key: tuple[int, str]) -> CommunityRole | None:
         return None
 
 
+@register.simple_tag(takes_context=True)
+def prime_community_roles(context: dict[str, Any], persons: Iterable[Person], role_name: str) -> str:
+    """Load community roles of all persons with a single query on the first
+    `get_community_role` call for any of them."""
+    loader = CommunityRoleLoader.for_request(context.get("request"))
+    loader.prime((person.pk, role_name) for person in persons)
+    return ""
+
+
+@register.simple_tag(takes_context=True)
+def get_community_role(context: dict[str, Any], person: Person, role_name: str) -> CommunityRole | None:
+    """Community role of the person, or None. If the person has multiple roles
+    with the same config, the newest one is returned."""
+    return CommunityRoleLoader.for_request(context.get("request")).load((person.pk, role_name))
+
+
 @register.simple_tag
 def community_role_human_dates(community_role: CommunityRole) -> str:
     result = human_daterange(community_role.start, community_role.end, no_date_right="present")
@@ -1,6 +1,7 @@
 from datetime import date
 
-from django.test import TestCase
+from django.template import Context, Template
+from django.test import RequestFactory, TestCase
 
 from src.communityroles.models import CommunityRole, CommunityRoleConfig
 from src.communityroles.templatetags.communityroles import (
@@ -25,7 +26,7 @@ class TestCommunityRolesTemplateTag(TestCase):
         )
         role_orig = CommunityRole.objects.create(config=config, person=person)
         # Act
-        role_found = get_community_role(person, role_name)
+        role_found = get_community_role({}, person, role_name)
         # Assert
         self.assertEqual(role_orig, role_found)
 
@@ -43,7 +44,7 @@ class TestCommunityRolesTemplateTag(TestCase):
         )
         CommunityRole.objects.create(config=config, person=person)
         # Act
-        role_found = get_community_role(person, "fake_role")
+        role_found = get_community_role({}, person, "fake_role")
         # Assert
         self.assertEqual(role_found, None)
 
@@ -67,10 +68,79 @@ class TestCommunityRolesTemplateTag(TestCase):
         )
         CommunityRole.objects.create(config=config, person=person)
         # Act
-        role_found = get_community_role(fake_person, role_name)
+        role_found = get_community_role({}, fake_person, role_name)
         # Assert
         self.assertEqual(role_found, None)
 
+    def test_get_community_role__primed_list(self) -> None:
+        # Arrange
+        config = CommunityRoleConfig.objects.create(
+            name="instructor",
+            display_name="Instructor",
+            link_to_award=False,
+            link_to_membership=False,
+            link_to_partnership=False,
+            additional_url=False,
+        )
+        persons = Person.objects.bulk_create(
+            [
+                Person(personal="Test", family=f"User {i}", email=f"test{i}@user.com", username=f"test_user_{i}")
+                for i in range(100)
+            ]
+        )
+        CommunityRole.objects.bulk_create([CommunityRole(config=config, person=person) for person in persons[::2]])
+        template = Template(
+            "{% load communityroles %}"
+            '{% prime_community_roles persons role_name="instructor" %}'
+            "{% for person in persons %}"
+            '{% get_community_role person role_name="instructor" as role %}{% if role %}Y{% else %}N{% endif %}'
+            "{% endfor %}"
+        )
+        context = Context({"persons": persons, "request": RequestFactory().get("/")})
+
+        # Act
+        with self.assertNumQueries(1):
+            result = template.render(context)
+            # second lookup in the same request is served from memory
+            template.render(context)
+
+        # Assert
+        self.assertEqual(result, "YN" * 50)
+
+    def test_get_community_role__duplicated_roles(self) -> None:
+        # Arrange
+        person = Person.objects.create(personal="Test", family="User", email="test@user.com")
+        config = CommunityRoleConfig.objects.create(
+            name="instructor",
+            display_name="Instructor",
+            link_to_award=False,
+            link_to_membership=False,
+            link_to_partnership=False,
+            additional_url=False,
+        )
+        CommunityRole.objects.create(config=config, person=person)
+        newest_role = CommunityRole.objects.create(config=config, person=person)
+
+        # Act
+        role_found = get_community_role({}, person, "instructor")
+
+        # Assert
+        self.assertEqual(role_found, newest_role)
+
+    def test_get_community_role__same_request_memoised(self) -> None:
+        # Arrange
+        person = Person.objects.create(personal="Test", family="User", email="test@user.com")
+        context = {"request": RequestFactory().get("/")}
+
+        # Act
+        with self.assertNumQueries(1):
+            role1 = get_community_role(context, person, "instructor")
+            role2 = get_community_role(context, person, "instructor")
+
+        # Assert
+        self.assertIsNone(role1)
+        self.assertIsNone(role2)
+
 
 class TestCommunityRoleHumanDatesTemplateTag(TestCase):
     def test_community_role_human_dates(self) -> None:
@@ -75,6 +75,7 @@ class BaseTermConsentsForm(WidgetOverrideMixin, forms.ModelForm[Consent]):
 
     def save(self, *args: Any, **kwargs: Any) -> None:  # type: ignore
         person = self.cleaned_data["person"]
+        old_consents: list[Consent] = []
         new_consents: list[Consent] = []
         for term in self.terms:
             option_id = self.cleaned_data.get(term.slug)
@@ -83,9 +84,9 @@ class BaseTermConsentsForm(WidgetOverrideMixin, forms.ModelForm[Consent]):
             if not option_id or not has_changed:
                 continue
             if consent:
-                consent.archive()
+                old_consents.append(consent)
             new_consents.append(Consent(person=person, term_option_id=option_id, term_id=term.pk))
-        Consent.objects.bulk_create(new_consents)
+        Consent.archive_and_create(old_consents, new_consents)
 
     def get_terms(self) -> Iterable[Term]:
         return Term.objects.all().prefetch_active_options()
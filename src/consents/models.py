@@ -272,6 +272,19 @@ class Consent(BaseConsent):
         consents.update(archived_at=timezone.now())
         cls.objects.bulk_create(new_consents)
 
+    @classmethod
+    def archive_and_create(cls, old_consents: Iterable[Consent], new_consents: Iterable[Consent]) -> list[Consent]:
+        """Archive `old_consents` and create `new_consents` with two queries."""
+        old_consents = list(old_consents)
+        now = timezone.now()
+        if old_consents:
+            cls.objects.filter(pk__in=[consent.pk for consent in old_consents]).update(
+                archived_at=now, last_updated_at=now
+            )
+        for consent in old_consents:
+            consent.archived_at = consent.last_updated_at = now
+        return cls.objects.bulk_create(new_consents)
+
     @staticmethod
     def reconsent(consent: Consent, term_option: TermOption) -> Consent:
         consent.archive()
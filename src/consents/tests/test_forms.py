@@ -2,7 +2,7 @@ from django.db.models.fields import BLANK_CHOICE_DASH
 from django.utils import timezone
 
 from src.consents.forms import ActiveTermConsentsForm, RequiredConsentsForm
-from src.consents.models import Term, TermOption, TermOptionChoices
+from src.consents.models import Consent, Term, TermOption, TermOptionChoices
 from src.consents.tests.base import ConsentTestBase
 from src.workshops.models import Person
 
@@ -63,6 +63,43 @@ class TestActiveTermConsentsForm(ConsentTestBase):
         form = ActiveTermConsentsForm(initial={"person": self.person})
         self.assertNotIn(term1.slug, form.fields)
 
+    def test_save(self) -> None:
+        # Arrange
+        terms = list(Term.objects.active().prefetch_active_options())
+        old_consents = list(Consent.objects.filter(person=self.person).active())
+        data = {"person": self.person.pk} | {term.slug: term.options[0].pk for term in terms}  # type: ignore
+        form = ActiveTermConsentsForm(data, initial={"person": self.person})
+        self.assertTrue(form.is_valid())
+
+        # Act
+        # all old consents are archived with one query and new ones created with another
+        with self.assertNumQueries(2):
+            form.save()
+
+        # Assert
+        self.assertFalse(Consent.objects.filter(pk__in=[consent.pk for consent in old_consents]).active().exists())
+        active_consents = Consent.objects.filter(person=self.person).active()
+        self.assertEqual(
+            {(consent.term_id, consent.term_option_id) for consent in active_consents},
+            {(term.pk, term.options[0].pk) for term in terms},  # type: ignore
+        )
+
+    def test_save__unchanged_consents_are_kept(self) -> None:
+        # Arrange
+        term = Term.objects.active().prefetch_active_options().get(slug="optional-test-term")
+        consent = self.reconsent(person=self.person, term=term, term_option=term.options[0])  # type: ignore
+        form = ActiveTermConsentsForm(
+            {"person": self.person.pk, term.slug: term.options[0].pk},  # type: ignore
+            initial={"person": self.person},
+        )
+
+        # Act
+        form.is_valid()
+        form.save()
+
+        # Assert
+        self.assertEqual(Consent.objects.filter(person=self.person, term=term).active().get(), consent)
+
 
 class TestRequiredConsentsForm(ConsentTestBase):
     def setUp(self) -> None:
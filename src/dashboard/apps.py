@@ -3,3 +3,6 @@ from django.apps import AppConfig
 
 class DashboardConfig(AppConfig):
     name = "src.dashboard"
+
+    def ready(self) -> None:
+        from src.dashboard import receivers  # noqa
@@ -0,0 +1,91 @@
+"""Event panels of the admin dashboard, cached per assignee.
+
+All three event panels (current events, unpublished events and the number of
+events with changed metadata) are read with a single query and cached in the
+shared cache for each assignee. Receivers in `src.dashboard.receivers`
+invalidate panels of affected assignees when events, their tasks or tags
+change; changes made with bulk operations (e.g. `QuerySet.update()`) are picked
+up when cached panels expire."""
+
+import datetime
+from dataclasses import dataclass
+
+from django.contrib.postgres.expressions import ArraySubquery
+from django.core.cache import cache
+from django.db.models import BooleanField, ExpressionWrapper, F, OuterRef, Q
+
+from src.workshops.models import Event, Person, Tag, TagQuerySet, Task
+from src.workshops.utils.querysets import SubqueryCount
+
+DASHBOARD_PANELS_CACHE_TIMEOUT = 15 * 60
+# Incremented to invalidate panels of all assignees, e.g. after tags change.
+DASHBOARD_PANELS_VERSION_KEY = "dashboard_panels:version"
+
+
+@dataclass
+class DashboardPanels:
+    current_events: list[Event]
+    unpublished_events: list[Event]
+    updated_metadata: int
+    main_tags: list[Tag]
+
+
+def dashboard_panels_key(assigned_to_id: int | None, today: datetime.date) -> str:
+    version = cache.get_or_set(DASHBOARD_PANELS_VERSION_KEY, 1, timeout=None)
+    # panels depend on current date, e.g. ongoing events become past events
+    return f"dashboard_panels:{version}:{assigned_to_id or 'unassigned'}:{today.isoformat()}"
+
+
+def compute_dashboard_panels(assigned_to: Person | None, today: datetime.date) -> DashboardPanels:
+    unpublished = Event.objects.unpublished_conditional()
+    # same as `EventQuerySet.current_events()`: ongoing or upcoming published events
+    current = ~unpublished & (Q(start__gt=today) | Q(start__lte=today, end__gte=today))
+
+    events = list(
+        Event.objects.active()
+        .filter(assigned_to=assigned_to)
+        .filter(current | unpublished | Q(metadata_changed=True))
+        .select_related("host")
+        .annotate(
+            is_current=ExpressionWrapper(current, output_field=BooleanField()),
+            is_unpublished=ExpressionWrapper(unpublished, output_field=BooleanField()),
+            num_instructors=SubqueryCount(Task.objects.filter(event=OuterRef("pk"), role__name="instructor")),
+            main_tag_ids=ArraySubquery(
+                Event.tags.through.objects.filter(  # type: ignore[attr-defined]
+                    event_id=OuterRef("pk"), tag__name__in=TagQuerySet.MAIN_TAG_NAMES
+                ).values("tag_id")
+            ),
+        )
+        .order_by(F("start").desc(nulls_first=True), "slug", "pk")
+    )
+
+    return DashboardPanels(
+        # current events are listed from the earliest
+        current_events=[event for event in reversed(events) if event.is_current],
+        unpublished_events=[event for event in events if event.is_unpublished],
+        updated_metadata=sum(1 for event in events if event.metadata_changed),
+        main_tags=list(Tag.objects.main_tags()),
+    )
+
+
+def get_dashboard_panels(assigned_to: Person | None) -> DashboardPanels:
+    today = datetime.date.today()
+    key = dashboard_panels_key(assigned_to.pk if assigned_to else None, today)
+    panels: DashboardPanels | None = cache.get(key)
+    if panels is None:
+        panels = compute_dashboard_panels(assigned_to, today)
+        cache.set(key, panels, DASHBOARD_PANELS_CACHE_TIMEOUT)
+    return panels
+
+
+def invalidate_dashboard_panels(*assigned_to_ids: int | None) -> None:
+    today = datetime.date.today()
+    cache.delete_many([dashboard_panels_key(assigned_to_id, today) for assigned_to_id in set(assigned_to_ids)])
+
+
+def invalidate_all_dashboard_panels() -> None:
+    try:
+        cache.incr(DASHBOARD_PANELS_VERSION_KEY)
+    except ValueError:
+        # version expired or not set yet
+        cache.set(DASHBOARD_PANELS_VERSION_KEY, 2, timeout=None)
@@ -0,0 +1,118 @@
+"""Instructor profile snapshot used by teaching opportunities views.
+
+Instructor community role, teaching experience (task counts), instructor tasks
+and recruitment signups of a person are computed once and cached in the shared
+cache for a short time. Receivers in `src.dashboard.receivers` invalidate the
+snapshot when person's tasks, signups, community roles or profile change;
+changes of related events or recruitments are picked up when the snapshot
+expires."""
+
+from dataclasses import dataclass
+from typing import Annotated, Self
+
+from django.core.cache import cache
+from django_countries.fields import Country
+from django_stubs_ext import Annotations
+
+from src.communityroles.models import CommunityRole
+from src.recruitment.models import InstructorRecruitmentSignup
+from src.workshops.base_views import AuthenticatedHttpRequest
+from src.workshops.models import Event, Person, PersonRoleCount, Task
+
+INSTRUCTOR_PROFILE_SNAPSHOT_TIMEOUT = 5 * 60
+REQUEST_ATTRIBUTE = "_instructor_profile_snapshot"
+
+
+@dataclass
+class PersonSummary:
+    """Person details shown in the profile snapshot. The person object isn't cached
+    itself, as it carries the password hash and other personal data."""
+
+    name: str
+    email: str
+    airport_iata: str
+    country_code: str
+    timezone: str
+    num_helper: int
+    num_supporting: int
+    num_instructor: int
+
+    def __str__(self) -> str:
+        return self.name
+
+    @property
+    def country(self) -> Country:
+        return Country(self.country_code)
+
+    @classmethod
+    def from_person(cls, person: Annotated[Person, Annotations[PersonRoleCount]]) -> Self:
+        return cls(
+            name=str(person),
+            email=person.email or "",
+            airport_iata=person.airport_iata,
+            country_code=person.country_property.code or "",
+            timezone=person.timezone_property,
+            num_helper=person.num_helper,
+            num_supporting=person.num_supporting,
+            num_instructor=person.num_instructor,
+        )
+
+
+@dataclass
+class InstructorProfileSnapshot:
+    person: PersonSummary
+    instructor_role: CommunityRole | None
+    instructor_task_events: list[Event]
+    signups: list[InstructorRecruitmentSignup]
+
+    @property
+    def instructor_role_active(self) -> bool:
+        # checked on access, as activity depends on current date
+        return self.instructor_role is not None and self.instructor_role.is_active()
+
+    @property
+    def instructor_tasks_slugs(self) -> list[str]:
+        return [event.slug for event in self.instructor_task_events]
+
+
+def instructor_profile_snapshot_key(person_id: int) -> str:
+    return f"instructor_profile_snapshot:{person_id}"
+
+
+def compute_instructor_profile_snapshot(person_id: int) -> InstructorProfileSnapshot:
+    return InstructorProfileSnapshot(
+        person=PersonSummary.from_person(
+            Person.objects.annotate_with_role_count()
+            .only("personal", "middle", "family", "email", "airport_iata", "country", "airport_country", "timezone")
+            .get(pk=person_id)
+        ),
+        instructor_role=CommunityRole.objects.filter(person_id=person_id, config__name="instructor")
+        .select_related("inactivation")
+        .first(),
+        instructor_task_events=[
+            task.event
+            for task in Task.objects.filter(role__name="instructor", person_id=person_id).select_related("event")
+        ],
+        signups=list(
+            InstructorRecruitmentSignup.objects.filter(person_id=person_id).select_related(
+                "recruitment", "recruitment__event"
+            )
+        ),
+    )
+
+
+def get_instructor_profile_snapshot(request: AuthenticatedHttpRequest) -> InstructorProfileSnapshot:
+    """Snapshot of the logged in user, loaded at most once per request."""
+    if REQUEST_ATTRIBUTE not in request.__dict__:
+        key = instructor_profile_snapshot_key(request.user.pk)
+        snapshot: InstructorProfileSnapshot | None = cache.get(key)
+        if snapshot is None:
+            snapshot = compute_instructor_profile_snapshot(request.user.pk)
+            cache.set(key, snapshot, INSTRUCTOR_PROFILE_SNAPSHOT_TIMEOUT)
+        request.__dict__[REQUEST_ATTRIBUTE] = snapshot
+    return request.__dict__[REQUEST_ATTRIBUTE]  # type: ignore[no-any-return]
+
+
+def invalidate_instructor_profile_snapshot(person_id: int | None) -> None:
+    if person_id is not None:
+        cache.delete(instructor_profile_snapshot_key(person_id))
@@ -0,0 +1,89 @@
+from typing import Any
+
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from src.communityroles.models import CommunityRole
+from src.dashboard.panels import invalidate_all_dashboard_panels, invalidate_dashboard_panels
+from src.dashboard.profile_snapshot import invalidate_instructor_profile_snapshot
+from src.recruitment.models import InstructorRecruitmentSignup
+from src.workshops.models import Event, Person, Tag, Task
+
+
+# an event can be reassigned, so panels of its previous assignee must be
+# invalidated as well
+@receiver(pre_save, sender=Event)
+def remember_event_assignee(sender: Any, instance: Event, raw: bool = False, **kwargs: Any) -> None:
+    update_fields = kwargs.get("update_fields")
+    if raw or instance._state.adding or (update_fields is not None and "assigned_to" not in update_fields):
+        return
+    instance._previous_assigned_to_id = (  # type: ignore[attr-defined]
+        Event.objects.filter(pk=instance.pk).values_list("assigned_to_id", flat=True).first()
+    )
+
+
+@receiver(post_save, sender=Event)
+@receiver(post_delete, sender=Event)
+def event_changed(sender: Any, instance: Event, **kwargs: Any) -> None:
+    invalidate_dashboard_panels(
+        instance.assigned_to_id,
+        getattr(instance, "_previous_assigned_to_id", instance.assigned_to_id),
+    )
+
+
+# a task can be reassigned to another person, so profile snapshot of its previous
+# person must be invalidated as well
+@receiver(pre_save, sender=Task)
+def remember_task_person(sender: Any, instance: Task, raw: bool = False, **kwargs: Any) -> None:
+    update_fields = kwargs.get("update_fields")
+    if raw or instance._state.adding or (update_fields is not None and "person" not in update_fields):
+        return
+    instance._previous_person_id = (  # type: ignore[attr-defined]
+        Task.objects.filter(pk=instance.pk).values_list("person_id", flat=True).first()
+    )
+
+
+# tasks change the number of instructors in "unpublished events" panel
+@receiver(post_save, sender=Task)
+@receiver(post_delete, sender=Task)
+def task_changed(sender: Any, instance: Task, **kwargs: Any) -> None:
+    assigned_to_id = Event.objects.filter(pk=instance.event_id).values_list("assigned_to_id", flat=True).first()
+    invalidate_dashboard_panels(assigned_to_id)
+    invalidate_instructor_profile_snapshot(instance.person_id)
+    previous_person_id = getattr(instance, "_previous_person_id", instance.person_id)
+    if previous_person_id != instance.person_id:
+        invalidate_instructor_profile_snapshot(previous_person_id)
+
+
+# tags decide which events are active
+@receiver(m2m_changed, sender=Event.tags.through)
+def event_tags_changed(sender: Any, instance: Event | Tag, action: str, **kwargs: Any) -> None:
+    if not action.startswith("post_"):
+        return
+    if isinstance(instance, Event):
+        invalidate_dashboard_panels(instance.assigned_to_id)
+    else:
+        # events tagged or untagged from the tag side
+        invalidate_all_dashboard_panels()
+
+
+@receiver(post_save, sender=Tag)
+@receiver(post_delete, sender=Tag)
+def tag_changed(sender: Any, **kwargs: Any) -> None:
+    invalidate_all_dashboard_panels()
+
+
+@receiver(post_save, sender=InstructorRecruitmentSignup)
+@receiver(post_delete, sender=InstructorRecruitmentSignup)
+@receiver(post_save, sender=CommunityRole)
+@receiver(post_delete, sender=CommunityRole)
+def person_related_object_changed(
+    sender: Any, instance: InstructorRecruitmentSignup | CommunityRole, **kwargs: Any
+) -> None:
+    invalidate_instructor_profile_snapshot(instance.person_id)
+
+
+@receiver(post_save, sender=Person)
+@receiver(post_delete, sender=Person)
+def person_changed(sender: Any, instance: Person, **kwargs: Any) -> None:
+    invalidate_instructor_profile_snapshot(instance.pk)
@@ -1,3 +1,5 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from src.consents.models import Consent, Term, TermEnum
@@ -169,3 +171,48 @@ class TestAutoUpdateProfile(TestBase):
         self.user.refresh_from_db()
         self.assertEqual(self.user.country, "PL")
         self.assertEqual(self.user.timezone, "Europe/Warsaw")
+
+    def test_update_profile__set_based_writes(self) -> None:
+        """Lessons and consents are written with a fixed number of statements,
+        regardless of how many of them changed."""
+        kept = Qualification.objects.get(person=self.user, lesson=self.git)
+        old_consents = {
+            consent.term.slug: consent
+            for consent in Consent.objects.filter(person=self.user).active().select_related("term")
+        }
+        data = self._build_profile_data()
+        data["lessons"] = [self.git.pk, self.matlab.pk, self.r.pk]
+        # answers different from the current ones
+        terms = Term.objects.filter(slug__in=[TermEnum.MAY_CONTACT, TermEnum.MAY_PUBLISH_NAME, TermEnum.PUBLIC_PROFILE])
+        for term in terms.active().prefetch_active_options():
+            option = next(
+                option
+                for option in term.active_options  # type: ignore[attr-defined]
+                if option.pk != old_consents[term.slug].term_option_id
+            )
+            data[f"consents-{term.slug}"] = option.pk
+
+        with CaptureQueriesContext(connection) as ctx:
+            rv = self.client.post(reverse("autoupdate_profile"), data)
+        self.assertEqual(rv.status_code, 302)
+
+        def statements(prefix: str, table: str) -> int:
+            return sum(
+                1 for query in ctx.captured_queries if query["sql"].startswith(prefix) and f'"{table}"' in query["sql"]
+            )
+
+        self.assertEqual(statements("INSERT", "workshops_qualification"), 1)
+        self.assertEqual(statements("DELETE", "workshops_qualification"), 1)
+        self.assertEqual(statements("UPDATE", "consents_consent"), 1)
+        self.assertEqual(statements("INSERT", "consents_consent"), 1)
+
+        self.assertTrue(Qualification.objects.filter(pk=kept.pk).exists())
+        self.assertEqual(set(self.user.lessons.all()), {self.git, self.matlab, self.r})
+        for term in terms:
+            old_consent = old_consents[term.slug]
+            old_consent.refresh_from_db()
+            self.assertIsNotNone(old_consent.archived_at)
+            self.assertEqual(
+                Consent.objects.filter(person=self.user, term=term).active().get().term_option_id,
+                data[f"consents-{term.slug}"],
+            )
@@ -0,0 +1,104 @@
+import datetime
+from unittest.mock import patch
+
+from django.core.cache import cache
+
+from src.dashboard.panels import compute_dashboard_panels, get_dashboard_panels
+from src.workshops.models import Event, Organization, Role, Tag, Task
+from src.workshops.tests.base import TestBase
+
+
+class TestDashboardPanels(TestBase):
+    def setUp(self) -> None:
+        cache.clear()
+        self._setUpTags()
+        self._setUpEvents()
+        self._setUpUsersAndLogin()
+        self._setUpRoles()
+        self.unpublished_event = Event.objects.create(
+            slug="unpublished-event",
+            host=Organization.objects.all()[0],
+            assigned_to=self.admin,
+        )
+
+    def test_same_as_event_querysets(self) -> None:
+        # Arrange
+        today = datetime.date.today()
+        Event.objects.filter(slug__endswith="-upcoming").update(metadata_changed=True)
+
+        # Act
+        with self.assertNumQueries(2):
+            panels = compute_dashboard_panels(None, today)
+
+        # Assert
+        self.assertEqual(
+            [event.pk for event in panels.current_events],
+            [event.pk for event in Event.objects.current_events().filter(assigned_to=None)],
+        )
+        self.assertEqual(
+            {event.pk for event in panels.unpublished_events},
+            {event.pk for event in Event.objects.active().unpublished_events().filter(assigned_to=None)},
+        )
+        self.assertEqual(
+            panels.updated_metadata, Event.objects.active().filter(metadata_changed=True, assigned_to=None).count()
+        )
+        self.assertEqual(panels.main_tags, list(Tag.objects.main_tags()))
+
+    def test_cached(self) -> None:
+        # Arrange
+        get_dashboard_panels(self.admin)
+
+        # Act
+        with patch("src.dashboard.panels.compute_dashboard_panels") as mock_compute:
+            panels = get_dashboard_panels(self.admin)
+
+        # Assert
+        mock_compute.assert_not_called()
+        self.assertEqual(panels.unpublished_events, [self.unpublished_event])
+
+    def test_invalidated_when_event_reassigned(self) -> None:
+        # Arrange
+        get_dashboard_panels(self.admin)
+        get_dashboard_panels(None)
+
+        # Act
+        self.unpublished_event.assigned_to = None
+        self.unpublished_event.save()
+
+        # Assert
+        self.assertEqual(get_dashboard_panels(self.admin).unpublished_events, [])
+        self.assertIn(self.unpublished_event, get_dashboard_panels(None).unpublished_events)
+
+    def test_invalidated_when_instructor_task_added(self) -> None:
+        # Arrange
+        get_dashboard_panels(self.admin)
+
+        # Act
+        Task.objects.create(event=self.unpublished_event, person=self.admin, role=Role.objects.get(name="instructor"))
+
+        # Assert
+        self.assertEqual(get_dashboard_panels(self.admin).unpublished_events[0].num_instructors, 1)
+
+    def test_invalidated_when_event_tagged(self) -> None:
+        # Arrange
+        get_dashboard_panels(self.admin)
+
+        # Act
+        self.unpublished_event.tags.add(Tag.objects.get(name="cancelled"))
+
+        # Assert
+        self.assertEqual(get_dashboard_panels(self.admin).unpublished_events, [])
+
+    def test_invalidated_when_tag_changed(self) -> None:
+        # Arrange
+        tag = Tag.objects.get(name="SWC")
+        self.unpublished_event.tags.add(tag)
+        get_dashboard_panels(self.admin)
+
+        # Act
+        tag.priority += 1
+        tag.save()
+
+        # Assert
+        self.assertEqual(get_dashboard_panels(self.admin).main_tags, list(Tag.objects.main_tags()))
+        self.assertEqual(get_dashboard_panels(self.admin).unpublished_events[0].main_tag_ids, [tag.pk])
@@ -0,0 +1,197 @@
+from datetime import date, timedelta
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from src.communityroles.models import CommunityRole, CommunityRoleConfig, CommunityRoleInactivation
+from src.dashboard.profile_snapshot import (
+    PersonSummary,
+    compute_instructor_profile_snapshot,
+    instructor_profile_snapshot_key,
+)
+from src.recruitment.models import InstructorRecruitment, InstructorRecruitmentSignup
+from src.workshops.models import Event, Organization, Person, Role, Task
+from src.workshops.tests.base import consent_to_all_required_consents
+
+
+@override_settings(FLAGS={"INSTRUCTOR_RECRUITMENT": [("boolean", True)]})
+class TestInstructorProfileSnapshot(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.host = Organization.objects.create(domain="test.com", fullname="Test")
+        self.person = Person.objects.create_user(
+            username="test_test",
+            personal="Test",
+            family="User",
+            email="test@user.com",
+            password="test",
+        )
+        self.person.airport_iata = "CDG"
+        self.person.save()
+        consent_to_all_required_consents(self.person)
+        self.config = CommunityRoleConfig.objects.create(
+            name="instructor",
+            display_name="Instructor",
+            link_to_award=False,
+            link_to_membership=False,
+            link_to_partnership=False,
+            additional_url=False,
+        )
+        self.role = CommunityRole.objects.create(config=self.config, person=self.person)
+        self.instructor = Role.objects.create(name="instructor")
+        start = date.today() + timedelta(days=30)
+        self.event = Event.objects.create(
+            slug="test-event",
+            host=self.host,
+            start=start,
+            end=start + timedelta(days=1),
+            venue="Venue",
+            latitude=1,
+            longitude=1,
+        )
+        self.recruitment = InstructorRecruitment.objects.create(status="o", event=self.event)
+        self.client.login(username="test_test", password="test")
+
+    def request_queries(self, url: str, method: str = "get") -> tuple[int, int]:
+        """Number of queries made while handling the request and number of times
+        the snapshot was computed."""
+        with (
+            patch(
+                "src.dashboard.profile_snapshot.compute_instructor_profile_snapshot",
+                wraps=compute_instructor_profile_snapshot,
+            ) as mock_compute,
+            CaptureQueriesContext(connection) as ctx,
+        ):
+            getattr(self.client, method)(url)
+        return len(ctx.captured_queries), mock_compute.call_count
+
+    def test_compute(self) -> None:
+        # Arrange
+        Task.objects.create(event=self.event, person=self.person, role=self.instructor)
+        signup = InstructorRecruitmentSignup.objects.create(person=self.person, recruitment=self.recruitment)
+
+        # Act
+        with self.assertNumQueries(4):
+            snapshot = compute_instructor_profile_snapshot(self.person.pk)
+
+        # Assert
+        self.assertEqual(snapshot.person.num_instructor, 1)
+        self.assertEqual(str(snapshot.person), "Test User <test@user.com>")
+        self.assertEqual(snapshot.person.airport_iata, "CDG")
+        self.assertEqual(snapshot.instructor_role, self.role)
+        self.assertTrue(snapshot.instructor_role_active)
+        self.assertEqual(snapshot.instructor_tasks_slugs, [self.event.slug])
+        self.assertEqual(snapshot.signups, [signup])
+
+    def test_upcoming_teaching_opportunities__computed_once(self) -> None:
+        # Arrange
+        url = reverse("upcoming-teaching-opportunities")
+
+        # Act
+        cold_queries, cold_computed = self.request_queries(url)
+        warm_queries, warm_computed = self.request_queries(url)
+
+        # Assert
+        self.assertEqual(cold_computed, 1)
+        self.assertEqual(warm_computed, 0)
+        # snapshot is computed with 4 queries and read from cache with 1
+        self.assertLessEqual(warm_queries, cold_queries - 4)
+
+    def test_signup_for_recruitment__computed_once(self) -> None:
+        # Arrange
+        url = reverse("signup-for-recruitment", kwargs={"recruitment_pk": self.recruitment.pk})
+
+        # Act
+        cold_queries, cold_computed = self.request_queries(url)
+        warm_queries, warm_computed = self.request_queries(url)
+
+        # Assert
+        self.assertEqual(cold_computed, 1)
+        self.assertEqual(warm_computed, 0)
+        # snapshot is computed with 4 queries and read from cache with 1
+        self.assertLessEqual(warm_queries, cold_queries - 4)
+
+    def test_resign_from_recruitment__computed_once(self) -> None:
+        # Arrange
+        signup1 = InstructorRecruitmentSignup.objects.create(person=self.person, recruitment=self.recruitment)
+        other_event = Event.objects.create(slug="other-event", host=self.host)
+        signup2 = InstructorRecruitmentSignup.objects.create(
+            person=self.person,
+            recruitment=InstructorRecruitment.objects.create(status="o", event=other_event),
+        )
+        self.client.get(reverse("upcoming-teaching-opportunities"))
+
+        # Act
+        _, first_computed = self.request_queries(
+            reverse("resign-from-recruitment", kwargs={"signup_pk": signup1.pk}), "post"
+        )
+        _, second_computed = self.request_queries(
+            reverse("resign-from-recruitment", kwargs={"signup_pk": signup2.pk}), "post"
+        )
+
+        # Assert
+        # snapshot was cached by the list view, but resigning invalidated it
+        self.assertEqual(first_computed, 0)
+        self.assertEqual(second_computed, 1)
+        self.assertFalse(InstructorRecruitmentSignup.objects.filter(person=self.person).exists())
+
+    def test_invalidated_when_signup_created(self) -> None:
+        # Arrange
+        self.client.get(reverse("upcoming-teaching-opportunities"))
+
+        # Act
+        InstructorRecruitmentSignup.objects.create(person=self.person, recruitment=self.recruitment)
+
+        # Assert
+        self.assertIsNone(cache.get(instructor_profile_snapshot_key(self.person.pk)))
+
+    def test_invalidated_when_task_created(self) -> None:
+        # Arrange
+        self.client.get(reverse("upcoming-teaching-opportunities"))
+
+        # Act
+        Task.objects.create(event=self.event, person=self.person, role=self.instructor)
+
+        # Assert
+        self.assertIsNone(cache.get(instructor_profile_snapshot_key(self.person.pk)))
+
+    def test_cached_without_person_object(self) -> None:
+        # Arrange
+        self.client.get(reverse("upcoming-teaching-opportunities"))
+
+        # Act
+        snapshot = cache.get(instructor_profile_snapshot_key(self.person.pk))
+
+        # Assert
+        self.assertIsInstance(snapshot.person, PersonSummary)
+        self.assertNotIn(self.person.password, repr(snapshot))
+
+    def test_invalidated_when_task_reassigned(self) -> None:
+        # Arrange
+        other_person = Person.objects.create(personal="Other", family="User", email="other@user.com")
+        task = Task.objects.create(event=self.event, person=self.person, role=self.instructor)
+        self.client.get(reverse("upcoming-teaching-opportunities"))
+
+        # Act
+        task.person = other_person
+        task.save()
+
+        # Assert
+        self.assertIsNone(cache.get(instructor_profile_snapshot_key(self.person.pk)))
+
+    def test_invalidated_when_community_role_inactivated(self) -> None:
+        # Arrange
+        url = reverse("upcoming-teaching-opportunities")
+        self.client.get(url)
+
+        # Act
+        self.role.inactivation = CommunityRoleInactivation.objects.create(name="inactivation")
+        self.role.save()
+        rv = self.client.get(url)
+
+        # Assert
+        self.assertEqual(rv.status_code, 404)
@@ -6,15 +6,10 @@ from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.db.models import (
-    Case,
-    Count,
-    IntegerField,
     Model,
     Prefetch,
     Q,
     QuerySet,
-    Value,
-    When,
 )
 from django.forms.widgets import HiddenInput
 from django.http import HttpRequest, HttpResponse, HttpResponseBase
@@ -29,7 +24,6 @@ from flags.sources import get_flags  # type: ignore[import-untyped]
 from flags.state import flag_enabled  # type: ignore[import-untyped]
 from flags.views import FlaggedViewMixin  # type: ignore[import-untyped]
 
-from src.communityroles.models import CommunityRole
 from src.consents.forms import TermBySlugsForm
 from src.consents.models import Consent, Term, TermEnum
 from src.dashboard.filters import UpcomingTeachingOpportunitiesFilter
@@ -40,6 +34,8 @@ from src.dashboard.forms import (
     SearchForm,
     SignupForRecruitmentForm,
 )
+from src.dashboard.panels import get_dashboard_panels
+from src.dashboard.profile_snapshot import get_instructor_profile_snapshot
 from src.dashboard.utils import (
     cross_multiple_Q_icontains,
     get_passed_or_last_progress,
@@ -65,14 +61,13 @@ from src.workshops.models import (
     Membership,
     Organization,
     Person,
-    Qualification,
-    Tag,
     Task,
     TrainingProgress,
     TrainingRequest,
     TrainingRequirement,
 )
 from src.workshops.utils.access import admin_required, login_required
+from src.workshops.utils.querysets import sync_many_to_many
 from src.workshops.utils.urls import safe_next_or_default_url
 
 # Terms shown on the instructor dashboard and can be updated by the user.
@@ -100,41 +95,16 @@ def admin_dashboard(request: AuthenticatedHttpRequest) -> HttpResponse:
     if assignment_form.is_valid():
         assigned_to = assignment_form.cleaned_data["assigned_to"]
 
-    current_events = Event.objects.current_events().prefetch_related("tags")
-
-    # This annotation may produce wrong number of instructors when
-    # `unpublished_events` filters out events that contain a specific tag.
-    # The bug was fixed in #1130.
-    unpublished_events = (
-        Event.objects.active()
-        .unpublished_events()
-        .select_related("host")
-        .annotate(
-            num_instructors=Count(
-                Case(
-                    When(task__role__name="instructor", then=Value(1)),
-                    output_field=IntegerField(),
-                )
-            ),
-        )
-        .order_by("-start")
-    )
-
-    # assigned events that have unaccepted changes
-    updated_metadata = Event.objects.active().filter(metadata_changed=True)
-
-    current_events = current_events.filter(assigned_to=assigned_to)
-    unpublished_events = unpublished_events.filter(assigned_to=assigned_to)
-    updated_metadata = updated_metadata.filter(assigned_to=assigned_to)
+    panels = get_dashboard_panels(assigned_to)
 
     context = {
         "title": None,
         "assignment_form": assignment_form,
         "assigned_to": assigned_to,
-        "current_events": current_events,
-        "unpublished_events": unpublished_events,
-        "updated_metadata": updated_metadata.count(),
-        "main_tags": Tag.objects.main_tags(),
+        "current_events": panels.current_events,
+        "unpublished_events": panels.unpublished_events,
+        "updated_metadata": panels.updated_metadata,
+        "main_tags": panels.main_tags,
     }
     return render(request, "dashboard/admin_dashboard.html", context)
 
@@ -199,10 +169,7 @@ def autoupdate_profile(request: AuthenticatedHttpRequest) -> HttpResponse:
         consent_form = TermBySlugsForm(request.POST, term_slugs=TERM_SLUGS, **consent_form_kwargs)
         if form.is_valid() and form.instance == person and consent_form.is_valid():
             # save lessons
-            person.lessons.clear()
-            for lesson in form.cleaned_data["lessons"]:
-                q = Qualification(lesson=lesson, person=person)
-                q.save()
+            sync_many_to_many(person.lessons, form.cleaned_data["lessons"])
 
             # don't save related lessons
             del form.cleaned_data["lessons"]
@@ -397,31 +364,17 @@ class UpcomingTeachingOpportunitiesList(
         if request.user.is_admin:
             return True
 
-        try:
-            role = CommunityRole.objects.get(person=self.request.user, config__name="instructor")
-            return role.is_active()
-        except CommunityRole.DoesNotExist:
-            return False
+        return get_instructor_profile_snapshot(request).instructor_role_active
 
     def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
         context = super().get_context_data(**kwargs)
 
-        # person details with tasks counted
-        context["person"] = Person.objects.annotate_with_role_count().get(pk=self.request.user.pk)
-        context["person_instructor_tasks_slugs"] = Task.objects.filter(
-            role__name="instructor", person__pk=self.request.user.pk
-        ).values_list("event__slug", flat=True)
-
-        context["person_instructor_task_events"] = {
-            task.event
-            for task in Task.objects.filter(role__name="instructor", person__pk=self.request.user.pk).select_related(
-                "event"
-            )
-        }
-
-        context["person_signups"] = InstructorRecruitmentSignup.objects.filter(person=self.request.user).select_related(
-            "recruitment", "recruitment__event"
-        )
+        # person details with tasks counted, instructor tasks and signups
+        snapshot = get_instructor_profile_snapshot(self.request)
+        context["person"] = snapshot.person
+        context["person_instructor_tasks_slugs"] = snapshot.instructor_tasks_slugs
+        context["person_instructor_task_events"] = set(snapshot.instructor_task_events)
+        context["person_signups"] = snapshot.signups
 
         return context
 
@@ -452,11 +405,7 @@ class SignupForRecruitment(
         if request.user.is_admin:
             return True
 
-        try:
-            role = CommunityRole.objects.get(person=self.request.user, config__name="instructor")
-            if not role.is_active():
-                return False
-        except CommunityRole.DoesNotExist:
+        if not get_instructor_profile_snapshot(request).instructor_role_active:
             return False
 
         # Users without airport information aren't allowed.
@@ -469,7 +418,7 @@ class SignupForRecruitment(
         context["title"] = f"Signup for workshop {event}"
 
         # person details with tasks counted
-        context["person"] = Person.objects.annotate_with_role_count().get(pk=self.request.user.pk)
+        context["person"] = get_instructor_profile_snapshot(self.request).person
 
         return context
 
@@ -577,11 +526,7 @@ class ResignFromRecruitment(
         if request.user.is_admin:
             return True
 
-        try:
-            role = CommunityRole.objects.get(person=self.request.user, config__name="instructor")
-            return role.is_active()
-        except CommunityRole.DoesNotExist:
-            return False
+        return get_instructor_profile_snapshot(request).instructor_role_active
 
     def get_queryset(self) -> QuerySet[InstructorRecruitmentSignup]:
         return InstructorRecruitmentSignup.objects.filter(person=self.request.user, recruitment__status="o")
@@ -3,7 +3,6 @@ from datetime import date, datetime
 from io import BytesIO
 from typing import Any, Unpack
 
-import cairosvg
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
 from django.http import HttpRequest
@@ -34,6 +33,7 @@ from src.emails.utils import (
     scalar_value_url,
 )
 from src.workshops.models import Award, Person
+from src.workshops.utils.resources import cairosvg
 
 logger = logging.getLogger("amy")
 
@@ -280,7 +280,7 @@ def read_binary_file_and_replace_values(file_path: str, replacements: dict[bytes
 
 def generate_pdf(svg_file: bytes) -> bytes:
     file_obj = BytesIO()
-    cairosvg.svg2pdf(svg_file, write_to=file_obj, dpi=90)  # type: ignore[no-untyped-call]
+    cairosvg.svg2pdf(svg_file, write_to=file_obj, dpi=90)
     file_obj.seek(0)
     return file_obj.read()
 
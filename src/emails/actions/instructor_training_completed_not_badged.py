@@ -1,4 +1,6 @@
 import logging
+from collections import defaultdict
+from collections.abc import Iterable
 from datetime import date, datetime, timedelta
 from typing import Any, Unpack
 
@@ -52,6 +54,22 @@ def find_training_completion_date(person: Person) -> date:
     return training_completed_date
 
 
+def find_training_completion_dates(persons: Iterable[Person]) -> dict[int, date]:
+    """Training completion dates (by person ID) found with a single query. Persons
+    for whom `find_training_completion_date` would fail are omitted."""
+    trainings: dict[int, list[date | None]] = defaultdict(list)
+    for person_id, event_end in TrainingProgress.objects.filter(
+        trainee__in=list(persons), state="p", requirement__name="Training"
+    ).values_list("trainee_id", "event__end"):
+        trainings[person_id].append(event_end)
+
+    return {
+        person_id: event_ends[0]
+        for person_id, event_ends in trainings.items()
+        if len(event_ends) == 1 and event_ends[0] is not None
+    }
+
+
 def instructor_training_completed_not_badged_strategy(person: Person) -> StrategyEnum:
     logger.info(f"Running InstructorTrainingCompletedNotBadged strategy for {person}")
 
@@ -95,6 +113,82 @@ def instructor_training_completed_not_badged_strategy(person: Person) -> Strateg
         }
     )
 
+    result = strategy_from_conditions(
+        person_passed_training_reqs_newer_than_90days=person_passed_training_reqs_newer_than_90days,
+        all_requirements_passed=all_requirements_passed,
+        instructor_badge_not_awarded=instructor_badge_not_awarded,
+        email_scheduled=email_scheduled,
+        email_running_or_succeeded=email_running_or_succeeded,
+    )
+
+    logger.debug(f"InstructorTrainingCompletedNotBadged strategy {result=}")
+    return result
+
+
+def instructor_training_completed_not_badged_strategies(persons: Iterable[Person]) -> dict[int, StrategyEnum]:
+    """Strategies for multiple persons (by person ID), with a fixed number of queries.
+    Equivalent to running `instructor_training_completed_not_badged_strategy` for each
+    person."""
+    persons = list(persons)
+    person_ids = [person.pk for person in persons]
+    logger.info(f"Running InstructorTrainingCompletedNotBadged strategy for {len(persons)} person(s)")
+
+    cutoff_date = date.today() - timedelta(days=90)
+    eligible = dict(
+        Person.objects.annotate_with_instructor_eligibility()
+        .filter(pk__in=person_ids)
+        .values_list("pk", "instructor_eligible")
+    )
+    passed_training_reqs_newer_than_90days = set(
+        TrainingProgress.objects.filter(
+            trainee_id__in=person_ids,
+            requirement__name="Training",
+            state="p",
+            event__start__gte=cutoff_date,
+        ).values_list("trainee_id", flat=True)
+    )
+    instructor_badge_awarded = set(
+        Award.objects.filter(person_id__in=person_ids, badge__name="instructor").values_list("person_id", flat=True)
+    )
+
+    running_or_succeeded_states = [
+        ScheduledEmailStatus.LOCKED,
+        ScheduledEmailStatus.RUNNING,
+        ScheduledEmailStatus.SUCCEEDED,
+    ]
+    email_states: dict[int, set[str]] = defaultdict(set)
+    for person_id, state in ScheduledEmail.objects.filter(
+        generic_relation_content_type=ContentType.objects.get_for_model(Person),
+        generic_relation_pk__in=person_ids,
+        template__signal=INSTRUCTOR_TRAINING_COMPLETED_NOT_BADGED_SIGNAL_NAME,
+        state__in=[ScheduledEmailStatus.SCHEDULED, *running_or_succeeded_states],
+    ).values_list("generic_relation_pk", "state"):
+        email_states[person_id].add(state)
+
+    strategies = {}
+    for person in persons:
+        conditions = {
+            "person_passed_training_reqs_newer_than_90days": person.pk in passed_training_reqs_newer_than_90days,
+            "all_requirements_passed": bool(eligible.get(person.pk)),
+            "instructor_badge_not_awarded": person.pk not in instructor_badge_awarded,
+        }
+        log_condition_elements(**conditions)
+        strategies[person.pk] = strategy_from_conditions(
+            **conditions,
+            email_scheduled=ScheduledEmailStatus.SCHEDULED in email_states[person.pk],
+            email_running_or_succeeded=bool(email_states[person.pk] & set(running_or_succeeded_states)),
+        )
+    return strategies
+
+
+def strategy_from_conditions(
+    *,
+    person_passed_training_reqs_newer_than_90days: bool,
+    all_requirements_passed: bool,
+    instructor_badge_not_awarded: bool,
+    email_scheduled: bool,
+    email_running_or_succeeded: bool,
+) -> StrategyEnum:
     email_should_exist = (
         bool(person_passed_training_reqs_newer_than_90days)
         and not all_requirements_passed
@@ -103,18 +197,15 @@ def instructor_training_completed_not_badged_strategy(person: Person) -> Strateg
 
     # Prevents running sending multiple emails.
     if email_running_or_succeeded:
-        result = StrategyEnum.NOOP
+        return StrategyEnum.NOOP
     elif not email_scheduled and email_should_exist:
-        result = StrategyEnum.CREATE
+        return StrategyEnum.CREATE
     elif email_scheduled and not email_should_exist:
-        result = StrategyEnum.CANCEL
+        return StrategyEnum.CANCEL
     elif email_scheduled and email_should_exist:
-        result = StrategyEnum.UPDATE
+        return StrategyEnum.UPDATE
     else:
-        result = StrategyEnum.NOOP
-
-    logger.debug(f"InstructorTrainingCompletedNotBadged strategy {result=}")
-    return result
+        return StrategyEnum.NOOP
 
 
 def run_instructor_training_completed_not_badged_strategy(
@@ -4,7 +4,6 @@ from datetime import datetime, timedelta
 from io import BytesIO
 from uuid import UUID, uuid4
 
-import boto3
 import jinja2
 from django.conf import settings
 from django.db.models import Model
@@ -19,8 +18,8 @@ from src.emails.models import (
 )
 from src.emails.schemas import ContextModel, ToHeaderModel
 from src.workshops.models import Person
+from src.workshops.utils.resources import s3_client
 
-s3_client = boto3.client("s3")
 logger = logging.getLogger("amy")
 
 
@@ -1,25 +1,63 @@
+from collections import defaultdict
+from collections.abc import Iterable
+from typing import Any
+
 from django import template
 from django.contrib.contenttypes.models import ContentType
-from django.db.models import Model, QuerySet
+from django.db.models import Model, Q
 
 from src.emails.models import (
     ScheduledEmail,
     ScheduledEmailStatus,
     ScheduledEmailStatusActions,
 )
+from src.workshops.utils.loaders import BatchLoader
 
 register = template.Library()
 
 
+class RelatedScheduledEmailsLoader(BatchLoader[tuple[int, int], list[ScheduledEmail]]):
+    """Scheduled emails by (content type ID, PK) of their related object, newest
+    first."""
+
+    def batch_load(self, keys: set[tuple[int, int]]) -> dict[tuple[int, int], list[ScheduledEmail]]:
+        pks_by_content_type: defaultdict[int, set[int]] = defaultdict(set)
+        for content_type_id, pk in keys:
+            pks_by_content_type[content_type_id].add(pk)
+
+        condition = Q()
+        for content_type_id, pks in pks_by_content_type.items():
+            condition |= Q(generic_relation_content_type_id=content_type_id, generic_relation_pk__in=pks)
+
+        emails: defaultdict[tuple[int, int], list[ScheduledEmail]] = defaultdict(list)
+        for email in ScheduledEmail.objects.filter(condition).select_related("template").order_by("-created_at"):
+            emails[(email.generic_relation_content_type_id, email.generic_relation_pk)].append(  # type: ignore[index]
+                email
+            )
+        return emails
+
+    def missing(self, key: tuple[int, int]) -> list[ScheduledEmail]:
+        return []
+
+
+def related_object_key(obj: Model) -> tuple[int, int]:
+    return ContentType.objects.get_for_model(obj.__class__).pk, obj.pk
+
+
 @register.simple_tag
 def allowed_actions_for_status(status: ScheduledEmailStatus) -> list[str]:
     return [key for key, statuses in ScheduledEmailStatusActions.items() if status in statuses]
 
 
-@register.simple_tag
-def get_related_scheduled_emails(obj: Model) -> QuerySet[ScheduledEmail]:
-    content_type = ContentType.objects.get_for_model(obj.__class__)
-    return ScheduledEmail.objects.filter(
-        generic_relation_content_type=content_type,
-        generic_relation_pk=obj.pk,
-    ).order_by("-created_at")
+@register.simple_tag(takes_context=True)
+def prime_related_scheduled_emails(context: dict[str, Any], objects: Iterable[Model]) -> str:
+    """Load scheduled emails related to all objects with a single query on the
+    first `get_related_scheduled_emails` call for any of them."""
+    loader = RelatedScheduledEmailsLoader.for_request(context.get("request"))
+    loader.prime(related_object_key(obj) for obj in objects)
+    return ""
+
+
+@register.simple_tag(takes_context=True)
+def get_related_scheduled_emails(context: dict[str, Any], obj: Model) -> list[ScheduledEmail]:
+    return RelatedScheduledEmailsLoader.for_request(context.get("request")).load(related_object_key(obj))
@@ -7,6 +7,8 @@ from src.emails.actions.exceptions import EmailStrategyException
 from src.emails.actions.instructor_training_completed_not_badged import (
     TrainingCompletionDateException,
     find_training_completion_date,
+    find_training_completion_dates,
+    instructor_training_completed_not_badged_strategies,
     instructor_training_completed_not_badged_strategy,
     run_instructor_training_completed_not_badged_strategy,
 )
@@ -92,6 +94,26 @@ class TestTrainingCompletionDate(TestCase):
         ):
             find_training_completion_date(self.person)
 
+    def test_find_training_completion_dates(self) -> None:
+        # Arrange
+        event1 = self.setUpEvent(slug="test-event1", start=date(2023, 10, 28), end=date(2023, 10, 29))
+        event2 = self.setUpEvent(slug="test-event2", start=date(2023, 11, 4), end=date(2023, 11, 5))
+        event3 = self.setUpEvent(slug="test-event3", start=date(2023, 11, 4))
+        person2 = Person.objects.create(personal="Test2", family="Test", email="test2@example.com", username="test2")
+        person3 = Person.objects.create(personal="Test3", family="Test", email="test3@example.com", username="test3")
+        person4 = Person.objects.create(personal="Test4", family="Test", email="test4@example.com", username="test4")
+        self.setUpPassedTraining(self.person, event1)
+        self.setUpPassedTraining(person2, event1)
+        self.setUpPassedTraining(person2, event2)
+        self.setUpPassedTraining(person3, event3)
+
+        # Act
+        with self.assertNumQueries(1):
+            result = find_training_completion_dates([self.person, person2, person3, person4])
+
+        # Assert
+        self.assertEqual(result, {self.person.pk: event1.end})
+
 
 class TestInstructorTrainingCompletedNotBadgedStrategy(TestCase):
     def setUp(self) -> None:
@@ -202,6 +224,51 @@ class TestInstructorTrainingCompletedNotBadgedStrategy(TestCase):
         # Assert
         self.assertEqual(result, StrategyEnum.NOOP)
 
+    def test_strategies__same_as_single_strategy(self) -> None:
+        # Arrange
+        persons = [
+            Person.objects.create(personal=f"Test{i}", family="Test", email=f"test{i}@example.com", username=f"test{i}")
+            for i in range(6)
+        ]
+        for person in persons[:4]:
+            self.setUpPassedTrainingProgress(person, self.training_requirement, self.event)
+        self.setUpInstructorAward(persons[3])
+        scheduled_email = self.setUpScheduledEmail(persons[1])
+        for person, state in [
+            (persons[2], ScheduledEmailStatus.SUCCEEDED),
+            (persons[4], ScheduledEmailStatus.SCHEDULED),
+        ]:
+            ScheduledEmail.objects.create(
+                template=scheduled_email.template,
+                scheduled_at=datetime.now(UTC),
+                to_header=[],
+                cc_header=[],
+                bcc_header=[],
+                state=state,
+                generic_relation=person,
+            )
+
+        # Act
+        with self.assertNumQueries(4):
+            result = instructor_training_completed_not_badged_strategies(persons)
+
+        # Assert
+        self.assertEqual(
+            result,
+            {person.pk: instructor_training_completed_not_badged_strategy(person) for person in persons},
+        )
+        self.assertEqual(
+            list(result.values()),
+            [
+                StrategyEnum.CREATE,
+                StrategyEnum.UPDATE,
+                StrategyEnum.NOOP,
+                StrategyEnum.NOOP,
+                StrategyEnum.CANCEL,
+                StrategyEnum.NOOP,
+            ],
+        )
+
     def test_strategy_noop_when_previous_successful_email_exists(self) -> None:
         # Arrange
         self.setUpPassedTrainingProgress(self.person, self.training_requirement, self.event)
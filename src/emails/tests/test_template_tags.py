@@ -1,7 +1,11 @@
-from django.test import TestCase
+from django.contrib.contenttypes.models import ContentType
+from django.template import Context, Template
+from django.test import RequestFactory, TestCase
+from django.utils import timezone
 
-from src.emails.models import ScheduledEmailStatus
+from src.emails.models import EmailTemplate, ScheduledEmail, ScheduledEmailStatus
 from src.emails.templatetags.emails import allowed_actions_for_status
+from src.workshops.models import Organization
 
 
 class TestAllowedActionsForStatusTag(TestCase):
@@ -34,3 +38,53 @@ class TestAllowedActionsForStatusTag(TestCase):
         # Assert
         self.assertEqual(result1, [])
         self.assertEqual(result2, ["edit", "reschedule"])
+
+
+class TestRelatedScheduledEmailsTag(TestCase):
+    def test_primed_objects_loaded_with_single_query(self) -> None:
+        # Arrange
+        template = EmailTemplate.objects.create(
+            name="Test Email Template",
+            signal="test_email_template",
+            subject="Greetings",
+            from_header="workshops@carpentries.org",
+            cc_header=[],
+            bcc_header=[],
+            body="Hello!",
+        )
+        organizations = Organization.objects.bulk_create(
+            [Organization(domain=f"example{i}.org", fullname=f"Example {i}") for i in range(20)]
+        )
+        content_type = ContentType.objects.get_for_model(Organization)
+        for organization in organizations[::2]:
+            ScheduledEmail.objects.create(
+                scheduled_at=timezone.now(),
+                to_header=["test@example.org"],
+                from_header=template.from_header,
+                cc_header=[],
+                bcc_header=[],
+                subject=organization.domain,
+                body="Hello!",
+                template=template,
+                generic_relation_content_type=content_type,
+                generic_relation_pk=organization.pk,
+            )
+        django_template = Template(
+            "{% load emails %}"
+            "{% prime_related_scheduled_emails organizations %}"
+            "{% for organization in organizations %}"
+            "{% get_related_scheduled_emails organization as emails %}"
+            "{% for email in emails %}{{ email.template.name }}:{{ email.subject }};{% endfor %}"
+            "{% endfor %}"
+        )
+        context = Context({"organizations": organizations, "request": RequestFactory().get("/")})
+
+        # Act
+        with self.assertNumQueries(1):
+            result = django_template.render(context)
+
+        # Assert
+        self.assertEqual(
+            result,
+            "".join(f"Test Email Template:{organization.domain};" for organization in organizations[::2]),
+        )
@@ -31,6 +31,7 @@ from src.emails.utils import (
     messages_missing_template_link,
     one_month_before,
     person_from_request,
+    render_body_preview,
     scalar_value_from_type,
     session_condition,
     shift_date_and_apply_current_utc_time,
@@ -639,3 +640,19 @@ class TestBuildContextFromList(TestCase):
 
         # Assert
         self.assertEqual(result, ["test1@example.org", "test2@example.org"])
+
+
+class TestRenderBodyPreview(TestCase):
+    def test_render_body_preview(self) -> None:
+        # Act
+        html = render_body_preview("Hello **{{ name }}**", {"name": "Harry"})
+
+        # Assert
+        self.assertEqual(html, "<p>Hello <strong>Harry</strong></p>")
+
+    def test_render_body_preview__invalid_template(self) -> None:
+        # Act
+        html = render_body_preview("Hello {{ name", {})
+
+        # Assert
+        self.assertIn("Unable to render template", html)
@@ -13,7 +13,7 @@ from django.http import HttpRequest
 from django.utils import timezone
 from django.utils.html import format_html
 from flags import conditions  # type: ignore[import-untyped]
-from jinja2 import Environment
+from jinja2 import DebugUndefined, Environment, TemplateError
 from rest_framework.serializers import ModelSerializer
 
 from src.api.v2.serializers import (
@@ -45,6 +45,7 @@ from src.workshops.models import (
     TrainingProgress,
     TrainingRequirement,
 )
+from src.workshops.utils.markdown import render_markdown
 
 logger = logging.getLogger("amy")
 
@@ -206,6 +207,16 @@ def jinjanify(engine: Environment, template: str, context: dict[str, Any]) -> st
     return engine.from_string(template).render(context)
 
 
+def render_body_preview(body: str, body_context: dict[str, Any]) -> str:
+    """HTML preview of an email body: Jinja template rendered with the context,
+    then Markdown rendered to HTML (cached)."""
+    engine = Environment(autoescape=True, undefined=DebugUndefined)
+    try:
+        return render_markdown(jinjanify(engine, body, body_context))
+    except (TemplateError, AttributeError, ValueError, TypeError) as exc:
+        return render_markdown(f"Unable to render template: {exc}")
+
+
 def scalar_value_from_type(type_: str, value: Any) -> BasicTypes:
     mapping: dict[str, Callable[[Any], Any]] = {
         "str": str,
@@ -6,7 +6,6 @@ from django.urls import reverse
 from django.views.generic.detail import SingleObjectMixin
 from flags.views import FlaggedViewMixin  # type: ignore[import-untyped]
 from jinja2 import DebugUndefined, Environment, TemplateError
-from markdownx.utils import markdownify
 
 from src.emails.controller import EmailController
 from src.emails.filters import EmailTemplateFilter, ScheduledEmailFilter
@@ -33,6 +32,7 @@ from src.emails.utils import (
     find_signal_by_name,
     jinjanify,
     person_from_request,
+    render_body_preview,
 )
 from src.workshops.base_forms import GenericDeleteForm
 from src.workshops.base_views import (
@@ -44,6 +44,7 @@ from src.workshops.base_views import (
     AMYUpdateView,
 )
 from src.workshops.utils.access import OnlyForAdminsMixin
+from src.workshops.utils.markdown import render_markdown
 
 
 class AllEmailTemplates(OnlyForAdminsMixin, FlaggedViewMixin, AMYListView[EmailTemplate]):  # type: ignore[misc]
@@ -66,7 +67,7 @@ class EmailTemplateDetails(OnlyForAdminsMixin, FlaggedViewMixin, AMYDetailView[E
     def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
         context = super().get_context_data(**kwargs)
         context["title"] = f'Email template "{self.object}"'
-        context["rendered_body"] = markdownify(self.object.body)  # type: ignore
+        context["rendered_body"] = render_markdown(self.object.body)
 
         signal = find_signal_by_name(self.object.signal, ALL_SIGNALS)
 
@@ -170,10 +171,7 @@ class ScheduledEmailDetails(OnlyForAdminsMixin, FlaggedViewMixin, AMYDetailView[
             body_context = {}
             context["rendered_context"] = f"Unable to render context: {exc}"
 
-        try:
-            context["rendered_body"] = markdownify(jinjanify(engine, self.object.body, body_context))  # type: ignore
-        except (TemplateError, AttributeError, ValueError, TypeError) as exc:
-            context["rendered_body"] = markdownify(f"Unable to render template: {exc}")  # type: ignore
+        context["rendered_body"] = render_body_preview(self.object.body, body_context)
 
         try:
             context["rendered_subject"] = jinjanify(engine, self.object.subject, body_context)
@@ -1,6 +1,9 @@
+import threading
+import time
 from datetime import date, timedelta
 
-from django.test import TestCase
+from django.db import connection, transaction
+from django.test import TestCase, TransactionTestCase
 
 from src.extrequests.tests.test_training_request import create_training_request
 from src.extrequests.utils import (
@@ -17,7 +20,7 @@ from src.extrequests.utils import (
 )
 from src.fiscal.models import Partnership, PartnershipTier
 from src.offering.models import Account, AccountBenefit, Benefit
-from src.workshops.models import Event, Membership, Organization, Role, Tag, Task
+from src.workshops.models import Event, Membership, Organization, Person, Role, Tag, Task
 from src.workshops.tests.base import TestBase
 
 
@@ -828,3 +831,89 @@ class TestGetAccountBenefitFromPartnership(TestBase):
         # Act & Assert
         with self.assertRaises(AccountBenefit.DoesNotExist):
             get_account_benefit_from_partnership(self.partnership, other_benefit)
+
+
+# Concurrent transactions can't run inside `TestCase` transaction.
+class TestGetAccountBenefitFromPartnershipConcurrently(TransactionTestCase):
+    def setUp(self) -> None:
+        self.host = Organization.objects.create(domain="example.org", fullname="Example")
+        account = Account.objects.create(
+            account_type=Account.AccountTypeChoices.ORGANISATION,
+            generic_relation=self.host,
+        )
+        self.benefit = Benefit.objects.create(name="Instructor Training", unit_type="seat", credits=1)
+        self.partnership = Partnership.objects.create(
+            name="Partner Org",
+            tier=PartnershipTier.objects.create(name="Standard", credits=10),
+            credits=10,
+            account=account,
+            registration_code="partner-test",
+            agreement_start=date.today(),
+            agreement_end=date.today() + timedelta(days=365),
+            agreement_link="https://example.com/agreement",
+            public_status="public",
+            partner_organisation=self.host,
+        )
+        self.benefit1 = AccountBenefit.objects.create(
+            account=account,
+            benefit=self.benefit,
+            partnership=self.partnership,
+            start_date=date.today() - timedelta(days=1),
+            end_date=date.today() + timedelta(days=365),
+            allocation=1,
+        )
+        self.benefit2 = AccountBenefit.objects.create(
+            account=account,
+            benefit=self.benefit,
+            partnership=self.partnership,
+            start_date=date.today(),
+            end_date=date.today() + timedelta(days=365),
+            allocation=5,
+        )
+        self.event = Event.objects.create(slug="test-training", host=self.host)
+        self.role = Role.objects.create(name="learner")
+
+    def test_last_allocation_is_not_taken_twice(self) -> None:
+        """A match running concurrently with another one that takes the last
+        allocation of an account benefit must wait and pick the next benefit."""
+        # Arrange
+        picked = threading.Event()
+        release = threading.Event()
+        results: dict[str, AccountBenefit] = {}
+
+        def match(name: str, wait_for_release: bool) -> None:
+            try:
+                with transaction.atomic():
+                    account_benefit = get_account_benefit_from_partnership(self.partnership, self.benefit)
+                    results[name] = account_benefit
+                    if wait_for_release:
+                        picked.set()
+                        release.wait(timeout=10)
+                    Task.objects.create(
+                        event=self.event,
+                        person=Person.objects.create(
+                            personal=name, family="Trainee", username=name, email=f"{name}@example.org"
+                        ),
+                        role=self.role,
+                        allocated_benefit=account_benefit,
+                    )
+            finally:
+                connection.close()
+
+        first = threading.Thread(target=match, args=("first", True))
+        second = threading.Thread(target=match, args=("second", False))
+
+        # Act
+        first.start()
+        self.assertTrue(picked.wait(timeout=10))
+        second.start()
+        # give the second match time to block on the lock held by the first one
+        time.sleep(0.5)
+        release.set()
+        first.join()
+        second.join()
+
+        # Assert
+        self.assertEqual(results["first"], self.benefit1)
+        self.assertEqual(results["second"], self.benefit2)
+        self.assertEqual(Task.objects.filter(allocated_benefit=self.benefit1).count(), 1)
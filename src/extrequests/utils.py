@@ -84,7 +84,7 @@ def account_benefit_code_valid(
     If there is no match, returns False with a detailed error.
     """
     try:
-        account_benefit = AccountBenefit.objects.get(registration_code=code)
+        account_benefit = AccountBenefit.objects.annotate_allocation_used().get(registration_code=code)
     except AccountBenefit.DoesNotExist:
         return False, f'No account benefit found for code "{code}".'
 
@@ -226,7 +226,8 @@ def get_account_benefit_warnings_after_match(benefit: AccountBenefit, event: Eve
     and start/end dates."""
     warnings = []
 
-    used = benefit.allocation_used()
+    # count again, as allocation was just used
+    used = AccountBenefit.objects.annotate_allocation_used().get(pk=benefit.pk).allocation_used()
     if used > benefit.allocation:
         warnings.append(
             f'The benefit "{benefit}" is exceeding ({used}) allocation ({benefit.allocation}).',
@@ -255,7 +256,16 @@ def get_account_benefit_warnings_after_match(benefit: AccountBenefit, event: Eve
 
 
 def get_account_benefit_from_partnership(partnership: Partnership, benefit: Benefit) -> AccountBenefit:
-    account_benefits = AccountBenefit.objects.filter(partnership=partnership, benefit=benefit).order_by("start_date")
+    """Returns the earliest account benefit with allocation remaining, or the latest
+    one if all of them are used up.
+
+    The account benefits stay locked until the end of current transaction, so
+    concurrent matches can't allocate the same remaining seat twice."""
+    account_benefits = (
+        AccountBenefit.objects.filter(partnership=partnership, benefit=benefit)
+        .order_by("start_date")
+        .lock_for_allocation()
+    )
     if not account_benefits:
         raise AccountBenefit.DoesNotExist(
             f'No account benefits found for partnership "{partnership}" and benefit "{benefit}".'
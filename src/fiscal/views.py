@@ -979,7 +979,8 @@ class PartnershipDetails(OnlyForAdminsMixin, FlaggedViewMixin, AMYDetailView[Par
         context["title"] = str(self.object)
         context["account_benefits"] = (
             AccountBenefit.objects.filter(partnership=self.object)
-            .select_related("benefit")
+            .annotate_allocation_used()
+            .select_related("benefit", "discount", "curriculum")
             .prefetch_related(
                 Prefetch("event_set", queryset=Event.objects.select_related("host")),
                 Prefetch("task_set", queryset=Task.objects.select_related("event", "person", "role")),
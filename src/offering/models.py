@@ -1,10 +1,12 @@
+from __future__ import annotations
+
 import uuid
 from datetime import date
 
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
 from django.db import models
-from django.db.models import Q
+from django.db.models import Case, Manager, OuterRef, Q, QuerySet, Value, When
 from django.urls import reverse
 from django.utils import timezone
 from reversion import revisions as reversion
@@ -13,6 +15,7 @@ from src.workshops.consts import STR_LONG, STR_LONGEST, STR_MED
 from src.workshops.mixins import ActiveMixin, CreatedUpdatedMixin
 from src.workshops.models import Curriculum, Event, Person, Task
 from src.workshops.utils.dates import human_daterange
+from src.workshops.utils.querysets import SubqueryCount
 
 
 @reversion.register
@@ -116,6 +119,35 @@ class AccountBenefitDiscount(CreatedUpdatedMixin, models.Model):
         return self.name
 
 
+class AccountBenefitQuerySet(QuerySet["AccountBenefit"]):
+    def annotate_allocation_used(self) -> AccountBenefitQuerySet:
+        """Count used allocation in the same query; it's read by `allocation_used()`."""
+        return self.annotate(
+            allocation_used_count=Case(
+                When(
+                    benefit__unit_type="seat",
+                    then=SubqueryCount(Task.objects.filter(allocated_benefit=OuterRef("pk"))),
+                ),
+                When(
+                    benefit__unit_type="event",
+                    then=SubqueryCount(Event.objects.filter(allocated_benefit=OuterRef("pk"))),
+                ),
+                default=Value(0),
+            )
+        )
+
+    def lock_for_allocation(self) -> list[AccountBenefit]:
+        """Lock account benefits until the end of current transaction and return
+        them with their current allocation usage.
+
+        Concurrent allocations from the same account benefits wait for each other,
+        so they can't both take the last remaining allocation. Rows are locked in
+        primary key order to avoid deadlocks, and usage is counted only after the
+        locks are acquired, so it includes allocations committed in the meantime."""
+        locked = [benefit.pk for benefit in self.select_for_update(of=("self",)).order_by("pk").only("pk")]
+        return list(self.filter(pk__in=locked).annotate_allocation_used())
+
+
 @reversion.register
 class AccountBenefit(CreatedUpdatedMixin, models.Model):
     """A single benefit purchased for an account."""
@@ -143,6 +175,8 @@ class AccountBenefit(CreatedUpdatedMixin, models.Model):
     allocation = models.PositiveIntegerField()
     frozen = models.BooleanField(default=False)
 
+    objects = Manager.from_queryset(AccountBenefitQuerySet)()
+
     @property
     def human_daterange(self) -> str:
         return human_daterange(self.start_date, self.end_date)
@@ -168,6 +202,9 @@ class AccountBenefit(CreatedUpdatedMixin, models.Model):
         return reverse("account-benefit-details", kwargs={"pk": self.pk})
 
     def allocation_used(self) -> int:
+        if hasattr(self, "allocation_used_count"):
+            return self.allocation_used_count  # type: ignore[no-any-return]
+
         if self.benefit.unit_type == "seat":
             return Task.objects.filter(allocated_benefit=self).count()
 
@@ -150,3 +150,63 @@ class TestAccountBenefit(TestCase):
 
         # Assert
         self.assertEqual(used_allocation, 1)
+
+    def test_annotate_allocation_used(self) -> None:
+        # Arrange
+        event_benefit = Benefit.objects.create(name="Benefit2", description="", unit_type="event", credits=1)
+        seat_account_benefit = AccountBenefit.objects.create(
+            account=self.partnership1.account,
+            benefit=self.benefit1,
+            start_date=date(2024, 1, 1),
+            end_date=date(2024, 12, 31),
+            allocation=10,
+        )
+        event_account_benefit = AccountBenefit.objects.create(
+            account=self.partnership1.account,
+            benefit=event_benefit,
+            start_date=date(2024, 1, 1),
+            end_date=date(2024, 12, 31),
+            allocation=10,
+        )
+        host = Organization.objects.all()[0]
+        role = Role.objects.create(name="learner")
+        event = Event.objects.create(slug="test-event", host=host, allocated_benefit=event_account_benefit)
+        Event.objects.create(slug="test-event2", host=host, allocated_benefit=event_account_benefit)
+        for i in range(3):
+            Task.objects.create(
+                allocated_benefit=seat_account_benefit,
+                event=event,
+                person=Person.objects.create(personal="Test", family=f"User{i}", email=f"test{i}@test.com"),
+                role=role,
+            )
+
+        # Act
+        with self.assertNumQueries(1):
+            annotated = {
+                account_benefit.pk: account_benefit.allocation_used()
+                for account_benefit in AccountBenefit.objects.annotate_allocation_used()
+            }
+
+        # Assert
+        self.assertEqual(annotated, {seat_account_benefit.pk: 3, event_account_benefit.pk: 2})
+        self.assertEqual(seat_account_benefit.allocation_used(), 3)
+        self.assertEqual(event_account_benefit.allocation_used(), 2)
+
+    def test_lock_for_allocation(self) -> None:
+        # Arrange
+        account_benefit = AccountBenefit.objects.create(
+            account=self.partnership1.account,
+            partnership=self.partnership1,
+            benefit=self.benefit1,
+            start_date=date(2024, 1, 1),
+            end_date=date(2024, 12, 31),
+            allocation=10,
+        )
+
+        # Act
+        with self.assertNumQueries(2):
+            locked = AccountBenefit.objects.filter(partnership=self.partnership1).lock_for_allocation()
+
+        # Assert
+        self.assertEqual(locked, [account_benefit])
+        self.assertEqual(locked[0].allocation_used_count, 0)  # type: ignore[attr-defined]
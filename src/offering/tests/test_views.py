@@ -1,12 +1,14 @@
 from datetime import date
 
+from django.db import connection
 from django.test import RequestFactory, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
-from src.fiscal.models import Partnership
-from src.offering.models import Account, AccountOwner
+from src.fiscal.models import Partnership, PartnershipTier
+from src.offering.models import Account, AccountBenefit, AccountOwner, Benefit
 from src.offering.views import AccountBenefitCreate
-from src.workshops.models import Organization, Person
+from src.workshops.models import Event, Organization, Person, Role, Task
 from src.workshops.tests.base import TestBase
 
 
@@ -179,3 +181,80 @@ class TestAccountBenefitCreateView(TestCase):
         self.assertTrue(result["disable_account"])
         self.assertTrue(result["disable_partnership"])
         self.assertTrue(result["disable_dates"])
+
+
+class TestAccountBenefitListView(TestBase):
+    def setUp(self) -> None:
+        super().setUp()
+        self._setUpSuperuser()
+        self._logSuperuserIn()
+        self.account = Account.objects.create(
+            account_type=Account.AccountTypeChoices.ORGANISATION,
+            generic_relation=self.org_alpha,
+        )
+        self.partnership = Partnership.objects.create(
+            name="Test Partnership",
+            tier=PartnershipTier.objects.create(name="Standard", credits=100),
+            credits=100,
+            account=self.account,
+            agreement_start=date(2025, 10, 24),
+            agreement_end=date(2026, 10, 23),
+            partner_organisation=self.org_alpha,
+        )
+        self.seat = Benefit.objects.create(name="Seat", unit_type="seat", credits=1)
+        self.event_benefit = Benefit.objects.create(name="Event", unit_type="event", credits=1)
+        self.learner = Role.objects.create(name="learner")
+
+    def add_account_benefits(self, count: int) -> None:
+        for i in range(count):
+            seat_benefit = AccountBenefit.objects.create(
+                account=self.account,
+                partnership=self.partnership,
+                benefit=self.seat,
+                start_date=date(2025, 10, 24),
+                end_date=date(2026, 10, 23),
+                allocation=10,
+            )
+            event_benefit = AccountBenefit.objects.create(
+                account=self.account,
+                benefit=self.event_benefit,
+                start_date=date(2025, 10, 24),
+                end_date=date(2026, 10, 23),
+                allocation=10,
+            )
+            event = Event.objects.create(slug=f"event-{i}", host=self.org_alpha, allocated_benefit=event_benefit)
+            Task.objects.create(event=event, person=self.hermione, role=self.learner, allocated_benefit=seat_benefit)
+
+    def count_queries(self) -> int:
+        with CaptureQueriesContext(connection) as ctx:
+            rv = self.client.get(reverse("account-benefit-list"))
+        self.assertEqual(rv.status_code, 200)
+        return len(ctx.captured_queries)
+
+    @override_settings(FLAGS={"SERVICE_OFFERING": [("boolean", True)]})
+    def test_number_of_queries_independent_of_account_benefits(self) -> None:
+        # Arrange
+        self.add_account_benefits(2)
+        self.count_queries()  # warm up caches, e.g. content types
+        few = self.count_queries()
+        self.add_account_benefits(10)
+
+        # Act
+        many = self.count_queries()
+
+        # Assert
+        self.assertEqual(many, few)
+
+    @override_settings(FLAGS={"SERVICE_OFFERING": [("boolean", True)]})
+    def test_allocation_used(self) -> None:
+        # Arrange
+        self.add_account_benefits(1)
+
+        # Act
+        rv = self.client.get(reverse("account-benefit-list"))
+
+        # Assert
+        self.assertEqual(
+            sorted(benefit.allocation_used() for benefit in rv.context["object_list"]),
+            [1, 1],
+        )
@@ -68,7 +68,8 @@ class AccountDetails(OnlyForAdminsMixin, FlaggedViewMixin, AMYDetailView[Account
         context["owners"] = AccountOwner.objects.filter(account=self.object).select_related("person")
         context["account_benefits"] = (
             AccountBenefit.objects.filter(account=self.object)
-            .select_related("benefit")
+            .annotate_allocation_used()
+            .select_related("benefit", "partnership", "discount", "curriculum")
             .prefetch_related(
                 Prefetch("event_set", queryset=Event.objects.select_related("host")),
                 Prefetch("task_set", queryset=Task.objects.select_related("event", "person", "role")),
@@ -291,7 +292,19 @@ class AccountBenefitList(OnlyForAdminsMixin, FlaggedViewMixin, AMYListView[Accou
     flag_name = REQUIRED_FLAG_NAME
     permission_required = ["offering.view_accountbenefit"]
     template_name = "offering/account_benefit_list.html"
-    queryset = AccountBenefit.objects.order_by("-created_at")
+    queryset = (
+        AccountBenefit.objects.annotate_allocation_used()
+        .select_related(
+            "account",
+            "partnership__tier",
+            "partnership__partner_consortium",
+            "benefit",
+            "discount",
+            "curriculum",
+        )
+        .prefetch_related("account__generic_relation")
+        .order_by("-created_at")
+    )
     title = "Account Benefits"
     filter_class = AccountBenefitFilter
 
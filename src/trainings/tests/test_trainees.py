@@ -2,8 +2,13 @@ from datetime import date, datetime
 from functools import partial
 from html import escape
 
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from reversion.models import Version
 
+from src.api.models import ChangeFeedEntry
 from src.trainings.filters import filter_trainees_by_instructor_status
 from src.trainings.models import Involvement
 from src.trainings.views import all_trainees_queryset
@@ -14,6 +19,7 @@ from src.workshops.models import (
     Person,
     Role,
     Tag,
+    Task,
     TrainingProgress,
     TrainingRequirement,
 )
@@ -157,6 +163,49 @@ class TestTraineesView(TestBase):
         }
         self.assertEqual(got, expected)
 
+    def test_bulk_add_progress__query_count_independent_of_trainees_count(self) -> None:
+        # Arrange
+        self.ttt_event.end = date(2018, 7, 15)
+        self.ttt_event.save()
+        learner = Role.objects.get(name="learner")
+        trainees = Person.objects.bulk_create(
+            Person(personal=f"Trainee{i}", family="Bulk", username=f"bulk_trainee_{i}", email=f"trainee{i}@example.org")
+            for i in range(510)
+        )
+        Task.objects.bulk_create(Task(person=trainee, event=self.ttt_event, role=learner) for trainee in trainees)
+
+        def post(trainees: list[Person]) -> int:
+            data = {
+                "trainees": [trainee.pk for trainee in trainees],
+                "requirement": self.training.pk,
+                "state": "p",
+                "event": self.ttt_event.pk,
+                "submit": "",
+            }
+            with CaptureQueriesContext(connection) as queries:
+                rv = self.client.post(reverse("all_trainees"), data)
+            self.assertEqual(rv.status_code, 302)
+            return len(queries)
+
+        # Act
+        queries_10_trainees = post(trainees[:10])
+        queries_500_trainees = post(trainees[10:])
+
+        # Assert
+        self.assertEqual(queries_10_trainees, queries_500_trainees)
+        self.assertEqual(
+            set(TrainingProgress.objects.filter(event=self.ttt_event).values_list("trainee", "state")),
+            {(trainee.pk, "p") for trainee in trainees},
+        )
+        progress_pks = {str(pk) for pk in TrainingProgress.objects.values_list("pk", flat=True)}
+        recorded_pks = set(
+            ChangeFeedEntry.objects.filter(
+                content_type=ContentType.objects.get_for_model(TrainingProgress), action="created"
+            ).values_list("object_pk", flat=True)
+        )
+        self.assertTrue(progress_pks <= recorded_pks)
+        self.assertEqual(Version.objects.get_for_model(TrainingProgress).count(), len(progress_pks))
+
     def test_bulk_add_progress__demo(self) -> None:
         # Arrange
         # create a pre-existing progress to ensure bulk adding doesn't interfere
@@ -444,7 +493,7 @@ class TestFilterTraineesByInstructorStatus(TestBase):
             # self.trainee2
             dict(
                 username="trainee2_trainee2",
-                is_instructor=4,
+                is_instructor=True,
                 passed_training=1,
                 passed_welcome=1,
                 passed_get_involved=1,
@@ -1,6 +1,20 @@
-from django.core.exceptions import ValidationError
+from collections.abc import Iterable
+from copy import copy
 
-from src.workshops.models import Event, Person, Task
+import reversion
+from django.core.exceptions import NON_FIELD_ERRORS, ValidationError
+
+from src.api.change_feed import record_bulk_create
+from src.workshops.models import Event, Person, Task, TrainingProgress
+
+
+def no_learner_task_error(trainee: Person, event: Event) -> ValidationError:
+    msg = (
+        "This progress cannot be created without a corresponding learner "
+        f"task. Trainee {trainee} does not have a learner task for "
+        f"event {event}."
+    )
+    return ValidationError(msg)
 
 
 def raise_validation_error_if_no_learner_task(trainee: Person, event: Event) -> None:
@@ -16,9 +30,59 @@ def raise_validation_error_if_no_learner_task(trainee: Person, event: Event) ->
         )
         return
     except Task.DoesNotExist as e:
-        msg = (
-            "This progress cannot be created without a corresponding learner "
-            f"task. Trainee {trainee} does not have a learner task for "
-            f"event {event}."
+        raise no_learner_task_error(trainee, event) from e
+
+
+def bulk_add_training_progress(
+    trainees: Iterable[Person], progress: TrainingProgress
+) -> tuple[list[TrainingProgress], list[ValidationError]]:
+    """Add copies of `progress` (with fields already validated, e.g. by a form) to
+    all trainees with a fixed number of queries.
+
+    Trainees without a learner task for the progress' event, or with an existing
+    progress for that event, are skipped; an error is returned for each of them."""
+    trainees = list(trainees)
+    event = progress.event
+
+    with_learner_task: set[int] = set()
+    with_progress_at_event: set[int] = set()
+    if event:
+        with_learner_task = set(
+            Task.objects.filter(person__in=trainees, event=event, role__name="learner").values_list(
+                "person_id", flat=True
+            )
+        )
+        with_progress_at_event = set(
+            TrainingProgress.objects.filter(trainee__in=trainees, event=event).values_list("trainee_id", flat=True)
         )
-        raise ValidationError(msg) from e
+
+    new_progresses: list[TrainingProgress] = []
+    errors: list[ValidationError] = []
+    for trainee in trainees:
+        if event and trainee.pk not in with_learner_task:
+            errors.append(no_learner_task_error(trainee, event))
+        elif event and trainee.pk in with_progress_at_event:
+            errors.append(
+                ValidationError(
+                    {
+                        NON_FIELD_ERRORS: [
+                            progress.unique_error_message(TrainingProgress, ("trainee", "event")),
+                            ValidationError(f"Trainee {trainee} already has a training progress for event {event}."),
+                        ]
+                    }
+                )
+            )
+        else:
+            new_progress = copy(progress)
+            new_progress.trainee = trainee
+            new_progresses.append(new_progress)
+
+    TrainingProgress.objects.bulk_create(new_progresses)
+
+    # `bulk_create()` doesn't send `post_save`
+    record_bulk_create(TrainingProgress, new_progresses)
+    if reversion.is_active():
+        for new_progress in new_progresses:
+            reversion.add_to_revision(new_progress)
+
+    return new_progresses, errors
@@ -1,20 +1,21 @@
 from typing import Any
 
 from django.contrib import messages
-from django.core.exceptions import ValidationError
-from django.db.models import Case, Count, F, IntegerField, Prefetch, QuerySet, Sum, When
+from django.db.models import Case, Count, Exists, F, IntegerField, OuterRef, Prefetch, QuerySet, When
 from django.http import HttpResponse
 from django.shortcuts import redirect, render
 from django.urls import reverse, reverse_lazy
 
 from src.emails.actions.exceptions import EmailStrategyException
 from src.emails.actions.instructor_training_completed_not_badged import (
+    find_training_completion_dates,
+    instructor_training_completed_not_badged_strategies,
     instructor_training_completed_not_badged_strategy,
     run_instructor_training_completed_not_badged_strategy,
 )
 from src.trainings.filters import TraineeFilter
 from src.trainings.forms import BulkAddTrainingProgressForm, TrainingProgressForm
-from src.trainings.utils import raise_validation_error_if_no_learner_task
+from src.trainings.utils import bulk_add_training_progress
 from src.workshops.base_forms import GenericDeleteForm
 from src.workshops.base_views import (
     AMYCreateView,
@@ -26,6 +27,7 @@ from src.workshops.base_views import (
     RedirectSupportMixin,
 )
 from src.workshops.models import (
+    Award,
     Badge,
     Event,
     Person,
@@ -175,12 +177,8 @@ def all_trainees_queryset() -> QuerySet[Person]:
             "trainingprogress_set__requirement",
         )
         .annotate(
-            is_instructor=Sum(
-                Case(
-                    When(badges__name=Badge.SINGLE_INSTRUCTOR_BADGE, then=1),
-                    default=0,
-                    output_field=IntegerField(),
-                )
+            is_instructor=Exists(
+                Award.objects.filter(person=OuterRef("pk"), badge__name=Badge.SINGLE_INSTRUCTOR_BADGE)
             ),
         )
         .order_by("family", "personal")
@@ -199,45 +197,27 @@ def all_trainees(request: AuthenticatedHttpRequest) -> HttpResponse:
         # Bulk add progress to selected trainees
         form = BulkAddTrainingProgressForm(request.POST)
         if form.is_valid():
-            errors = []
-            for trainee in form.cleaned_data["trainees"]:
+            event = form.cleaned_data["event"]
+            new_progresses, errors = bulk_add_training_progress(form.cleaned_data["trainees"], form.instance)
+
+            changed_trainees = [progress.trainee for progress in new_progresses]
+            strategies = instructor_training_completed_not_badged_strategies(changed_trainees)
+            training_completed_dates = {} if event and event.end else find_training_completion_dates(changed_trainees)
+            for trainee in changed_trainees:
                 try:
-                    event = form.cleaned_data["event"]
-                    raise_validation_error_if_no_learner_task(trainee, event)
-                    progress = TrainingProgress(
-                        trainee=trainee,
-                        requirement=form.cleaned_data["requirement"],
-                        involvement_type=form.cleaned_data["involvement_type"],
-                        state=form.cleaned_data["state"],
-                        event=event,
-                        url=form.cleaned_data["url"],
-                        date=form.cleaned_data["date"],
-                        notes=form.cleaned_data["notes"],
+                    run_instructor_training_completed_not_badged_strategy(
+                        strategies[trainee.pk],
+                        request=request,
+                        person=trainee,
+                        training_completed_date=(
+                            event.end if event and event.end else training_completed_dates.get(trainee.pk)
+                        ),
+                    )
+                except EmailStrategyException as exc:
+                    messages.error(
+                        request,
+                        f"Error when running instructor training completed strategy. {exc}",
                     )
-                    progress.full_clean()
-                    progress.save()
-
-                    try:
-                        run_instructor_training_completed_not_badged_strategy(
-                            instructor_training_completed_not_badged_strategy(trainee),
-                            request=request,
-                            person=trainee,
-                            training_completed_date=event.end if event else None,
-                        )
-                    except EmailStrategyException as exc:
-                        messages.error(
-                            request,
-                            f"Error when running instructor training completed strategy. {exc}",
-                        )
-
-                except ValidationError as e:
-                    unique_constraint_message = "Training progress with this Trainee and Training already exists."
-                    if unique_constraint_message in e.messages:
-                        msg = (
-                            f"Trainee {trainee} already has a training progress for event {form.cleaned_data['event']}."
-                        )
-                        e.error_dict["__all__"].append(ValidationError(msg))
-                    errors.append(e)
 
             if errors:
                 # build a user-friendly error set
@@ -245,9 +225,8 @@ def all_trainees(request: AuthenticatedHttpRequest) -> HttpResponse:
                     msg = " ".join(error.messages)
                     messages.error(request, msg)
 
-                changed_count = len(form.cleaned_data["trainees"]) - len(errors)
                 info_msg = (
-                    f"Changed progress of {changed_count} trainee(s). "
+                    f"Changed progress of {len(new_progresses)} trainee(s). "
                     f"{len(errors)} trainee(s) were skipped due to errors."
                 )
                 messages.info(request, info_msg)
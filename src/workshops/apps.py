@@ -49,3 +49,8 @@ class WorkshopsConfig(AppConfig):
             sender=TrainingRequest.previous_involvement.through,  # type: ignore[attr-defined]
         )
         from src.workshops import receivers  # noqa
+
+        # compute AMY version once per process instead of on every request
+        from src.workshops.utils.version import load_version
+
+        load_version()
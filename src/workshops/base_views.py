@@ -220,7 +220,9 @@ class AMYFormView(FormView[_F]):
 
 
 class AMYListView(ListView[_M]):
-    paginator_class = Paginator
+    # `EstimatedCountPaginator` or `NoCountPaginator` avoid counting all objects
+    # on every request
+    paginator_class: type[Paginator[_M]] = Paginator
     filter_class: type[FilterSet] | None = None
     queryset: QuerySet[_M] | None = None
     title: str | None = None
@@ -238,7 +240,7 @@ class AMYListView(ListView[_M]):
         else:
             self.filter = self.filter_class(self.get_filter_data(), super().get_queryset(), request=self.request)
             self.qs = self.filter.qs
-        paginated = get_pagination_items(self.request, self.qs)
+        paginated = get_pagination_items(self.request, self.qs, self.paginator_class)
         return paginated
 
     def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
@@ -1,7 +1,8 @@
-import airportsdata
 from airportsdata import Airport
 from django_countries import countries
 
+from src.workshops.utils.resources import iata_airports
+
 FEE_DETAILS_URL = "https://carpentries.org/workshops/#workshop-cost"
 
 STR_SHORT = 10  # length of short strings
@@ -10,7 +11,8 @@ STR_LONG = 100  # length of long strings
 STR_LONGEST = 255  # length of the longest strings
 STR_REG_KEY = 20  # length of Eventbrite registration key
 
-IATA_AIRPORTS = airportsdata.load("IATA")
+# loaded on first use
+IATA_AIRPORTS = iata_airports
 COUNTRIES = dict(countries)
 
 # Whitelist mapping for the `benefit` query parameter accepted by
@@ -1,21 +1,15 @@
-from pathlib import Path
-from typing import Any, cast
+from typing import Any
 
-import toml  # type: ignore[import-untyped]
 from django.conf import settings
 from django.http import HttpRequest
-from flags.sources import get_flags  # type: ignore[import-untyped]
+from django.utils.functional import SimpleLazyObject
 
-
-def read_version_from_toml() -> str:
-    pyproject_toml_file = Path(__file__).parent.parent.parent / "pyproject.toml"
-    data = toml.load(pyproject_toml_file)
-    return cast(str, data["project"]["version"])
+from src.workshops.utils.feature_flags import LazyFeatureFlags
+from src.workshops.utils.version import get_version
 
 
 def version(request: HttpRequest) -> dict[str, str]:
-    version = read_version_from_toml()
-    return {"amy_version": version}
+    return {"amy_version": get_version()}
 
 
 def site_banner(request: HttpRequest) -> dict[str, str]:
@@ -24,6 +18,10 @@ def site_banner(request: HttpRequest) -> dict[str, str]:
 
 
 def feature_flags_enabled(request: HttpRequest) -> dict[str, Any]:
-    flags = get_flags(request=request)
-    data = {"FEATURE_FLAGS_ENABLED": [flag for flag in flags.values() if flag.check_state(request=request) is True]}
+    # Flags are evaluated only if a template reads them.
+    feature_flags = LazyFeatureFlags(request)
+    data = {
+        "FEATURE_FLAGS": feature_flags,
+        "FEATURE_FLAGS_ENABLED": SimpleLazyObject(feature_flags.enabled),
+    }
     return data
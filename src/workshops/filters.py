@@ -1,11 +1,17 @@
 from collections.abc import Sequence
+from datetime import date, datetime, time, timedelta
 from typing import Any
 
 import django_filters
+import reversion
 from django.conf import settings
-from django.db.models import Model, Q, QuerySet
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import Exists, Model, OuterRef, Q, QuerySet
 from django.forms import Field, widgets
+from django.http import HttpRequest
+from django.utils import timezone
 from django_countries import Countries
+from reversion.models import Revision, Version
 
 from src.dashboard.models import Continent
 from src.workshops.fields import (
@@ -385,6 +391,61 @@ class BadgeAwardsFilter(AMYFilterSet):
         )
 
 
+def versioned_content_types(request: HttpRequest | None) -> QuerySet[ContentType]:
+    content_types = ContentType.objects.get_for_models(*reversion.get_registered_models())
+    return ContentType.objects.filter(pk__in=[content_type.pk for content_type in content_types.values()])
+
+
+class ChangesLogFilter(AMYFilterSet):
+    """Filters of the changes log. Date range is compared against whole days in
+    the current timezone, but as datetime bounds, so that the (date_created, id)
+    index can be used."""
+
+    user = django_filters.ModelChoiceFilter(
+        queryset=Person.objects.all(),
+        label="Changed by",
+        widget=ModelSelect2Widget(  # type: ignore[no-untyped-call]
+            data_view="person-lookup",
+            attrs=SELECT2_SIDEBAR,
+        ),
+    )
+    model = django_filters.ModelChoiceFilter(
+        queryset=versioned_content_types,
+        label="Changed object type",
+        method="filter_model",
+    )
+    changed_after = django_filters.DateFilter(label="Changed on or after", method="filter_changed_after")
+    changed_before = django_filters.DateFilter(label="Changed on or before", method="filter_changed_before")
+
+    class Meta:
+        model = Revision
+        fields = [
+            "user",
+            "model",
+            "changed_after",
+            "changed_before",
+        ]
+
+    @staticmethod
+    def start_of_day(day: date) -> datetime:
+        return timezone.make_aware(datetime.combine(day, time.min))
+
+    def filter_model(self, qs: QuerySet[Revision], n: str, v: ContentType | None) -> QuerySet[Revision]:
+        if v:
+            return qs.filter(Exists(Version.objects.filter(revision=OuterRef("pk"), content_type=v)))
+        return qs
+
+    def filter_changed_after(self, qs: QuerySet[Revision], n: str, v: date | None) -> QuerySet[Revision]:
+        if v:
+            return qs.filter(date_created__gte=self.start_of_day(v))
+        return qs
+
+    def filter_changed_before(self, qs: QuerySet[Revision], n: str, v: date | None) -> QuerySet[Revision]:
+        if v:
+            return qs.filter(date_created__lt=self.start_of_day(v + timedelta(days=1)))
+        return qs
+
+
 class WorkshopStaffFilter(AMYFilterSet):
     """Form for this filter is never showed up, instead a custom form
     (.forms.WorkshopStaffForm) is used. So there's no need to specify widgets
@@ -0,0 +1,219 @@
+from pathlib import Path
+from typing import Any
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import connection
+from django.test.utils import setup_test_environment, teardown_test_environment
+
+from src.workshops.models import Person
+from src.workshops.utils.benchmarks import (
+    SCENARIOS,
+    build_report,
+    compare_reports,
+    load_report,
+    run_scenarios,
+    run_scenarios_with_instrumentation,
+    save_report,
+    seed_benchmark_database,
+    template_scenarios,
+)
+
+BENCHMARK_DATABASE_NAME = "amy_benchmark"
+
+
+class Command(BaseCommand):
+    help = (
+        "Run benchmarks of the hottest views and API endpoints against a separate, "
+        "seeded Postgres database and write the results to a JSON report. "
+        "Static files must be collected beforehand (`manage.py collectstatic`)."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--scale",
+            type=int,
+            default=10,
+            help="Multiplier of the `fake_database` dataset size. Default: 10.",
+        )
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=12345,
+            help="Seed for the fake data generation. Default: 12345.",
+        )
+        parser.add_argument(
+            "--change-feed-rows",
+            type=int,
+            default=10_000,
+            help="Number of change feed entries to seed. Default: 10000.",
+        )
+        parser.add_argument(
+            "--revisions",
+            type=int,
+            default=10_000,
+            help="Number of revisions (changes log entries) to seed. Default: 10000.",
+        )
+        parser.add_argument(
+            "--comments",
+            type=int,
+            default=200,
+            help="Number of Markdown comments on the most commented person's page. Default: 200.",
+        )
+        parser.add_argument(
+            "--training-progresses",
+            type=int,
+            default=10_000,
+            help="Number of additional training progresses to seed. Default: 10000.",
+        )
+        parser.add_argument(
+            "--open-recruitments",
+            type=int,
+            default=2_000,
+            help="Number of upcoming events with open instructor recruitment to seed. Default: 2000.",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=5,
+            help="Number of timed requests per scenario. Default: 5.",
+        )
+        parser.add_argument(
+            "--scenario",
+            action="append",
+            dest="scenarios",
+            choices=[scenario.name for scenario in SCENARIOS],
+            help="Run only selected scenario(s). Can be used multiple times.",
+        )
+        parser.add_argument(
+            "--templates",
+            action="store_true",
+            help=(
+                "Instead of the regular scenarios, benchmark pages rendering the most templates, "
+                "each with cold (as in a freshly started worker) and warm template and fragment caches."
+            ),
+        )
+        parser.add_argument(
+            "--instrumentation",
+            action="store_true",
+            help=(
+                "Measure overhead of the instrumentation middleware: run scenarios with instrumentation "
+                "disabled and enabled, and compare them (use with --max-regression to set the threshold)."
+            ),
+        )
+        parser.add_argument(
+            "--output",
+            type=Path,
+            default=Path("benchmark_report.json"),
+            help="Path of the JSON report. Default: benchmark_report.json.",
+        )
+        parser.add_argument(
+            "--baseline",
+            type=Path,
+            default=None,
+            help="Path of a previous JSON report to compare the results against.",
+        )
+        parser.add_argument(
+            "--max-regression",
+            type=float,
+            default=None,
+            help=(
+                "Fail if median wall time of any scenario is slower than the baseline (or, with "
+                "--instrumentation, than the run without instrumentation) by this many percent."
+            ),
+        )
+        parser.add_argument(
+            "--keepdb",
+            action="store_true",
+            help="Keep the benchmark database between runs; data is seeded only if the database is empty.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        if settings.PROD_ENVIRONMENT:
+            raise CommandError("Benchmarks must not be run in production environment.")
+
+        scenarios = [
+            scenario for scenario in SCENARIOS if not options["scenarios"] or scenario.name in options["scenarios"]
+        ]
+        if options["templates"]:
+            scenarios = template_scenarios(scenarios)
+        if options["instrumentation"] and options["baseline"]:
+            raise CommandError("--instrumentation compares against a run without instrumentation, not --baseline.")
+        verbosity = options["verbosity"]
+        keepdb = options["keepdb"]
+
+        setup_test_environment()
+        connection.settings_dict.setdefault("TEST", {})["NAME"] = BENCHMARK_DATABASE_NAME
+        old_database_name = connection.settings_dict["NAME"]
+        connection.creation.create_test_db(verbosity=verbosity, autoclobber=True, serialize=False, keepdb=keepdb)
+
+        try:
+            if not Person.objects.exists():
+                self.stdout.write(f"Seeding benchmark database (scale={options['scale']}, seed={options['seed']})...")
+                seed_benchmark_database(
+                    scale=options["scale"],
+                    seed=options["seed"],
+                    change_feed_rows=options["change_feed_rows"],
+                    revisions=options["revisions"],
+                    comments=options["comments"],
+                    training_progresses=options["training_progresses"],
+                    open_recruitments=options["open_recruitments"],
+                )
+
+            self.stdout.write(f"Running {len(scenarios)} scenario(s)...")
+            if options["instrumentation"]:
+                uninstrumented_results = run_scenarios_with_instrumentation(
+                    scenarios, repeat=options["repeat"], enabled=False
+                )
+                results = run_scenarios_with_instrumentation(scenarios, repeat=options["repeat"], enabled=True)
+            else:
+                results = run_scenarios(scenarios, repeat=options["repeat"])
+        finally:
+            connection.creation.destroy_test_db(old_database_name, verbosity=verbosity, keepdb=keepdb)
+            teardown_test_environment()
+
+        for result in results:
+            self.stdout.write(
+                f"{result.name:<30} {result.status_code} "
+                f"median={result.wall_time_ms_median:>9.1f}ms "
+                f"cpu={result.cpu_time_ms_median:>9.1f}ms "
+                f"queries={result.query_count:>5} "
+                f"peak_memory={result.peak_memory_kb:>9.1f}KiB"
+            )
+
+        meta = {"scale": options["scale"], "seed": options["seed"], "repeat": options["repeat"]}
+        report = build_report(results, instrumentation=options["instrumentation"], **meta)
+        save_report(report, options["output"])
+        self.stdout.write(f"Report saved to {options['output']}.")
+
+        if options["instrumentation"]:
+            self.compare_with_baseline(
+                report,
+                build_report(uninstrumented_results, instrumentation=False, **meta),
+                "run without instrumentation",
+                options["max_regression"],
+            )
+        elif options["baseline"]:
+            self.compare_with_baseline(
+                report, load_report(options["baseline"]), str(options["baseline"]), options["max_regression"]
+            )
+
+    def compare_with_baseline(
+        self, report: dict[str, Any], baseline: dict[str, Any], baseline_name: str, max_regression: float | None
+    ) -> None:
+        comparisons = compare_reports(report, baseline)
+        regressions = []
+
+        self.stdout.write(f"Comparison with {baseline_name}:")
+        for comparison in comparisons:
+            self.stdout.write(
+                f"{comparison['name']:<30} "
+                f"median {comparison['baseline_wall_time_ms_median']:>9.1f}ms -> "
+                f"{comparison['wall_time_ms_median']:>9.1f}ms ({comparison['wall_time_change_pct']:+.1f}%), "
+                f"queries {comparison['baseline_query_count']} -> {comparison['query_count']}"
+            )
+            if max_regression is not None and comparison["wall_time_change_pct"] > max_regression:
+                regressions.append(comparison["name"])
+
+        if regressions:
+            raise CommandError(f"Performance regression above {max_regression}% in: {', '.join(regressions)}")
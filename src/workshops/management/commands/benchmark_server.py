@@ -0,0 +1,67 @@
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from src.workshops.utils.benchmarks import run_server_benchmark, save_report
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark gunicorn started with `config/gunicorn_config.py` with and without "
+        "preloading the application: startup time, latency of the first request of "
+        "each worker and total memory of all gunicorn processes. Uses the configured "
+        "(development) database and works on Linux only."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=4,
+            help="Number of gunicorn workers. Default: 4.",
+        )
+        parser.add_argument(
+            "--port",
+            type=int,
+            default=8765,
+            help="Port gunicorn listens on (at 127.0.0.1). Default: 8765.",
+        )
+        parser.add_argument(
+            "--path",
+            default="/account/login/",
+            help="Path of the requested page; it must not require logging in. Default: /account/login/.",
+        )
+        parser.add_argument(
+            "--output",
+            type=Path,
+            default=Path("server_benchmark_report.json"),
+            help="Path of the JSON report. Default: server_benchmark_report.json.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        if settings.PROD_ENVIRONMENT:
+            raise CommandError("Benchmarks must not be run in production environment.")
+
+        results = [
+            run_server_benchmark(name, preload, options["workers"], options["port"], options["path"])
+            for name, preload in (("no_preload", False), ("preload", True))
+        ]
+
+        for result in results:
+            self.stdout.write(
+                f"{result.name:<12} startup={result.startup_ms:>9.1f}ms "
+                f"first_request median={result.first_request_ms_median:>9.1f}ms "
+                f"max={result.first_request_ms_max:>9.1f}ms "
+                f"rss={result.total_rss_kb / 1024:>7.1f}MiB "
+                f"pss={result.total_pss_kb / 1024:>7.1f}MiB"
+            )
+
+        report = {
+            "meta": {"workers": options["workers"], "path": options["path"]},
+            "servers": {result.name: asdict(result) for result in results},
+        }
+        save_report(report, options["output"])
+        self.stdout.write(f"Report saved to {options['output']}.")
@@ -0,0 +1,23 @@
+import time
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError
+
+from src.workshops.utils.warmup import compile_templates
+
+
+class Command(BaseCommand):
+    help = "Compile all project templates, so that template syntax errors are found before any page is rendered."
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        start = time.perf_counter()
+        result = compile_templates()
+        duration = (time.perf_counter() - start) * 1000
+
+        for template_name, exc in result.errors.items():
+            self.stderr.write(f"{template_name}: {exc}")
+        if result.errors:
+            raise CommandError(f"{len(result.errors)} template(s) failed to compile.")
+
+        if options["verbosity"] > 0:
+            self.stdout.write(f"Compiled {len(result.compiled)} templates in {duration:.1f}ms.")
@@ -1,14 +1,19 @@
 import itertools
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
 from datetime import date, timedelta
 from random import choice, randint, random, uniform
 from random import sample as random_sample
+from random import seed as random_seed
 from typing import Any
 
+from django.contrib.auth.hashers import make_password
 from django.contrib.auth.models import Group
 from django.contrib.contenttypes.models import ContentType
 from django.core.management.base import BaseCommand, CommandParser
 from django.db import IntegrityError, transaction
+from django.db.models import Exists, Max, Min, Model, OuterRef
+from django.db.models.signals import ModelSignal, m2m_changed, post_save, pre_save
 from django.utils import timezone
 from django_countries import countries as Countries
 from faker import Faker
@@ -50,7 +55,15 @@ from src.workshops.models import (
     TrainingRequirement,
     WorkshopRequest,
 )
-from src.workshops.utils.usernames import create_username
+from src.workshops.utils.reports import reports_link
+from src.workshops.utils.usernames import create_username, normalize_name
+
+# Number of rows inserted with a single `bulk_create` in bulk mode.
+BULK_BATCH_SIZE = 1000
+
+# Hashing a password takes tens of milliseconds, so in bulk mode all fake admins
+# share a single password.
+BULK_ADMIN_PASSWORD = "fake-admin"
 
 
 def randbool(chances_of_true: float) -> bool:
@@ -69,6 +82,49 @@ def sample[T](population: Sequence[T], k: int | None = None) -> list[T]:
     return random_sample(population, k)
 
 
+@contextmanager
+def muted_signals(*signals: ModelSignal) -> Iterator[None]:
+    """Temporarily disconnect all receivers of given signals."""
+    saved_receivers = [(signal, signal.receivers) for signal in signals]
+    try:
+        for signal in signals:
+            signal.receivers = []
+            signal.sender_receivers_cache.clear()
+        yield
+    finally:
+        for signal, receivers in saved_receivers:
+            signal.receivers = receivers
+            signal.sender_receivers_cache.clear()
+
+
+def random_pk_window(model: type[Model], size: int) -> list[int]:
+    """Primary keys of up to `size` rows of the model, consecutive by primary key
+    and starting at a random one, so that random rows can be picked in bulk without
+    loading all keys into memory."""
+    bounds = model._default_manager.aggregate(min=Min("pk"), max=Max("pk"))
+    if bounds["min"] is None:
+        return []
+
+    pks = model._default_manager.order_by("pk").values_list("pk", flat=True)
+    window = list(pks.filter(pk__gte=randint(bounds["min"], bounds["max"]))[:size])
+    if len(window) < size:
+        # wrap around to the lowest keys
+        window += pks[: size - len(window)]
+    return window
+
+
+def airport_fields(airport_iata: str) -> dict[str, Any]:
+    """Airport data copied onto Person, same as in `Person.save()`."""
+    airport = IATA_AIRPORTS[airport_iata]
+    return {
+        "airport_iata": airport_iata,
+        "airport_country": airport["country"],
+        "airport_lat": airport["lat"],
+        "airport_lon": airport["lon"],
+        "airport_timezone": airport["tz"],
+    }
+
+
 class UniqueUrlProvider(BaseProvider):
     def __init__(self, *args: Any, **kwargs: Any):
         super().__init__(*args, **kwargs)
@@ -92,6 +148,9 @@ class Command(BaseCommand):
         super().__init__(*args, **kwargs)
         self.faker = Faker()
         self.faker.add_provider(UniqueUrlProvider)
+        # used only in bulk mode, see `populate_bulk`
+        self.batch_size = BULK_BATCH_SIZE
+        self.unique_numbers = itertools.count(1)
 
     def add_arguments(self, parser: CommandParser) -> None:
         parser.add_argument(
@@ -100,6 +159,27 @@ class Command(BaseCommand):
             default=None,
             help="Provide an initial seed for randomization mechanism.",
         )
+        parser.add_argument(
+            "--scale",
+            type=int,
+            default=1,
+            help="Multiply counts of generated objects by this factor.",
+        )
+        parser.add_argument(
+            "--bulk",
+            action="store_true",
+            default=False,
+            help=(
+                "Insert objects in batches with signals muted. Much faster for large "
+                f"--scale values. Fake admins get password '{BULK_ADMIN_PASSWORD}'."
+            ),
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=BULK_BATCH_SIZE,
+            help="Number of objects inserted at once in bulk mode.",
+        )
 
     def fake_roles(self) -> None:
         """Provide fixed roles."""
@@ -226,7 +306,26 @@ class Command(BaseCommand):
                 print(f"Error generating fake trainees: {e}")
 
     def fake_training_progresses(self, person: Person, training: Event) -> None:
-        for requirement in TrainingRequirement.objects.all():
+        TrainingProgress.objects.bulk_create(
+            self.build_fake_training_progresses(
+                person,
+                training,
+                requirements=list(TrainingRequirement.objects.all()),
+                involvements=list(Involvement.objects.all()),
+            )
+        )
+
+    def build_fake_training_progresses(
+        self,
+        person: Person,
+        training: Event,
+        *,
+        requirements: Sequence[TrainingRequirement],
+        involvements: Sequence[Involvement],
+    ) -> list[TrainingProgress]:
+        progresses: list[TrainingProgress] = []
+
+        for requirement in requirements:
             if randbool(0.4):
                 notes = ""
                 if "Get Involved" in requirement.name and randbool(0.5):
@@ -242,7 +341,7 @@ class Command(BaseCommand):
 
                 event = training if requirement.name == "Training" else None
                 if requirement.involvement_required:
-                    involvement_type = choice(Involvement.objects.all())
+                    involvement_type = choice(involvements)
                     date = (
                         self.faker.date_time_between(start_date="-5y").date()
                         if involvement_type.date_required
@@ -257,18 +356,22 @@ class Command(BaseCommand):
                     url = self.faker.url() if requirement.url_required else None
                     trainee_notes = ""
 
-                TrainingProgress.objects.create(
-                    trainee=person,
-                    requirement=requirement,
-                    involvement_type=involvement_type,
-                    state=state,
-                    event=event,
-                    url=url,
-                    date=date,
-                    trainee_notes=trainee_notes,
-                    notes=notes,
+                progresses.append(
+                    TrainingProgress(
+                        trainee=person,
+                        requirement=requirement,
+                        involvement_type=involvement_type,
+                        state=state,
+                        event=event,
+                        url=url,
+                        date=date,
+                        trainee_notes=trainee_notes,
+                        notes=notes,
+                    )
                 )
 
+        return progresses
+
     def fake_training_request(self, person_or_None: Person | None) -> None:
         if person_or_None is None:
             state = "p" if randbool(0.5) else "d"
@@ -282,13 +385,37 @@ class Command(BaseCommand):
             state = "a"
             person = person_or_None
 
+        registration_codes = [membership.registration_code or "" for membership in Membership.objects.all()]
+        req = self.build_fake_training_request(
+            state=state,
+            person=person_or_None,
+            applicant=person,
+            registration_codes=registration_codes,
+        )
+        req.save()
+        req.domains.set(sample(list(KnowledgeDomain.objects.all())))
+        req.previous_involvement.set(sample(list(Role.objects.all())))
+
+        if person_or_None is None:
+            person.delete()
+
+    def build_fake_training_request(
+        self,
+        *,
+        state: str,
+        person: Person | None,
+        applicant: Person,
+        registration_codes: Sequence[str],
+    ) -> TrainingRequest:
+        """Unsaved training request filled in with `applicant`'s data. `person` is
+        the matched person (if any)."""
         # registration code
         # default (empty code) is used 25% of the time
         registration_code = ""
         override_invalid_code = False
         if randbool(0.5):
             # 50% of the time, use an existing code
-            registration_code = choice(Membership.objects.all()).registration_code or ""
+            registration_code = choice(registration_codes)
         elif randbool(0.5):
             # 25% of the time, use an invalid code and the override
             registration_code = self.faker.city()
@@ -299,21 +426,21 @@ class Command(BaseCommand):
         eventbrite_url = ""
         if registration_code and randbool(0.5):
             eventbrite_url = f"https://eventbrite.com/fake-{self.faker.random_number(digits=12, fix_len=True)}"
-        req = TrainingRequest.objects.create(
+        return TrainingRequest(
             state=state,
-            person=person_or_None,
+            person=person,
             review_process="preapproved" if registration_code else "open",
             member_code=registration_code,
             member_code_override=override_invalid_code,
             eventbrite_url=eventbrite_url,
-            personal=person.personal,
+            personal=applicant.personal,
             middle="",
-            family=person.family,
-            email=person.email or "",
-            github=person.github,
+            family=applicant.family,
+            email=applicant.email or "",
+            github=applicant.github,
             occupation=occupation,
             occupation_other=self.faker.job() if occupation == "" else "",
-            affiliation=person.affiliation,
+            affiliation=applicant.affiliation,
             location=self.faker.city(),
             country=choice(Countries)[0],
             underresourced=randbool(0.6),
@@ -337,13 +464,25 @@ class Command(BaseCommand):
             max_travelling_frequency_other="",
             reason=self.faker.text(),
         )
-        req.domains.set(sample(list(KnowledgeDomain.objects.all())))
-        req.previous_involvement.set(sample(list(Role.objects.all())))
-
-        if person_or_None is None:
-            person.delete()
 
     def fake_person(self, *, is_instructor: bool, is_trainer: bool = False) -> Person:
+        person = Person.objects.create(**self.fake_person_fields())
+
+        awards, qualifications = self.build_fake_awards(
+            person,
+            instructor_badges=list(Badge.objects.instructor_badges()) if is_instructor else [],
+            lessons=list(Lesson.objects.all()) if is_instructor else [],
+            trainer_badge=Badge.objects.get(name="trainer") if is_trainer else None,
+        )
+        Award.objects.bulk_create(awards)
+        Qualification.objects.bulk_create(qualifications)
+
+        return person
+
+    def fake_person_fields(self, unique_number: int | None = None) -> dict[str, Any]:
+        """Fields of a fake person. When `unique_number` is provided, it's appended
+        to all unique fields, so no database lookups are needed to ensure their
+        uniqueness."""
         airport = choice(list(IATA_AIRPORTS.keys()))
 
         email = choice(
@@ -373,21 +512,28 @@ class Command(BaseCommand):
 
         social_username = self.faker.user_name()
 
-        username = create_username(personal_name, family_name) if randbool(0.6) else social_username
+        if unique_number is None:
+            username = create_username(personal_name, family_name) if randbool(0.6) else social_username
+            mastodon = self.faker.url() if randbool(0.5) else None
+        else:
+            social_username = f"{social_username}{unique_number}"
+            stem = normalize_name(family_name) + "_" + normalize_name(personal_name)
+            username = f"{stem}_{unique_number}" if randbool(0.6) else social_username
+            mastodon = f"{self.faker.url()}@{social_username}" if randbool(0.5) else None
+            local_part, domain = email.split("@")
+            email = f"{local_part}{unique_number}@{domain}"
 
         github = social_username
         twitter = social_username
         bluesky = f"@{social_username}.bsky.social"
-        mastodon = self.faker.url() if randbool(0.5) else None
         url = self.faker.url() if randbool(0.5) else ""
 
-        person = Person.objects.create(
+        return dict(
             personal=personal_name,
             family=family_name,
             email=email,
             gender=gender,
             gender_other=gender_other,
-            airport_iata=airport,
             twitter=twitter,
             bluesky=bluesky,
             mastodon=mastodon,
@@ -395,29 +541,37 @@ class Command(BaseCommand):
             url=url,
             username=username,
             country=choice(Countries)[0],
+            **airport_fields(airport),
         )
 
-        if is_instructor:
+    def build_fake_awards(
+        self,
+        person: Person,
+        *,
+        instructor_badges: Sequence[Badge],
+        lessons: Sequence[Lesson],
+        trainer_badge: Badge | None,
+    ) -> tuple[list[Award], list[Qualification]]:
+        """Unsaved awards and qualifications for a person. Instructor badges are
+        only given when `instructor_badges` is non-empty."""
+        awards: list[Award] = []
+        qualifications: list[Qualification] = []
+
+        if instructor_badges:
             # Add one or more instructor badges
-            awards = []
-            badges = sample(list(Badge.objects.instructor_badges()))
-            for badge in badges:
+            for badge in sample(instructor_badges):
                 date = self.faker.date_time_between(start_date="-5y").date()
                 awards.append(Award(person=person, badge=badge, awarded=date))
-            Award.objects.bulk_create(awards)
 
-            if randbool(0.75):
+            if lessons and randbool(0.75):
                 # Add one or more qualifications
-                Qualification.objects.bulk_create(
-                    Qualification(person=person, lesson=lesson) for lesson in sample(list(Lesson.objects.all()))
-                )
+                qualifications.extend(Qualification(person=person, lesson=lesson) for lesson in sample(lessons))
 
-        if is_trainer:
+        if trainer_badge:
             date = self.faker.date_time_between(start_date="-5y").date()
-            trainer = Badge.objects.get(name="trainer")
-            Award.objects.create(person=person, badge=trainer, awarded=date)
+            awards.append(Award(person=person, badge=trainer_badge, awarded=date))
 
-        return person
+        return awards, qualifications
 
     def fake_organizations(self, count: int = 10) -> None:
         """Add some organizations that host events."""
@@ -526,11 +680,6 @@ class Command(BaseCommand):
         add_tags: bool = True,
         future_date: bool = False,
     ) -> Event:
-        if future_date:
-            start = self.faker.date_time_between(start_date="now", end_date="+120d").date()
-        else:
-            start = self.faker.date_time_between(start_date="-120d").date()
-        city = self.faker.city().replace(" ", "-").lower()
         if self_organized:
             org = Organization.objects.get(domain="self-organized")
             administrator = org
@@ -543,14 +692,48 @@ class Command(BaseCommand):
         # simply clear database and rerun fake_database command
         # (python manage.py fake_database). Be aware that recreating a database
         # deletes all data in the existing database!
-        e = Event.objects.create(
-            slug=f"{start:%Y-%m-%d}-{city}",
+        e = self.build_fake_event(
+            host=org,
+            administrator=administrator,
+            location_data=location_data,
+            future_date=future_date,
+        )
+        e.save()
+        if add_tags:
+            e.tags.set(sample(list(Tag.objects.exclude(name="TTT")), 2))
+        return e
+
+    def build_fake_event(
+        self,
+        *,
+        host: Organization,
+        administrator: Organization | None,
+        location_data: bool,
+        future_date: bool,
+        unique_number: int | None = None,
+    ) -> Event:
+        """Unsaved event. When `unique_number` is provided, it's appended to slug and
+        URL instead of relying on faker for uniqueness."""
+        if future_date:
+            start = self.faker.date_time_between(start_date="now", end_date="+120d").date()
+        else:
+            start = self.faker.date_time_between(start_date="-120d").date()
+        city = self.faker.city().replace(" ", "-").lower()
+        slug = f"{start:%Y-%m-%d}-{city}"
+        if unique_number is None:
+            url = self.faker.unique_url()
+        else:
+            slug = f"{slug}-{unique_number}"
+            url = f"{self.faker.url()}{unique_number}/"
+
+        return Event(
+            slug=slug,
             start=start,
             end=start + timedelta(days=2),
-            url=self.faker.unique_url(),
-            host=org,
+            url=url,
+            host=host,
             administrator=administrator,
-            sponsor=org,
+            sponsor=host,
             # needed in order for event to be published
             country=choice(Countries)[0] if location_data else None,
             venue=self.faker.word().title() if location_data else "",
@@ -559,23 +742,26 @@ class Command(BaseCommand):
             longitude=uniform(0, 180) if location_data else None,
             metadata_changed=randbool(0.1),
         )
-        if add_tags:
-            e.tags.set(sample(list(Tag.objects.exclude(name="TTT")), 2))
-        return e
 
     def fake_tasks(self, count: int = 120) -> None:
         self.stdout.write(f"Generating {count} fake tasks...")
 
-        events = Event.objects.all()
-        persons = Person.objects.all()
-        roles = Role.objects.all()
-        all_possible = list(itertools.product(events, persons, roles))
+        events = list(Event.objects.all())
+        persons = list(Person.objects.all())
+        roles = list(Role.objects.all())
+        count = min(count, len(events) * len(persons) * len(roles))
+
+        # Draw unique (event, person, role) combinations without building their
+        # full cartesian product, which grows too fast for larger datasets.
+        combinations: set[tuple[int, int, int]] = set()
+        while len(combinations) < count:
+            combinations.add((randint(0, len(events) - 1), randint(0, len(persons) - 1), randint(0, len(roles) - 1)))
 
-        for event, person, role in sample(all_possible, count):
+        for event_idx, person_idx, role_idx in combinations:
             Task.objects.create(
-                event=event,
-                person=person,
-                role=role,
+                event=events[event_idx],
+                person=persons[person_idx],
+                role=roles[role_idx],
             )
 
     def fake_unmatched_training_requests(self, count: int = 20) -> None:
@@ -1132,34 +1318,390 @@ class Command(BaseCommand):
             allocation=1 if all_benefits[0].unit_type == "seat" else 5,
         )
 
-    def handle(self, *args: Any, **options: Any) -> None:
-        seed = options["seed"]
-        if seed is not None:
-            Faker.seed(seed)
+    # ------------------------------------------------------------
+    # Bulk mode: the most numerous objects are inserted in batches with
+    # `bulk_create` and with signals muted. `save()` overrides are not called
+    # either, so whatever they normally compute is set up front; rows normally
+    # created by signal receivers are added afterwards in set-based passes.
 
-        try:
+    def bulk_create_persons(
+        self,
+        count: int,
+        *,
+        instructor_chances: float,
+        is_trainer: bool = False,
+        is_admin: bool = False,
+    ) -> Iterator[list[Person]]:
+        """Insert `count` fake persons together with their awards and
+        qualifications. Yields each inserted batch of persons."""
+        instructor_badges = list(Badge.objects.instructor_badges())
+        lessons = list(Lesson.objects.all())
+        trainer_badge = Badge.objects.get(name="trainer") if is_trainer else None
+        group_ids = list(Group.objects.values_list("pk", flat=True))
+        admin_password = make_password(BULK_ADMIN_PASSWORD) if is_admin else ""
+        PersonGroup = Person.groups.through
+
+        for batch in itertools.batched(range(count), self.batch_size, strict=False):
+            persons = [Person(**self.fake_person_fields(unique_number=next(self.unique_numbers))) for _ in batch]
+            if is_admin:
+                for person in persons:
+                    person.is_active = True
+                    person.password = admin_password
+            Person.objects.bulk_create(persons)
+
+            awards: list[Award] = []
+            qualifications: list[Qualification] = []
+            for person in persons:
+                person_awards, person_qualifications = self.build_fake_awards(
+                    person,
+                    instructor_badges=instructor_badges if randbool(instructor_chances) else [],
+                    lessons=lessons,
+                    trainer_badge=trainer_badge,
+                )
+                awards.extend(person_awards)
+                qualifications.extend(person_qualifications)
+            Award.objects.bulk_create(awards)
+            Qualification.objects.bulk_create(qualifications)
+
+            if is_admin:
+                PersonGroup.objects.bulk_create(
+                    PersonGroup(person_id=person.pk, group_id=choice(group_ids)) for person in persons
+                )
+
+            yield persons
+
+    def bulk_fake_instructors(self, count: int = 30) -> None:
+        self.stdout.write(f"Generating {count} fake instructors in bulk...")
+        for _ in self.bulk_create_persons(count, instructor_chances=1.0):
+            pass
+
+    def bulk_fake_trainers(self, count: int = 10) -> None:
+        self.stdout.write(f"Generating {count} fake trainers in bulk...")
+        for _ in self.bulk_create_persons(count, instructor_chances=1.0, is_trainer=True):
+            pass
+
+    def bulk_fake_admins(self, count: int = 10) -> None:
+        self.stdout.write(f"Generating {count} fake admins in bulk (password: {BULK_ADMIN_PASSWORD})...")
+        for _ in self.bulk_create_persons(count, instructor_chances=0.5, is_admin=True):
+            pass
+
+    def bulk_fake_organizations(self, count: int = 10) -> None:
+        self.stdout.write(f"Generating {count} fake organizations in bulk...")
+
+        for batch in itertools.batched(range(count), self.batch_size, strict=False):
+            organizations = []
+            for _ in batch:
+                unique_number = next(self.unique_numbers)
+                organizations.append(
+                    Organization(
+                        domain=f"org{unique_number}.{self.faker.domain_name()}",
+                        fullname=f"{self.faker.company()} {unique_number}",
+                        country=choice(Countries)[0],
+                    )
+                )
+            Organization.objects.bulk_create(organizations)
+
+    def bulk_fake_memberships(self, count: int = 10) -> None:
+        self.stdout.write(f"Generating {count} fake memberships in bulk...")
+
+        organization_ids = list(Organization.objects.values_list("pk", flat=True))
+        member_role_ids = list(MemberRole.objects.values_list("pk", flat=True))
+
+        for batch in itertools.batched(range(count), self.batch_size, strict=False):
+            memberships: list[Membership] = []
+            members: list[Member] = []
+            for _ in batch:
+                start = self.faker.date_time_between(start_date="-5y").date()
+                organization_count = randint(1, 4)
+                name = self.faker.company()
+                membership = Membership(
+                    name=name,
+                    consortium=organization_count > 1,
+                    variant=choice(Membership.MEMBERSHIP_CHOICES)[0],
+                    agreement_start=start,
+                    agreement_end=start + timedelta(days=365),
+                    contribution_type=choice(Membership.CONTRIBUTION_CHOICES)[0],
+                    registration_code=name[:5] + str(next(self.unique_numbers)),
+                    workshops_without_admin_fee_per_agreement=randint(5, 15),
+                    public_instructor_training_seats=randint(5, 15),
+                    inhouse_instructor_training_seats=randint(5, 15),
+                )
+                memberships.append(membership)
+                members.extend(
+                    Member(membership=membership, organization_id=organization_id, role_id=choice(member_role_ids))
+                    for organization_id in sample(organization_ids, organization_count)
+                )
+
+            Membership.objects.bulk_create(memberships)
+            Member.objects.bulk_create(members)
+
+    def bulk_fake_events(
+        self,
+        count: int,
+        kind: str,
+        *,
+        location_data: bool = True,
+        self_organized: bool = False,
+        future_date: bool = False,
+        ttt: bool = False,
+    ) -> None:
+        self.stdout.write(f"Generating {count} fake {kind} events in bulk...")
+
+        tags = list(Tag.objects.exclude(name="TTT"))
+        ttt_tag = Tag.objects.get(name="TTT")
+        self_organized_org = Organization.objects.get(domain="self-organized")
+        carpentries_org = Organization.objects.get(domain="carpentries.org")
+        hosts = list(Organization.objects.exclude(domain="self-organized"))
+        EventTag = Event.tags.through
+
+        for batch in itertools.batched(range(count), self.batch_size, strict=False):
+            events = []
+            for _ in batch:
+                if self_organized:
+                    host, administrator = self_organized_org, self_organized_org
+                else:
+                    host, administrator = choice(hosts), (carpentries_org if ttt else None)
+
+                event = self.build_fake_event(
+                    host=host,
+                    administrator=administrator,
+                    location_data=location_data,
+                    future_date=future_date,
+                    unique_number=next(self.unique_numbers),
+                )
+                if ttt:
+                    event.slug += "-ttt"
+
+                # same as in `Event.save()`
+                if event.country == "W3":
+                    event.venue = "Internet"
+                    event.address = "Internet"
+                    event.latitude = None
+                    event.longitude = None
+                event.instructors_pre = reports_link(event.slug)
+
+                events.append(event)
+
+            Event.objects.bulk_create(events)
+            EventTag.objects.bulk_create(
+                EventTag(event_id=event.pk, tag_id=tag.pk)
+                for event in events
+                for tag in ([ttt_tag] if ttt else sample(tags, 2))
+            )
+
+    def bulk_fake_tasks(self, count: int = 120) -> None:
+        """Tasks of random persons in random events, generated and inserted one batch
+        at a time; persons and events of each batch are picked from a random window
+        of their primary keys. Randomly repeated tasks are skipped by the database,
+        so slightly fewer than `count` tasks may be created."""
+        self.stdout.write(f"Generating {count} fake tasks in bulk...")
+
+        role_ids = list(Role.objects.values_list("pk", flat=True))
+        if not role_ids:
+            return
+
+        for batch in itertools.batched(range(count), self.batch_size, strict=False):
+            event_ids = random_pk_window(Event, self.batch_size)
+            person_ids = random_pk_window(Person, self.batch_size)
+            if not event_ids or not person_ids:
+                return
+            Task.objects.bulk_create(
+                (
+                    Task(event_id=choice(event_ids), person_id=choice(person_ids), role_id=choice(role_ids))
+                    for _ in batch
+                ),
+                ignore_conflicts=True,
+            )
+
+    def bulk_create_training_requests(
+        self,
+        requests: list[TrainingRequest],
+        *,
+        knowledge_domain_ids: Sequence[int],
+        role_ids: Sequence[int],
+    ) -> None:
+        """Insert training requests with random domains and previous involvement.
+        `score_auto` is calculated later in
+        `bulk_recalculate_training_request_scores`."""
+        TrainingRequest.objects.bulk_create(requests)
+
+        RequestDomain = TrainingRequest.domains.through
+        RequestDomain.objects.bulk_create(
+            RequestDomain(trainingrequest_id=request.pk, knowledgedomain_id=domain_id)
+            for request in requests
+            for domain_id in sample(knowledge_domain_ids)
+        )
+        RequestInvolvement = TrainingRequest.previous_involvement.through
+        RequestInvolvement.objects.bulk_create(
+            RequestInvolvement(trainingrequest_id=request.pk, role_id=role_id)
+            for request in requests
+            for role_id in sample(role_ids)
+        )
+
+    def bulk_fake_trainees(self, count: int = 30) -> None:
+        self.stdout.write(
+            f"Generating {count} fake trainees (and their training progresses and training requests) in bulk..."
+        )
+
+        trainings = list(Event.objects.ttt())
+        learner = Role.objects.get(name="learner")
+        requirements = list(TrainingRequirement.objects.all())
+        involvements = list(Involvement.objects.all())
+        registration_codes = [code or "" for code in Membership.objects.values_list("registration_code", flat=True)]
+        knowledge_domain_ids = list(KnowledgeDomain.objects.values_list("pk", flat=True))
+        role_ids = list(Role.objects.values_list("pk", flat=True))
+
+        for persons in self.bulk_create_persons(count, instructor_chances=0.1):
+            tasks: list[Task] = []
+            requests: list[TrainingRequest] = []
+            progresses: list[TrainingProgress] = []
+
+            for person in persons:
+                training = choice(trainings)
+                tasks.append(Task(person=person, event=training, role=learner))
+                requests.append(
+                    self.build_fake_training_request(
+                        state="a",
+                        person=person,
+                        applicant=person,
+                        registration_codes=registration_codes,
+                    )
+                )
+                progresses.extend(
+                    self.build_fake_training_progresses(
+                        person,
+                        training,
+                        requirements=requirements,
+                        involvements=involvements,
+                    )
+                )
+
+            Task.objects.bulk_create(tasks, ignore_conflicts=True)
+            self.bulk_create_training_requests(
+                requests,
+                knowledge_domain_ids=knowledge_domain_ids,
+                role_ids=role_ids,
+            )
+            TrainingProgress.objects.bulk_create(progresses)
+
+    def bulk_fake_unmatched_training_requests(self, count: int = 20) -> None:
+        self.stdout.write(f"Generating {count} fake unmatched training requests in bulk...")
+
+        registration_codes = [code or "" for code in Membership.objects.values_list("registration_code", flat=True)]
+        knowledge_domain_ids = list(KnowledgeDomain.objects.values_list("pk", flat=True))
+        role_ids = list(Role.objects.values_list("pk", flat=True))
+
+        for batch in itertools.batched(range(count), self.batch_size, strict=False):
+            requests = [
+                self.build_fake_training_request(
+                    state="p" if randbool(0.5) else "d",
+                    person=None,
+                    # applicant is never saved
+                    applicant=Person(**self.fake_person_fields(unique_number=next(self.unique_numbers))),
+                    registration_codes=registration_codes,
+                )
+                for _ in batch
+            ]
+            self.bulk_create_training_requests(
+                requests,
+                knowledge_domain_ids=knowledge_domain_ids,
+                role_ids=role_ids,
+            )
+
+    def bulk_fake_duplicated_people(self, count: int = 5) -> None:
+        self.stdout.write(f"Generating {count} fake people duplications in bulk...")
+
+        person_ids = list(Person.objects.values_list("pk", flat=True))
+
+        for batch in itertools.batched(sample(person_ids, min(count, len(person_ids))), self.batch_size, strict=False):
+            persons = list(Person.objects.filter(pk__in=batch))
+            for person in persons:
+                person.pk = None
+                unique_number = next(self.unique_numbers)
+
+                # avoid integrity errors due to unique constraints
+                person.username = (
+                    normalize_name(person.family or "") + "_" + normalize_name(person.personal) + f"_{unique_number}"
+                )
+                person.twitter = None
+                person.bluesky = None
+                person.mastodon = None
+                person.github = None
+                local_part, domain = self.faker.email().split("@")
+                person.email = f"{local_part}{unique_number}@{domain}"
+
+            Person.objects.bulk_create(persons)
+
+    def bulk_fake_consents(self) -> None:
+        """Consent with a random option to every active term, for each person
+        without an active consent. In normal mode unset consents are created by a
+        receiver when a person is added, and then replaced in `fake_consents`."""
+        self.stdout.write("Generating fake consents in bulk...")
+
+        for term in Term.objects.active().prefetch_active_options():
+            options = list(term.options)  # type: ignore[attr-defined]
+            person_ids = (
+                Person.objects.filter(
+                    ~Exists(Consent.objects.active().filter(person=OuterRef("pk"), term=term)),
+                )
+                .values_list("pk", flat=True)
+                .iterator(chunk_size=self.batch_size)
+            )
+            for batch in itertools.batched(person_ids, self.batch_size, strict=False):
+                Consent.objects.bulk_create(
+                    Consent(person_id=person_id, term=term, term_option=choice(options)) for person_id in batch
+                )
+
+    def bulk_recalculate_training_request_scores(self) -> None:
+        """Calculate `score_auto`, normally done in `TrainingRequest.save()` and
+        `m2m_changed` receiver."""
+        self.stdout.write("Calculating automatic scores of training requests in bulk...")
+
+        requests = (
+            TrainingRequest.objects.order_by("pk")
+            .prefetch_related("domains", "previous_involvement")
+            .iterator(chunk_size=self.batch_size)
+        )
+        for batch in itertools.batched(requests, self.batch_size, strict=False):
+            for request in batch:
+                request.score_auto = request.recalculate_score_auto()
+            TrainingRequest.objects.bulk_update(batch, ["score_auto"])
+
+    def populate_bulk(self, scale: int = 1, batch_size: int = BULK_BATCH_SIZE) -> None:
+        """Generate the same fake dataset as `populate()`, but insert the most
+        numerous objects in batches of `batch_size`, with signals muted."""
+        self.batch_size = batch_size
+        # appended to unique fields; offset by existing rows, so that generating
+        # data into a non-empty database is less likely to hit unique constraints
+        self.unique_numbers = itertools.count(
+            Person.objects.count() + Event.objects.count() + Organization.objects.count() + Membership.objects.count()
+        )
+
+        with muted_signals(pre_save, post_save, m2m_changed):
             self.fake_groups()
             self.fake_roles()
             self.fake_tags()
-            self.fake_instructors()
-            self.fake_trainers()
-            self.fake_admins()
-            self.fake_organizations()
+
+            self.bulk_fake_instructors(30 * scale)
+            self.bulk_fake_trainers(10 * scale)
+            self.bulk_fake_admins(10 * scale)
+            self.bulk_fake_organizations(10 * scale)
             self.real_organizations()
             self.fake_membership_person_roles()
-            self.fake_memberships()
-            self.fake_current_events()
-            self.fake_unpublished_events()
-            self.fake_self_organized_events()
-            self.fake_ttt_events()
-            self.fake_tasks()
-            self.fake_trainees()
-            self.fake_unmatched_training_requests()
-            self.fake_duplicated_people()
-            self.fake_workshop_requests()
-            self.fake_workshop_inquiries()
-            self.fake_selforganised_submissions()
-            self.fake_consents()
+            self.bulk_fake_memberships(10 * scale)
+
+            self.bulk_fake_events(5 * scale, "current", future_date=True)
+            self.bulk_fake_events(5 * scale, "unpublished", location_data=False)
+            self.bulk_fake_events(5 * scale, "self organized", self_organized=True)
+            self.bulk_fake_events(10 * scale, "train-the-trainer", ttt=True)
+
+            self.bulk_fake_tasks(120 * scale)
+            self.bulk_fake_trainees(30 * scale)
+            self.bulk_fake_unmatched_training_requests(20 * scale)
+            self.bulk_fake_duplicated_people(5 * scale)
+            self.fake_workshop_requests(10 * scale)
+            self.fake_workshop_inquiries(10 * scale)
+            self.fake_selforganised_submissions(10 * scale)
             recruitments = self.fake_instructor_recruitments()
             self.fake_instructor_recruitment_signups(recruitments)
 
@@ -1168,10 +1710,62 @@ class Command(BaseCommand):
             self.fake_partnerships()
 
             self.fake_accounts()
-            # self.fake_account_owners()
             self.fake_benefits()
             self.fake_account_benefit_discounts()
             self.fake_account_benefits()
+
+            self.bulk_fake_consents()
+            self.bulk_recalculate_training_request_scores()
+
+    def populate(self, scale: int = 1) -> None:
+        """Generate the whole fake dataset. Counts of generated objects are
+        multiplied by `scale`."""
+        self.fake_groups()
+        self.fake_roles()
+        self.fake_tags()
+        self.fake_instructors(30 * scale)
+        self.fake_trainers(10 * scale)
+        self.fake_admins(10 * scale)
+        self.fake_organizations(10 * scale)
+        self.real_organizations()
+        self.fake_membership_person_roles()
+        self.fake_memberships(10 * scale)
+        self.fake_current_events(5 * scale)
+        self.fake_unpublished_events(5 * scale)
+        self.fake_self_organized_events(5 * scale)
+        self.fake_ttt_events(10 * scale)
+        self.fake_tasks(120 * scale)
+        self.fake_trainees(30 * scale)
+        self.fake_unmatched_training_requests(20 * scale)
+        self.fake_duplicated_people(5 * scale)
+        self.fake_workshop_requests(10 * scale)
+        self.fake_workshop_inquiries(10 * scale)
+        self.fake_selforganised_submissions(10 * scale)
+        self.fake_consents()
+        recruitments = self.fake_instructor_recruitments()
+        self.fake_instructor_recruitment_signups(recruitments)
+
+        self.fake_partnership_tiers()
+        self.fake_consortiums()
+        self.fake_partnerships()
+
+        self.fake_accounts()
+        # self.fake_account_owners()
+        self.fake_benefits()
+        self.fake_account_benefit_discounts()
+        self.fake_account_benefits()
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        seed = options["seed"]
+        if seed is not None:
+            Faker.seed(seed)
+            random_seed(seed)
+
+        try:
+            if options["bulk"]:
+                self.populate_bulk(scale=options["scale"], batch_size=options["batch_size"])
+            else:
+                self.populate(scale=options["scale"])
         except IntegrityError as e:
             print("!!!" * 10)
             print("Delete the database, and rerun this script.")
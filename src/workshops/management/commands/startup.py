@@ -0,0 +1,100 @@
+import importlib.util
+import pkgutil
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from django.apps import apps
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import connection
+from django.db.migrations.loader import MigrationLoader
+from django.db.migrations.recorder import MigrationRecorder
+
+
+def migrations_on_disk() -> set[tuple[str, str]]:
+    """(app label, migration name) of migration files of all installed apps.
+
+    Migration modules are found the same way `MigrationLoader` finds them, but
+    they aren't imported, so it's much cheaper than building the migration graph."""
+    migrations: set[tuple[str, str]] = set()
+    for app_config in apps.get_app_configs():
+        module_name, _ = MigrationLoader.migrations_module(app_config.label)
+        try:
+            spec = importlib.util.find_spec(module_name) if module_name else None
+        except ModuleNotFoundError:
+            spec = None
+        if spec is None or not spec.submodule_search_locations:
+            continue
+
+        for module in pkgutil.iter_modules(spec.submodule_search_locations):
+            if not module.ispkg and module.name[0] not in "_~":
+                migrations.add((app_config.label, module.name))
+    return migrations
+
+
+def unapplied_migrations() -> set[tuple[str, str]]:
+    """Migrations present on disk, but not recorded as applied in the database."""
+    applied = MigrationRecorder(connection).applied_migrations()
+    return migrations_on_disk() - set(applied)
+
+
+class Command(BaseCommand):
+    help = (
+        "Run system checks, compile templates, create cache tables and apply migrations "
+        "in a single process. Migrations are skipped if all migration files are already "
+        "recorded as applied in the database."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--force-migrate",
+            action="store_true",
+            help="Run migrations even if all of them are already applied.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        verbosity = options["verbosity"]
+        self.timings: dict[str, float] = {}
+
+        # system checks and template compilation don't use the database, so they
+        # run alongside database phases
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            check = executor.submit(self.run_phase, "check", self.check_in_thread)
+            templates = executor.submit(
+                self.run_phase,
+                "compile_templates",
+                lambda: call_command("compile_templates", verbosity=0, stdout=self.stdout),
+            )
+            self.run_phase(
+                "createcachetable",
+                lambda: call_command("createcachetable", verbosity=verbosity, stdout=self.stdout),
+            )
+            self.run_phase("migrate", lambda: self.migrate(options["force_migrate"], verbosity))
+            # re-raise `SystemCheckError` and `CommandError` of template compilation
+            check.result()
+            templates.result()
+
+        for phase, duration in self.timings.items():
+            self.stdout.write(f"{phase:<20} {duration:>9.1f}ms")
+
+    def run_phase(self, name: str, phase: Callable[[], Any]) -> None:
+        start = time.perf_counter()
+        try:
+            phase()
+        finally:
+            self.timings[name] = (time.perf_counter() - start) * 1000
+
+    def check_in_thread(self) -> None:
+        try:
+            call_command("check", fail_level="WARNING", stdout=self.stdout)
+        finally:
+            connection.close()
+
+    def migrate(self, force: bool, verbosity: int) -> None:
+        if not force and not unapplied_migrations():
+            self.stdout.write("All migrations are already applied, skipping migrations.")
+            return
+
+        call_command("migrate", interactive=False, verbosity=verbosity, stdout=self.stdout)
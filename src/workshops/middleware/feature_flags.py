@@ -13,6 +13,11 @@ class SaveSessionFeatureFlagMiddleware:
         self.get_response = get_response
 
     def __call__(self, request: HttpRequest) -> HttpResponse:
+        # `parameter` conditions can only be met by query parameters, so there's no
+        # need to evaluate flags for requests without them.
+        if not request.GET:
+            return self.get_response(request)
+
         flags = get_flags(request=request)
         parameter_conditions = self.conditions_of_type(flags, type="parameter")
 
@@ -50,10 +55,14 @@ class SaveSessionFeatureFlagMiddleware:
 
     @staticmethod
     def enable_feature_flag(request: HttpRequest, flag_name: str) -> None:
-        """Set a feature flag in the session."""
-        request.session[flag_name] = True
+        """Set a feature flag in the session. Session is only modified (and therefore
+        saved) if the value changes."""
+        if request.session.get(flag_name) is not True:
+            request.session[flag_name] = True
 
     @staticmethod
     def disable_feature_flag(request: HttpRequest, flag_name: str) -> None:
-        """Set a feature flag in the session."""
-        request.session[flag_name] = False
+        """Unset a feature flag in the session. Session is only modified (and therefore
+        saved) if the value changes."""
+        if request.session.get(flag_name) is not False:
+            request.session[flag_name] = False
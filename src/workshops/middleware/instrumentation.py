@@ -0,0 +1,54 @@
+import json
+import logging
+import time
+from collections.abc import Callable
+from dataclasses import asdict
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connection
+from django.http import HttpRequest, HttpResponse
+
+from src.workshops.utils.instrumentation import QueryCounter, RequestMetrics, metrics_registry
+
+logger = logging.getLogger("amy")
+
+UNRESOLVED_VIEW_NAME = "<unresolved>"
+
+
+class InstrumentationMiddleware:
+    """Measure wall time, number of SQL queries, SQL time and duplicated queries
+    for each request.
+
+    Metrics are logged, returned in `Server-Timing` header and aggregated per view
+    in `metrics_registry`. Enabled with `INSTRUMENTATION_ENABLED` setting."""
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        if not settings.INSTRUMENTATION_ENABLED:
+            raise MiddlewareNotUsed()
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        counter = QueryCounter()
+        start = time.perf_counter()
+
+        with connection.execute_wrapper(counter):
+            response = self.get_response(request)
+
+        duration = time.perf_counter() - start
+
+        resolver_match = getattr(request, "resolver_match", None)
+        metrics = RequestMetrics(
+            view_name=resolver_match.view_name if resolver_match else UNRESOLVED_VIEW_NAME,
+            method=request.method or "",
+            status=response.status_code,
+            duration_ms=duration * 1000,
+            query_count=counter.count,
+            query_duration_ms=counter.duration * 1000,
+            duplicate_queries=counter.duplicates,
+        )
+
+        metrics_registry.record(metrics)
+        logger.info(f"request_metrics {json.dumps(asdict(metrics))}")
+        response["Server-Timing"] = metrics.server_timing()
+        return response
@@ -1,14 +1,23 @@
+from collections.abc import Callable
+
 from django.http import HttpRequest, HttpResponse
-from django.utils.deprecation import MiddlewareMixin
 
-from src.workshops.context_processors import read_version_from_toml
+from src.workshops.utils.version import get_version
+
+VERSION_PATH = "/version/"
 
 
-class VersionCheckMiddleware(MiddlewareMixin):
+class VersionCheckMiddleware:
     """To work around issues with ALLOWED_HOSTS and load balancer pinging Django,
-    this middleware is run before ALLOWED_HOSTS kicks in."""
+    this middleware is run before ALLOWED_HOSTS kicks in.
+
+    It must stay first in `MIDDLEWARE`, so that `/version/` requests are answered
+    without going through the rest of the middleware stack."""
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        self.get_response = get_response
 
-    def process_request(self, request: HttpRequest) -> HttpResponse | None:
-        if request.META["PATH_INFO"] == "/version/":
-            return HttpResponse(read_version_from_toml())
-        return None
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if request.path_info == VERSION_PATH:
+            return HttpResponse(get_version())
+        return self.get_response(request)
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.7 on 2026-10-19 10:05
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    # index is created concurrently to avoid locking `reversion_version` for writes
+    atomic = False
+
+    dependencies = [
+        ("workshops", "0292_alter_trainingrequest_member_code_and_more"),
+        ("reversion", "0002_add_index_on_version_for_content_type_and_db"),
+    ]
+
+    operations = [
+        # Index for finding first and last versions of an object (`last_modified`
+        # template tag). `reversion.Version` is a third-party model, so the index is
+        # created with SQL.
+        migrations.RunSQL(
+            sql=(
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS reversion_version_object_history_idx "
+                "ON reversion_version (content_type_id, object_id, id)"
+            ),
+            reverse_sql="DROP INDEX CONCURRENTLY IF EXISTS reversion_version_object_history_idx",
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.7 on 2026-10-19 11:40
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    # indexes are created concurrently to avoid locking reversion tables for writes
+    atomic = False
+
+    dependencies = [
+        ("workshops", "0293_version_object_history_index"),
+    ]
+
+    operations = [
+        # Keyset pagination of the changes log, optionally filtered by user.
+        migrations.RunSQL(
+            sql=(
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS reversion_revision_changes_log_idx "
+                "ON reversion_revision (date_created, id)"
+            ),
+            reverse_sql="DROP INDEX CONCURRENTLY IF EXISTS reversion_revision_changes_log_idx",
+        ),
+        migrations.RunSQL(
+            sql=(
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS reversion_revision_user_changes_log_idx "
+                "ON reversion_revision (user_id, date_created, id)"
+            ),
+            reverse_sql="DROP INDEX CONCURRENTLY IF EXISTS reversion_revision_user_changes_log_idx",
+        ),
+        # Changes log filtered by the type of changed objects.
+        migrations.RunSQL(
+            sql=(
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS reversion_version_content_type_revision_idx "
+                "ON reversion_version (content_type_id, revision_id)"
+            ),
+            reverse_sql="DROP INDEX CONCURRENTLY IF EXISTS reversion_version_content_type_revision_idx",
+        ),
+    ]
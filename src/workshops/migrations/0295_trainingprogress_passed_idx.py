@@ -0,0 +1,24 @@
+# Generated by Django 5.2.7 on 2026-10-19 14:10
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # index is created concurrently to avoid locking `workshops_trainingprogress` for writes
+    atomic = False
+
+    dependencies = [
+        ("workshops", "0294_revision_changes_log_indexes"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="trainingprogress",
+            index=models.Index(
+                condition=models.Q(("state", "p")),
+                fields=["trainee", "requirement"],
+                name="trainingprogress_passed_idx",
+            ),
+        ),
+    ]
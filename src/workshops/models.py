@@ -15,18 +15,19 @@ from django.core.exceptions import ValidationError
 from django.core.validators import RegexValidator
 from django.db import models, transaction
 from django.db.models import (
+    BooleanField,
     Case,
     Count,
+    Exists,
+    ExpressionWrapper,
     F,
-    IntegerField,
     Manager,
+    OuterRef,
     PositiveIntegerField,
     Q,
     QuerySet,
-    Sum,
     When,
 )
-from django.db.models.aggregates import Aggregate
 from django.db.models.functions import Coalesce, Greatest
 from django.urls import reverse, reverse_lazy
 from django.utils import timezone
@@ -75,6 +76,7 @@ from src.workshops.mixins import (
 from src.workshops.signals import person_archived_signal
 from src.workshops.utils.dates import human_daterange
 from src.workshops.utils.emails import find_emails
+from src.workshops.utils.querysets import SubqueryCount
 from src.workshops.utils.reports import reports_link
 
 # ------------------------------------------------------------
@@ -153,6 +155,40 @@ class MembershipSeatUsage(TypedDict):
     instructor_training_seats_remaining: int
 
 
+class MembershipWorkshopCounts(TypedDict):
+    workshops_without_admin_fee_completed_count: int
+    workshops_without_admin_fee_planned_count: int
+    self_organized_workshops_completed_count: int
+    self_organized_workshops_planned_count: int
+    public_instructor_training_seats_utilized_count: int
+    inhouse_instructor_training_seats_utilized_count: int
+
+
+class MembershipQuerySet(QuerySet["Membership"]):
+    def annotate_with_workshop_counts(self) -> QuerySet[Annotated[Membership, Annotations[MembershipWorkshopCounts]]]:
+        """Annotate numbers of workshops and instructor training seats used by each
+        membership. Membership counters (e.g. `workshops_without_admin_fee_completed`)
+        use these values instead of querying the database for each membership."""
+        today = datetime.date.today()
+        events = Event.objects.filter(membership=OuterRef("pk")).exclude(
+            Q(tags__name="cancelled") | Q(tags__name="stalled")
+        )
+        without_admin_fee = events.filter(administrator__in=Organization.objects.administrators()).exclude(
+            administrator__domain="self-organized"
+        )
+        self_organized = events.filter(Q(administrator=None) | Q(administrator__domain="self-organized"))
+        learner_tasks = Task.objects.filter(seat_membership=OuterRef("pk"), role__name="learner")
+
+        return self.annotate(
+            workshops_without_admin_fee_completed_count=SubqueryCount(without_admin_fee.filter(start__lt=today)),
+            workshops_without_admin_fee_planned_count=SubqueryCount(without_admin_fee.filter(start__gte=today)),
+            self_organized_workshops_completed_count=SubqueryCount(self_organized.filter(start__lt=today)),
+            self_organized_workshops_planned_count=SubqueryCount(self_organized.filter(start__gte=today)),
+            public_instructor_training_seats_utilized_count=SubqueryCount(learner_tasks.filter(seat_public=True)),
+            inhouse_instructor_training_seats_utilized_count=SubqueryCount(learner_tasks.filter(seat_public=False)),
+        )
+
+
 class MembershipManager(models.Manager["Membership"]):
     def annotate_with_seat_usage(self) -> QuerySet[Annotated[Membership, Annotations[MembershipSeatUsage]]]:
         return self.get_queryset().annotate(
@@ -354,7 +390,7 @@ class Membership(models.Model):
         null=True,
     )
 
-    objects = MembershipManager()
+    objects = MembershipManager.from_queryset(MembershipQuerySet)()
 
     def __str__(self) -> str:
         dates = human_daterange(self.agreement_start, self.agreement_end)
@@ -397,6 +433,26 @@ class Membership(models.Model):
     def _workshops_without_admin_fee_planned_queryset(self) -> QuerySet[Event]:
         return self._workshops_without_admin_fee_queryset().filter(start__gte=datetime.date.today())
 
+    def _annotated_count(self, annotation: str, queryset: QuerySet[Any]) -> int:
+        """Use count annotated with `Membership.objects.annotate_with_workshop_counts()`
+        if present, otherwise count the queryset."""
+        count = getattr(self, annotation, None)
+        return count if count is not None else queryset.count()
+
+    @cached_property
+    def _workshops_without_admin_fee_completed_count(self) -> int:
+        return self._annotated_count(
+            "workshops_without_admin_fee_completed_count",
+            self._workshops_without_admin_fee_completed_queryset(),
+        )
+
+    @cached_property
+    def _workshops_without_admin_fee_planned_count(self) -> int:
+        return self._annotated_count(
+            "workshops_without_admin_fee_planned_count",
+            self._workshops_without_admin_fee_planned_queryset(),
+        )
+
     @property
     def workshops_without_admin_fee_total_allowed(self) -> int:
         """Available for counting, "contracted" centrally-organised workshops.
@@ -432,7 +488,7 @@ class Membership(models.Model):
 
         Excess is counted towards discounted-fee completed workshops."""
         return min(
-            self._workshops_without_admin_fee_completed_queryset().count(),
+            self._workshops_without_admin_fee_completed_count,
             self.workshops_without_admin_fee_available,
         )
 
@@ -445,7 +501,7 @@ class Membership(models.Model):
 
         Excess is counted towards discounted-fee planned workshops."""
         return min(
-            self._workshops_without_admin_fee_planned_queryset().count(),
+            self._workshops_without_admin_fee_planned_count,
             self.workshops_without_admin_fee_available - self.workshops_without_admin_fee_completed,
         )
 
@@ -464,7 +520,7 @@ class Membership(models.Model):
         """Any centrally-organised workshops exceeding the workshops without fee allowed
         number - already completed."""
         return max(
-            self._workshops_without_admin_fee_completed_queryset().count() - self.workshops_without_admin_fee_available,
+            self._workshops_without_admin_fee_completed_count - self.workshops_without_admin_fee_available,
             0,
         )
 
@@ -473,7 +529,7 @@ class Membership(models.Model):
         """Any centrally-organised workshops exceeding the workshops without fee allowed
         number - to happen in future."""
         return max(
-            self._workshops_without_admin_fee_planned_queryset().count() - self.workshops_without_admin_fee_available,
+            self._workshops_without_admin_fee_planned_count - self.workshops_without_admin_fee_available,
             0,
         )
 
@@ -487,13 +543,19 @@ class Membership(models.Model):
     def self_organized_workshops_completed(self) -> int:
         """Count self-organized workshops hosted the year agreement started (completed,
         ie. in past)."""
-        return self._self_organized_workshops_queryset().filter(start__lt=datetime.date.today()).count()
+        return self._annotated_count(
+            "self_organized_workshops_completed_count",
+            self._self_organized_workshops_queryset().filter(start__lt=datetime.date.today()),
+        )
 
     @cached_property
     def self_organized_workshops_planned(self) -> int:
         """Count self-organized workshops hosted the year agreement started (planned,
         ie. in future)."""
-        return self._self_organized_workshops_queryset().filter(start__gte=datetime.date.today()).count()
+        return self._annotated_count(
+            "self_organized_workshops_planned_count",
+            self._self_organized_workshops_queryset().filter(start__gte=datetime.date.today()),
+        )
 
     @property
     def public_instructor_training_seats_total(self) -> int:
@@ -510,7 +572,10 @@ class Membership(models.Model):
     @cached_property
     def public_instructor_training_seats_utilized(self) -> int:
         """Count number of learner tasks that point to this membership."""
-        return self.task_set.filter(role__name="learner", seat_public=True).count()
+        return self._annotated_count(
+            "public_instructor_training_seats_utilized_count",
+            self.task_set.filter(role__name="learner", seat_public=True),
+        )
 
     @property
     def public_instructor_training_seats_remaining(self) -> int:
@@ -535,7 +600,10 @@ class Membership(models.Model):
     @cached_property
     def inhouse_instructor_training_seats_utilized(self) -> int:
         """Count number of learner tasks that point to this membership."""
-        return self.task_set.filter(role__name="learner", seat_public=False).count()
+        return self._annotated_count(
+            "inhouse_instructor_training_seats_utilized_count",
+            self.task_set.filter(role__name="learner", seat_public=False),
+        )
 
     @property
     def inhouse_instructor_training_seats_remaining(self) -> int:
@@ -579,11 +647,11 @@ class Airport(models.Model):
 
 
 class PersonInstructorEligibility(TypedDict):
-    passed_training: int
-    passed_get_involved: int
-    passed_welcome: int
-    passed_demo: int
-    instructor_eligible: int
+    passed_training: bool
+    passed_get_involved: bool
+    passed_welcome: bool
+    passed_demo: bool
+    instructor_eligible: bool
 
 
 class PersonRoleCount(TypedDict):
@@ -647,32 +715,14 @@ class PersonManager(BaseUserManager["Person"]):
     def annotate_with_instructor_eligibility(
         self,
     ) -> QuerySet[Annotated[Person, Annotations[PersonInstructorEligibility]]]:
-        def passed(requirement: str) -> Aggregate:
-            return Sum(
-                Case(
-                    When(
-                        trainingprogress__requirement__name=requirement,
-                        trainingprogress__state="p",
-                        then=1,
-                    ),
-                    default=0,
-                    output_field=IntegerField(),
-                )
-            )
-
-        def passed_either(*reqs: str) -> Aggregate:
-            return Sum(
-                Case(
-                    *[
-                        When(
-                            trainingprogress__requirement__name=req,
-                            trainingprogress__state="p",
-                            then=1,
-                        )
-                        for req in reqs
-                    ],
-                    default=0,
-                    output_field=IntegerField(),
+        def passed(requirement: str) -> Exists:
+            # correlated subqueries (instead of aggregating joined progress rows)
+            # use `trainingprogress_passed_idx` and don't multiply person rows
+            return Exists(
+                TrainingProgress.objects.filter(
+                    trainee=OuterRef("pk"),
+                    requirement__name=requirement,
+                    state="p",
                 )
             )
 
@@ -682,12 +732,9 @@ class PersonManager(BaseUserManager["Person"]):
             passed_welcome=passed("Welcome Session"),
             passed_demo=passed("Demo"),
         ).annotate(
-            # We're using Maths to calculate "binary" score for a person to
-            # be instructor badge eligible. Legend:
-            # * means "AND"
-            # + means "OR"
-            instructor_eligible=(
-                F("passed_training") * F("passed_welcome") * F("passed_get_involved") * F("passed_demo")
+            instructor_eligible=ExpressionWrapper(
+                Q(passed_training=True, passed_welcome=True, passed_get_involved=True, passed_demo=True),
+                output_field=BooleanField(),
             )
         )
 
@@ -1620,7 +1667,8 @@ class Event(AssignmentMixin, models.Model):
                 self.venue
                 and self.latitude is not None
                 and self.longitude is not None
-                or "online" in self.tags.strings()
+                # uses prefetched tags, if available
+                or any(tag.name == "online" for tag in self.tags.all())
             )
         )
 
@@ -2854,6 +2902,14 @@ class TrainingProgress(CreatedUpdatedMixin, models.Model):
                 name="unique_trainee_at_event",
             )
         ]
+        indexes = [
+            # passed requirements of a trainee (instructor eligibility)
+            models.Index(
+                fields=["trainee", "requirement"],
+                condition=Q(state="p"),
+                name="trainingprogress_passed_idx",
+            ),
+        ]
 
 
 # ------------------------------------------------------------
@@ -2,9 +2,12 @@ import logging
 from typing import Any
 
 from django.contrib.auth.signals import user_login_failed
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from django.http.request import HttpRequest
 
+from src.workshops.utils.feature_flags import invalidate_flag_states_cache
+
 # AMY server logger
 logger = logging.getLogger("amy")
 
@@ -17,3 +20,10 @@ def log_user_login_failed(sender: Any, **kwargs: Any) -> None:
     ip = request.META.get("REMOTE_ADDR") or "UNKNOWN"
     msg = f"Login failure from IP {ip}"
     logger.error(msg)
+
+
+# a receiver for FlagState changes made e.g. in Django admin
+@receiver(post_save, sender="flags.FlagState")
+@receiver(post_delete, sender="flags.FlagState")
+def flag_state_changed(sender: Any, **kwargs: Any) -> None:
+    invalidate_flag_states_cache()
@@ -0,0 +1,39 @@
+from django import template
+from django.template.base import FilterExpression, NodeList, Parser, Token
+from django.template.context import Context
+from django.utils.safestring import SafeString, mark_safe
+
+from src.workshops.utils.fragment_cache import fragment_cache as cache
+
+register = template.Library()
+
+
+class FragmentCacheNode(template.Node):
+    def __init__(self, nodelist: NodeList, name: str, vary_on: list[FilterExpression]) -> None:
+        self.nodelist = nodelist
+        self.name = name
+        self.vary_on = vary_on
+
+    def render(self, context: Context) -> SafeString:
+        vary_on = [variable.resolve(context) for variable in self.vary_on]
+        return mark_safe(cache.get_or_render(self.name, vary_on, lambda: self.nodelist.render(context)))
+
+
+@register.tag
+def fragment_cache(parser: Parser, token: Token) -> FragmentCacheNode:
+    """Cache the rendered block in memory of the worker, keyed by the block name and
+    versions of given values (see `src.workshops.utils.fragment_cache`):
+
+        {% fragment_cache "person_awards" person person.award_set.all %}
+            ...
+        {% endfragment_cache %}
+
+    The block must depend only on the given values, and must not contain
+    request-specific content such as CSRF tokens."""
+    bits = token.split_contents()
+    if len(bits) < 2 or bits[1][0] not in "\"'" or bits[1][0] != bits[1][-1]:
+        raise template.TemplateSyntaxError(f"'{bits[0]}' tag requires a quoted fragment name.")
+
+    nodelist = parser.parse(("endfragment_cache",))
+    parser.delete_first_token()
+    return FragmentCacheNode(nodelist, bits[1][1:-1], [parser.compile_filter(bit) for bit in bits[2:]])
@@ -18,3 +18,19 @@ def set_page_query(context: dict[str, Any], page: Any) -> str:
     query = cast(HttpRequest, context["request"]).GET.copy()
     query["page"] = str(page)
     return query.urlencode()
+
+
+@register.inclusion_tag("keyset_pagination.html", takes_context=True)
+def keyset_pagination(context: dict[str, Any], objects: Any) -> dict[str, Any]:
+    # needed in set_keyset_query that's only called from 'keyset_pagination.html'
+    request = context["request"]
+    return {"objects": objects, "request": request}
+
+
+@register.simple_tag(takes_context=True)
+def set_keyset_query(context: dict[str, Any], direction: str, cursor: str) -> str:
+    query = cast(HttpRequest, context["request"]).GET.copy()
+    query.pop("newer_than", None)
+    query.pop("older_than", None)
+    query[direction] = cursor
+    return query.urlencode()
@@ -9,22 +9,21 @@ register = template.Library()
 
 @register.inclusion_tag("includes/last_modified.html")
 def last_modified(obj: Model) -> dict[str, Any]:
-    """Get all versions for specific object, display:
+    """Get first and last version of specific object, display:
 
     "Created on ASD by DSA."
     "Last modified on ASD by DSA."
+
+    Objects can have long histories, so only these two versions are fetched,
+    without their (potentially large) serialized data.
     """
-    versions = Version.objects.get_for_object(obj).select_related("revision", "revision__user")
-
-    try:
-        last, *_, created = versions
-    except ValueError:  # either len(versions) == 0 or len(versions) == 1
-        try:
-            created = versions[0]
-            last = None
-        except IndexError:  # len(versions) == 0
-            created = None
-            last = None
+    versions = Version.objects.get_for_object(obj).select_related("revision", "revision__user").defer("serialized_data")
+
+    created = versions.order_by("pk").first()
+    last = versions.order_by("-pk").first()
+    if last is not None and created is not None and last.pk == created.pk:
+        # only one version
+        last = None
 
     return {
         "created": created,
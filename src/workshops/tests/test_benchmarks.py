@@ -0,0 +1,238 @@
+import os
+import subprocess
+import sys
+from datetime import date
+
+from django.test import SimpleTestCase
+from django.urls import reverse
+from django_comments.models import Comment
+from reversion.models import Revision, Version
+
+from src.api.models import ChangeFeedEntry
+from src.recruitment.models import InstructorRecruitment
+from src.workshops.models import Person, TrainingProgress
+from src.workshops.tests.base import TestBase
+from src.workshops.utils.benchmarks import (
+    SCENARIOS,
+    TEMPLATE_SCENARIOS,
+    Scenario,
+    ScenarioResult,
+    build_report,
+    child_pids,
+    clear_template_caches,
+    compare_reports,
+    get_benchmark_admin,
+    process_memory_kb,
+    run_scenarios,
+    run_scenarios_with_instrumentation,
+    seed_change_feed_history,
+    seed_comments,
+    seed_open_recruitments,
+    seed_revision_history,
+    seed_training_progress,
+    template_scenarios,
+)
+from src.workshops.utils.fragment_cache import fragment_cache
+from src.workshops.utils.instrumentation import metrics_registry
+
+
+class TestBenchmarks(TestBase):
+    def test_get_benchmark_admin(self) -> None:
+        # Act
+        admin1 = get_benchmark_admin()
+        admin2 = get_benchmark_admin()
+
+        # Assert
+        self.assertEqual(admin1, admin2)
+        self.assertTrue(admin1.is_superuser)
+
+    def test_seed_change_feed_history(self) -> None:
+        # Arrange
+        ChangeFeedEntry.objects.all().delete()
+
+        # Act
+        seed_change_feed_history(25, batch_size=10)
+
+        # Assert
+        self.assertEqual(ChangeFeedEntry.objects.count(), 25)
+        person_pks = {str(pk) for pk in Person.objects.values_list("pk", flat=True)}
+        self.assertTrue(set(ChangeFeedEntry.objects.values_list("object_pk", flat=True)) <= person_pks)
+
+    def test_seed_revision_history(self) -> None:
+        # Arrange
+        Revision.objects.all().delete()
+
+        # Act
+        seed_revision_history(25, batch_size=10)
+
+        # Assert
+        self.assertEqual(Revision.objects.count(), 25)
+        self.assertEqual(Version.objects.count(), 25)
+        self.assertEqual(Revision.objects.filter(version__isnull=True).count(), 0)
+
+    def test_seed_training_progress(self) -> None:
+        # Arrange
+        TrainingProgress.objects.all().delete()
+
+        # Act
+        seed_training_progress(25, batch_size=10)
+
+        # Assert
+        self.assertEqual(TrainingProgress.objects.count(), 25)
+        self.assertTrue(TrainingProgress.objects.filter(state="p").exists())
+        self.assertTrue(
+            set(TrainingProgress.objects.values_list("requirement__name", flat=True))
+            <= {"Training", "Get Involved", "Welcome Session", "Demo"}
+        )
+
+    def test_seed_comments(self) -> None:
+        # Act
+        seed_comments(5)
+
+        # Assert
+        self.assertEqual(Comment.objects.count(), 5)
+        self.assertEqual(len(set(Comment.objects.values_list("object_pk", flat=True))), 1)
+
+    def test_seed_open_recruitments(self) -> None:
+        # Act
+        seed_open_recruitments(25, batch_size=10)
+
+        # Assert
+        self.assertEqual(InstructorRecruitment.objects.filter(status="o", event__start__gt=date.today()).count(), 25)
+
+    def test_run_scenarios__before_request(self) -> None:
+        # Arrange
+        calls: list[None] = []
+        scenarios = [Scenario("all_persons", lambda: reverse("all_persons"), before_request=lambda: calls.append(None))]
+
+        # Act
+        results = run_scenarios(scenarios, repeat=2)
+
+        # Assert
+        self.assertEqual(len(calls), 3)  # timed requests and the memory measuring request
+        self.assertGreater(results[0].cpu_time_ms_median, 0)
+
+    def test_run_scenarios(self) -> None:
+        # Arrange
+        scenarios = [Scenario("all_persons", lambda: reverse("all_persons"))]
+
+        # Act
+        results = run_scenarios(scenarios, repeat=2)
+
+        # Assert
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0].name, "all_persons")
+        self.assertEqual(results[0].status_code, 200)
+        self.assertEqual(results[0].repeat, 2)
+        self.assertGreater(results[0].query_count, 0)
+        self.assertGreater(results[0].peak_memory_kb, 0)
+        self.assertLessEqual(results[0].wall_time_ms_min, results[0].wall_time_ms_max)
+
+    def test_run_scenarios_with_instrumentation(self) -> None:
+        # Arrange
+        scenarios = [Scenario("all_persons", lambda: reverse("all_persons"))]
+        metrics_registry.reset()
+        self.addCleanup(metrics_registry.reset)
+
+        # Act
+        run_scenarios_with_instrumentation(scenarios, repeat=1, enabled=False)
+        uninstrumented_snapshot = metrics_registry.snapshot()
+        results = run_scenarios_with_instrumentation(scenarios, repeat=1, enabled=True)
+
+        # Assert
+        self.assertEqual(uninstrumented_snapshot, {})
+        self.assertIn("all_persons", metrics_registry.snapshot())
+        self.assertEqual(results[0].status_code, 200)
+
+    def test_api_v2_changes_newest__short_feed(self) -> None:
+        # Arrange
+        ChangeFeedEntry.objects.all().delete()
+        seed_change_feed_history(5, batch_size=10)
+        scenarios = [scenario for scenario in SCENARIOS if scenario.name == "api_v2_changes_newest"]
+
+        # Act
+        results = run_scenarios(scenarios, repeat=1)
+
+        # Assert
+        self.assertNotIn("since", results[0].url)
+        self.assertEqual(results[0].status_code, 200)
+
+    def test_compare_reports(self) -> None:
+        # Arrange
+        baseline = build_report(
+            [ScenarioResult("all_persons", "/persons/", 200, 5, 8.0, 10.0, 12.0, 20, 100.0)],
+            scale=1,
+        )
+        report = build_report(
+            [
+                ScenarioResult("all_persons", "/persons/", 200, 5, 10.0, 15.0, 20.0, 25, 120.0),
+                ScenarioResult("all_events", "/events/", 200, 5, 10.0, 15.0, 20.0, 25, 120.0),
+            ],
+            scale=1,
+        )
+
+        # Act
+        comparisons = compare_reports(report, baseline)
+
+        # Assert
+        self.assertEqual(
+            comparisons,
+            [
+                {
+                    "name": "all_persons",
+                    "wall_time_ms_median": 15.0,
+                    "baseline_wall_time_ms_median": 10.0,
+                    "wall_time_change_pct": 50.0,
+                    "query_count": 25,
+                    "baseline_query_count": 20,
+                }
+            ],
+        )
+
+
+class TestServerBenchmarkHelpers(SimpleTestCase):
+    def test_child_pids(self) -> None:
+        # Arrange
+        process = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(10)"])
+
+        try:
+            # Act
+            pids = child_pids(os.getpid())
+        finally:
+            process.kill()
+            process.wait()
+
+        # Assert
+        self.assertIn(process.pid, pids)
+
+    def test_process_memory_kb(self) -> None:
+        # Act
+        rss, pss = process_memory_kb(os.getpid())
+
+        # Assert
+        self.assertGreater(rss, 0)
+        self.assertGreater(pss, 0)
+        self.assertLessEqual(pss, rss)
+
+
+class TestTemplateBenchmarks(SimpleTestCase):
+    def test_template_scenarios(self) -> None:
+        # Act
+        scenarios = template_scenarios(SCENARIOS)
+
+        # Assert
+        self.assertEqual(len(scenarios), 2 * len(TEMPLATE_SCENARIOS))
+        self.assertEqual(
+            [scenario.name for scenario in scenarios[:2]],
+            [f"{TEMPLATE_SCENARIOS[0]}_cold_templates", f"{TEMPLATE_SCENARIOS[0]}_warm_templates"],
+        )
+
+    def test_clear_template_caches(self) -> None:
+        # Arrange
+        fragment_cache.get_or_render("test", [], lambda: "rendered")
+
+        # Act
+        clear_template_caches()
+
+        # Assert
+        self.assertEqual(fragment_cache.get_or_render("test", [], lambda: "rendered again"), "rendered again")
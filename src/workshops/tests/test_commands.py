@@ -2,12 +2,26 @@
 
 These commands are run via `./manage.py command`."""
 
+import re
 from datetime import date
-
-from django.core.management.base import BaseCommand
+from io import StringIO
+from random import seed as random_seed
+from typing import Any
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.db.migrations.recorder import MigrationRecorder
+from django.db.models import Count
+from django.db.models.signals import post_save
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from faker import Faker
 
 from src.communityroles.models import CommunityRole, CommunityRoleConfig
+from src.consents.models import Consent, Term
+from src.workshops.consts import IATA_AIRPORTS
 from src.workshops.management.commands.assign_instructor_community_role import (
     Command as AssignInstructorCommunityRole,
 )
@@ -15,13 +29,28 @@ from src.workshops.management.commands.assign_trainer_community_role import (
     Command as AssignTrainerCommunityRole,
 )
 from src.workshops.management.commands.create_superuser import Command as CreateSuperuser
+from src.workshops.management.commands.fake_database import Command as FakeDatabase
+from src.workshops.management.commands.fake_database import muted_signals, random_pk_window
 from src.workshops.management.commands.migrate_inactive_trainers_to_trainer_badges import (
     Command as MigrateInactiveTrainersToTrainerBadges,
 )
 from src.workshops.management.commands.migrate_to_single_instructor_badge import (
     Command as MigrateToSingleInstructorBadge,
 )
-from src.workshops.models import Award, Badge, Person
+from src.workshops.management.commands.startup import (
+    migrations_on_disk,
+    unapplied_migrations,
+)
+from src.workshops.models import (
+    Award,
+    Badge,
+    Event,
+    Person,
+    Task,
+    TrainingProgress,
+    TrainingRequest,
+)
+from src.workshops.utils.benchmarks import SEED_SCRIPTS
 
 
 class TestMigrateToSingleInstructorBadge(TestCase):
@@ -512,3 +541,184 @@ class TestCreateSuperuserCommand(TestCase):
         self.assertEqual(Person.objects.filter(is_superuser=True).count(), 1)
         superuser.refresh_from_db()
         self.assertFalse(superuser.is_active)
+
+
+class TestFakeDatabaseCommand(TestCase):
+    def setUp(self) -> None:
+        for script in SEED_SCRIPTS:
+            call_command("runscript", script, stdout=StringIO())
+        CreateSuperuser().handle()
+
+        Faker.seed(12345)
+        random_seed(12345)
+        self.command = FakeDatabase(stdout=StringIO())
+
+    def dataset_invariants(self) -> dict[str, Any]:
+        terms = list(Term.objects.active())
+        active_consents = Consent.objects.active().filter(term__in=terms)
+        airports_consistent = all(
+            person.airport_timezone == IATA_AIRPORTS[person.airport_iata]["tz"]
+            for person in Person.objects.exclude(airport_iata="")
+        )
+        scores_consistent = all(
+            request.score_auto == request.recalculate_score_auto()
+            for request in TrainingRequest.objects.prefetch_related("domains", "previous_involvement")
+        )
+
+        return {
+            "persons": Person.objects.exists(),
+            "awards": Award.objects.exists(),
+            "events": Event.objects.exists(),
+            "tasks": Task.objects.exists(),
+            "unmatched_training_requests": TrainingRequest.objects.filter(person__isnull=True).exists(),
+            "training_progresses": TrainingProgress.objects.exists(),
+            "one_active_consent_per_term": (
+                active_consents.count() == Person.objects.count() * len(terms)
+                and not active_consents.values("person", "term").annotate(n=Count("pk")).filter(n__gt=1).exists()
+            ),
+            "accepted_requests_have_training": not (
+                TrainingRequest.objects.filter(state="a")
+                .exclude(person__task__role__name="learner", person__task__event__tags__name="TTT")
+                .exists()
+            ),
+            "ttt_events_have_only_ttt_tag": not Event.objects.ttt().filter(tags__name__in=["SWC", "DC", "LC"]).exists(),
+            "events_have_reports_link": not Event.objects.filter(slug__isnull=False, instructors_pre="").exists(),
+            "airports_consistent": airports_consistent,
+            "scores_consistent": scores_consistent,
+        }
+
+    def test_populate(self) -> None:
+        # Act
+        self.command.populate(scale=1)
+
+        # Assert
+        invariants = self.dataset_invariants()
+        self.assertEqual(invariants, dict.fromkeys(invariants, True))
+
+    def test_populate_bulk(self) -> None:
+        # Act
+        self.command.populate_bulk(scale=1, batch_size=7)
+
+        # Assert
+        invariants = self.dataset_invariants()
+        self.assertEqual(invariants, dict.fromkeys(invariants, True))
+
+    def test_random_pk_window(self) -> None:
+        # Arrange
+        Person.objects.bulk_create(
+            [Person(personal="Test", family=f"User {i}", username=f"test_user_{i}") for i in range(20)]
+        )
+        pks = list(Person.objects.order_by("pk").values_list("pk", flat=True))
+
+        # Act
+        window = random_pk_window(Person, 5)
+
+        # Assert
+        self.assertEqual(len(window), 5)
+        start = pks.index(window[0])
+        self.assertEqual(window, (pks + pks)[start : start + 5])
+
+    def test_bulk_fake_tasks(self) -> None:
+        # Arrange
+        self.command.populate_bulk(scale=1, batch_size=7)
+        tasks_before = Task.objects.count()
+
+        # Act
+        self.command.bulk_fake_tasks(50)
+
+        # Assert
+        # randomly repeated tasks are skipped
+        self.assertTrue(0 < Task.objects.count() - tasks_before <= 50)
+
+    def test_muted_signals(self) -> None:
+        # Arrange
+        receivers = list(post_save.receivers)
+
+        # Act
+        with muted_signals(post_save):
+            muted_receivers = list(post_save.receivers)
+
+        # Assert
+        self.assertEqual(muted_receivers, [])
+        self.assertEqual(post_save.receivers, receivers)
+
+
+class TestStartupCommand(TestCase):
+    def call_startup(self, *args: str) -> tuple[str, list[str]]:
+        """Run the command, but don't actually migrate (test database is up to date
+        anyway) nor check (results depend on the environment)."""
+        migrate_calls: list[str] = []
+
+        def fake_call_command(name: str, *args: Any, **kwargs: Any) -> None:
+            if name == "migrate":
+                migrate_calls.append(name)
+            elif name != "check":
+                call_command(name, *args, **kwargs)
+
+        stdout = StringIO()
+        with patch("src.workshops.management.commands.startup.call_command", side_effect=fake_call_command):
+            call_command("startup", *args, stdout=stdout)
+        return stdout.getvalue(), migrate_calls
+
+    def test_unapplied_migrations(self) -> None:
+        # Act
+        result = unapplied_migrations()
+
+        # Assert
+        self.assertEqual(result, set())
+        self.assertIn(("workshops", "0001_initial"), migrations_on_disk())
+
+    def test_migrates_when_migration_not_applied(self) -> None:
+        # Arrange
+        MigrationRecorder(connection).record_unapplied("workshops", "0001_initial")
+
+        # Act
+        _, migrate_calls = self.call_startup()
+
+        # Assert
+        self.assertEqual(migrate_calls, ["migrate"])
+
+    def test_force_migrate(self) -> None:
+        # Act
+        _, migrate_calls = self.call_startup("--force-migrate")
+
+        # Assert
+        self.assertEqual(migrate_calls, ["migrate"])
+
+    def test_noop_startup(self) -> None:
+        """When all migrations are applied, startup only reads the database."""
+        # Act
+        with CaptureQueriesContext(connection) as ctx:
+            output, migrate_calls = self.call_startup()
+
+        # Assert
+        self.assertEqual(migrate_calls, [])
+        ddl = [query["sql"] for query in ctx.captured_queries if re.match(r"\s*(CREATE|ALTER|DROP)\b", query["sql"])]
+        self.assertEqual(ddl, [])
+        self.assertIn("skipping migrations", output)
+        for phase in ["check", "compile_templates", "createcachetable", "migrate"]:
+            self.assertRegex(output, rf"{phase}\s+\d+\.\dms")
+
+
+class TestCompileTemplatesCommand(TestCase):
+    def test_compiles_project_templates(self) -> None:
+        # Arrange
+        stdout = StringIO()
+
+        # Act
+        call_command("compile_templates", stdout=stdout)
+
+        # Assert
+        self.assertRegex(stdout.getvalue(), r"Compiled \d+ templates")
+
+    def test_fails_on_broken_template(self) -> None:
+        # Arrange
+        stderr = StringIO()
+
+        # Act & Assert
+        with (
+            patch("src.workshops.utils.warmup.project_template_names", return_value=["does-not-exist.html"]),
+            self.assertRaises(CommandError),
+        ):
+            call_command("compile_templates", stderr=stderr)
+        self.assertIn("does-not-exist.html", stderr.getvalue())
@@ -3,7 +3,8 @@ from unittest.mock import patch
 from django.test import RequestFactory, TestCase
 from flags.sources import Condition, Flag  # type: ignore[import-untyped]
 
-from src.workshops.context_processors import feature_flags_enabled
+from src.workshops.context_processors import feature_flags_enabled, version
+from src.workshops.utils.version import get_version, read_version_from_toml
 
 
 class TestFeatureFlagsEnabled(TestCase):
@@ -14,11 +15,86 @@ class TestFeatureFlagsEnabled(TestCase):
         flag = Flag(name="TEST_FLAG", conditions=[condition])
         flags = {"TEST_FLAG": flag}
 
-        mock_get_flags = patch("src.workshops.context_processors.get_flags").start()
+        mock_get_flags = patch("src.workshops.utils.feature_flags.get_flags").start()
         mock_get_flags.return_value = flags
 
         # Act
         results = feature_flags_enabled(request)
 
         # Assert
-        self.assertEqual(results, {"FEATURE_FLAGS_ENABLED": [flag]})
+        self.assertEqual(results["FEATURE_FLAGS_ENABLED"], [flag])
+        self.assertEqual(dict(results["FEATURE_FLAGS"]), {"TEST_FLAG": True})
+
+    def test_context_processor__lazy(self) -> None:
+        # Arrange
+        request = RequestFactory().get("/")
+
+        # Act
+        with patch("src.workshops.utils.feature_flags.get_flags") as mock_get_flags:
+            feature_flags_enabled(request)
+
+        # Assert
+        mock_get_flags.assert_not_called()
+
+    def test_context_processor__only_read_flags_evaluated(self) -> None:
+        # Arrange
+        request = RequestFactory().get("/")
+        flag1 = Flag(name="FLAG1", conditions=[Condition(condition="boolean", value=True)])
+        flag2 = Flag(name="FLAG2", conditions=[Condition(condition="boolean", value=True)])
+        flags = {"FLAG1": flag1, "FLAG2": flag2}
+
+        # Act
+        with (
+            patch("src.workshops.utils.feature_flags.get_flags", return_value=flags),
+            patch.object(flag1, "check_state", return_value=True) as mock_check_state1,
+            patch.object(flag2, "check_state", return_value=True) as mock_check_state2,
+        ):
+            results = feature_flags_enabled(request)
+            results["FEATURE_FLAGS"]["FLAG1"]
+            results["FEATURE_FLAGS"]["FLAG1"]
+
+        # Assert
+        mock_check_state1.assert_called_once_with(request=request)
+        mock_check_state2.assert_not_called()
+
+
+class TestVersion(TestCase):
+    def test_context_processor(self) -> None:
+        # Arrange
+        request = RequestFactory().get("/")
+
+        # Act
+        results = version(request)
+
+        # Assert
+        self.assertEqual(results, {"amy_version": get_version()})
+
+    def test_context_processor__no_file_io(self) -> None:
+        # Arrange
+        request = RequestFactory().get("/")
+
+        # Act
+        with patch("builtins.open") as mock_open, patch("toml.load") as mock_toml_load:
+            version(request)
+
+        # Assert
+        mock_open.assert_not_called()
+        mock_toml_load.assert_not_called()
+
+    def test_context_processor__version_read_once(self) -> None:
+        # Arrange
+        request = RequestFactory().get("/")
+
+        # Act
+        with (
+            patch.dict("os.environ", {"AMY_VERSION": ""}),
+            patch("src.workshops.utils.version._version", None),
+            patch(
+                "src.workshops.utils.version.read_version_from_toml", wraps=read_version_from_toml
+            ) as mock_read_version_from_toml,
+        ):
+            results = [version(request) for _ in range(10)]
+
+        # Assert
+        mock_read_version_from_toml.assert_called_once()
+        self.assertEqual(results, [{"amy_version": read_version_from_toml()}] * 10)
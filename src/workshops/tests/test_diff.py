@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 from django.urls import reverse
 from reversion import revisions as reversion
 from reversion.models import Version
@@ -5,6 +7,7 @@ from reversion.revisions import create_revision
 
 from src.workshops.models import Event, Person, Tag
 from src.workshops.tests.base import TestBase
+from src.workshops.utils.version_diff import compute_version_diff, get_version_diff
 
 
 class TestRevisions(TestBase):
@@ -104,3 +107,82 @@ class TestRegression1083(TestBase):
         revision = self.client.get(reverse("object_changes", args=[last_version.pk])).content.decode("utf-8")
         self.assertIn("Smith", revision)
         self.assertIn("Brown", revision)
+
+
+class TestVersionDiff(TestBase):
+    def setUp(self) -> None:
+        self._setUpUsersAndLogin()
+        self._setUpLanguages()
+        self._setUpDomains()
+
+        with create_revision():  # type: ignore[no-untyped-call]
+            self.person = Person.objects.create_user(
+                username="alice",
+                personal="Alice",
+                family="Jones",
+                email="alice@jones.pl",
+            )
+            self.person.languages.add(self.english, self.french)
+            self.person.domains.add(self.chemistry, self.medicine)
+            self.person.save()
+
+        with create_revision():  # type: ignore[no-untyped-call]
+            self.person.family = "Williams"
+            self.person.languages.add(self.latin)
+            self.person.domains.remove(self.medicine)
+            self.person.domains.add(self.humanities)
+            self.person.save()
+
+        self.newer, self.older = Version.objects.get_for_object(self.person)
+        self.fields = [f for f in Person._meta.get_fields() if f.concrete]
+
+    def test_compute_version_diff__one_query_per_related_model(self) -> None:
+        # Arrange
+        self.assertGreaterEqual(len(self.fields), 35)
+
+        # Act
+        # languages and domains; other relations are empty or use custom `through`
+        with self.assertNumQueries(2):
+            diff = compute_version_diff(self.older, self.newer, self.fields)
+
+        # Assert
+        diff_by_field = {field_diff.verbose_name: field_diff.html for field_diff in diff}
+        self.assertNotIn("id", diff_by_field)
+        self.assertInHTML(f'<a class="label label-success" href="#">+{self.latin}</a>', diff_by_field["languages"])
+        self.assertInHTML(f'<a class="label label-default" href="#">{self.english}</a>', diff_by_field["languages"])
+        self.assertInHTML(
+            f'<a class="label label-danger" href="#">-{self.medicine}</a>', diff_by_field["Areas of expertise"]
+        )
+        self.assertIn("Williams", diff_by_field["Family (last) name"])
+
+    def test_get_version_diff__cached(self) -> None:
+        # Arrange
+        diff = get_version_diff(self.older, self.newer, self.fields)
+
+        # Act
+        with patch("src.workshops.utils.version_diff.compute_version_diff") as mock_compute:
+            cached_diff = get_version_diff(self.older, self.newer, self.fields)
+
+        # Assert
+        mock_compute.assert_not_called()
+        self.assertEqual(cached_diff, diff)
+
+    def test_object_changes__paginated_history(self) -> None:
+        # Arrange
+        for i in range(30):
+            with create_revision():  # type: ignore[no-untyped-call]
+                self.person.personal = f"Alice {i}"
+                self.person.save()
+        latest = Version.objects.get_for_object(self.person)[0]
+
+        # Act
+        rv = self.client.get(reverse("object_changes", args=[latest.pk]))
+        rv_page2 = self.client.get(reverse("object_changes", args=[latest.pk]), {"page": 2})
+
+        # Assert
+        self.assertEqual(len(rv.context["action_list"]), 25)
+        self.assertTrue(rv.context["action_list"][0]["first"])
+        self.assertTrue(rv.context["action_list"][1]["second"])
+        self.assertEqual(len(rv_page2.context["action_list"]), 7)
+        self.assertEqual(rv_page2.context["version2"], latest)
+        self.assertTrue(rv_page2.context["comparable"])
@@ -0,0 +1,163 @@
+from datetime import date
+
+from django.template import Context, Template, TemplateSyntaxError
+from django.test import TestCase
+from django.urls import reverse
+
+from src.workshops.models import Award, Person, Tag
+from src.workshops.tests.base import TestBase
+from src.workshops.utils.fragment_cache import FragmentCache, fragment_cache, fragment_cache_key
+
+
+class TestFragmentCache(TestCase):
+    def setUp(self) -> None:
+        self.tag = Tag.objects.create(name="test-tag", details="Test tag")
+        self.person = Person.objects.create(username="test_user", personal="Test", family="User")
+
+    def test_get_or_render(self) -> None:
+        # Arrange
+        cache = FragmentCache()
+        renders: list[str] = []
+
+        def render() -> str:
+            renders.append("rendered")
+            return "rendered"
+
+        # Act
+        html1 = cache.get_or_render("test", [self.tag], render)
+        html2 = cache.get_or_render("test", [self.tag], render)
+
+        # Assert
+        self.assertEqual(html1, "rendered")
+        self.assertEqual(html2, "rendered")
+        self.assertEqual(len(renders), 1)
+        self.assertEqual(cache.stats.as_dict(), {"hits": 1, "misses": 1})
+
+    def test_get_or_render__expired(self) -> None:
+        # Arrange
+        cache = FragmentCache(timeout=0)
+        cache.get_or_render("test", [], lambda: "first")
+
+        # Act
+        html = cache.get_or_render("test", [], lambda: "second")
+
+        # Assert
+        self.assertEqual(html, "second")
+
+    def test_get_or_render__least_recently_used_dropped(self) -> None:
+        # Arrange
+        cache = FragmentCache(maxsize=2)
+        cache.get_or_render("test", [1], lambda: "first")
+        cache.get_or_render("test", [2], lambda: "second")
+
+        # Act
+        cache.get_or_render("test", [3], lambda: "third")
+        html = cache.get_or_render("test", [1], lambda: "first again")
+
+        # Assert
+        self.assertEqual(html, "first again")
+
+    def test_key__versioned_by_last_updated_at(self) -> None:
+        # Arrange
+        key = fragment_cache_key("test", [self.person])
+
+        # Act
+        self.person.personal = "Changed"
+        self.person.save()
+
+        # Assert
+        self.assertNotEqual(fragment_cache_key("test", [self.person]), key)
+
+    def test_key__versioned_by_field_values(self) -> None:
+        # Arrange
+        key = fragment_cache_key("test", [self.tag])
+
+        # Act
+        self.tag.details = "Changed"
+        self.tag.save()
+
+        # Assert
+        self.assertNotEqual(fragment_cache_key("test", [self.tag]), key)
+        self.assertEqual(
+            fragment_cache_key("test", [Tag.objects.get(pk=self.tag.pk)]),
+            fragment_cache_key("test", [self.tag]),
+        )
+
+    def test_key__querysets_evaluated(self) -> None:
+        # Arrange
+        key = fragment_cache_key("test", [Tag.objects.filter(pk=self.tag.pk)])
+
+        # Act
+        Tag.objects.filter(pk=self.tag.pk).update(name="changed-tag")
+
+        # Assert
+        self.assertNotEqual(fragment_cache_key("test", [Tag.objects.filter(pk=self.tag.pk)]), key)
+
+
+class TestFragmentCacheTag(TestCase):
+    def setUp(self) -> None:
+        fragment_cache.clear()
+        self.tag = Tag.objects.create(name="test-tag", details="Test tag")
+
+    def test_render(self) -> None:
+        # Arrange
+        template = Template(
+            "{% load fragment_cache %}{% fragment_cache 'test' tag %}{{ tag.name }} {{ other }}{% endfragment_cache %}"
+        )
+
+        # Act
+        html1 = template.render(Context({"tag": self.tag, "other": "first"}))
+        html2 = template.render(Context({"tag": self.tag, "other": "second"}))
+        self.tag.name = "changed-tag"
+        html3 = template.render(Context({"tag": self.tag, "other": "third"}))
+
+        # Assert
+        self.assertEqual(html1, "test-tag first")
+        # `other` isn't part of the key
+        self.assertEqual(html2, "test-tag first")
+        self.assertEqual(html3, "changed-tag third")
+
+    def test_fragment_name_required(self) -> None:
+        with self.assertRaises(TemplateSyntaxError):
+            Template("{% load fragment_cache %}{% fragment_cache tag %}{% endfragment_cache %}")
+
+
+class TestFragmentCacheInPages(TestBase):
+    def setUp(self) -> None:
+        super().setUp()
+        self._setUpUsersAndLogin()
+        fragment_cache.clear()
+
+    def test_person_details__new_award_shown(self) -> None:
+        # Arrange
+        url = reverse("person_details", args=[self.spiderman.pk])
+        rv_before = self.client.get(url)
+
+        # Act
+        Award.objects.create(person=self.spiderman, badge=self.lc_instructor, awarded=date(2024, 1, 1))
+        rv = self.client.get(url)
+
+        # Assert
+        self.assertNotContains(rv_before, self.lc_instructor.title)
+        self.assertContains(rv, self.lc_instructor.title)
+
+    def test_navigation__shared_between_pages_of_view(self) -> None:
+        # Act
+        self.client.get(reverse("person_details", args=[self.spiderman.pk]))
+        self.client.get(reverse("person_details", args=[self.ironman.pk]))
+
+        # Assert
+        navigation_keys = [key for key in fragment_cache._fragments if key.startswith("fragment:navigation")]
+        self.assertEqual(len(navigation_keys), 2)
+
+    def test_navigation__active_item(self) -> None:
+        # Arrange
+        url = reverse("all_persons")
+
+        # Act
+        rv_persons = self.client.get(url)
+        rv_events = self.client.get(reverse("all_events"))
+
+        # Assert
+        self.assertContains(rv_persons, f'<li class="nav-item active"><a class="nav-link" href="{url}">')
+        self.assertContains(rv_events, f'<li class="nav-item "><a class="nav-link" href="{url}">')
@@ -0,0 +1,188 @@
+from unittest.mock import MagicMock
+
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connection
+from django.http import HttpRequest, HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from src.workshops.middleware.instrumentation import InstrumentationMiddleware
+from src.workshops.models import Person
+from src.workshops.tests.base import SuperuserMixin
+from src.workshops.utils.instrumentation import (
+    MetricsRegistry,
+    QueryCounter,
+    RequestMetrics,
+    metrics_registry,
+)
+
+
+def view_with_queries(request: HttpRequest) -> HttpResponse:
+    Person.objects.count()
+    Person.objects.count()  # duplicate
+    Person.objects.filter(username="test").exists()
+    return HttpResponse()
+
+
+class TestQueryCounter(TestCase):
+    def test_counts_queries_and_duplicates(self) -> None:
+        # Arrange
+        counter = QueryCounter()
+        execute = MagicMock(return_value="result")
+
+        # Act
+        counter(execute, "SELECT 1", (), False, {})
+        counter(execute, "SELECT 1", (), False, {})
+        counter(execute, "SELECT 2", (1,), False, {})
+        counter(execute, "SELECT 2", (2,), False, {})
+
+        # Assert
+        self.assertEqual(counter.count, 4)
+        self.assertEqual(counter.duplicates, 1)
+        self.assertGreaterEqual(counter.duration, 0)
+        self.assertEqual(execute.call_count, 4)
+
+
+class TestMetricsRegistry(TestCase):
+    def test_record_and_snapshot(self) -> None:
+        # Arrange
+        registry = MetricsRegistry()
+        metrics = RequestMetrics(
+            view_name="all_persons",
+            method="GET",
+            status=200,
+            duration_ms=30,
+            query_count=10,
+            query_duration_ms=12,
+            duplicate_queries=2,
+        )
+
+        # Act
+        registry.record(metrics)
+        registry.record(metrics)
+        snapshot = registry.snapshot()
+
+        # Assert
+        self.assertEqual(list(snapshot.keys()), ["all_persons"])
+        self.assertEqual(snapshot["all_persons"]["requests"], 2)
+        self.assertEqual(snapshot["all_persons"]["query_count_avg"], 10)
+        self.assertEqual(snapshot["all_persons"]["duplicate_queries_total"], 4)
+        self.assertEqual(snapshot["all_persons"]["latency_histogram_ms"]["50"], 2)
+
+    def test_reset(self) -> None:
+        # Arrange
+        registry = MetricsRegistry()
+        registry.record(RequestMetrics("view", "GET", 200, 1, 1, 1, 0))
+
+        # Act
+        registry.reset()
+
+        # Assert
+        self.assertEqual(registry.snapshot(), {})
+
+
+class TestInstrumentationMiddleware(TestCase):
+    def setUp(self) -> None:
+        metrics_registry.reset()
+
+    def tearDown(self) -> None:
+        metrics_registry.reset()
+
+    @override_settings(INSTRUMENTATION_ENABLED=False)
+    def test_disabled(self) -> None:
+        with self.assertRaises(MiddlewareNotUsed):
+            InstrumentationMiddleware(get_response=view_with_queries)
+
+    @override_settings(INSTRUMENTATION_ENABLED=True)
+    def test_counts_queries(self) -> None:
+        # Arrange
+        request = RequestFactory().get("/")
+        middleware = InstrumentationMiddleware(get_response=view_with_queries)
+
+        # Act
+        response = middleware(request)
+
+        # Assert
+        self.assertIn('desc="3 queries"', response["Server-Timing"])
+        snapshot = metrics_registry.snapshot()["<unresolved>"]
+        self.assertEqual(snapshot["requests"], 1)
+        self.assertEqual(snapshot["query_count_max"], 3)
+        self.assertEqual(snapshot["duplicate_queries_total"], 1)
+
+    @override_settings(INSTRUMENTATION_ENABLED=True)
+    def test_no_additional_queries(self) -> None:
+        # Arrange
+        request = RequestFactory().get("/")
+        middleware = InstrumentationMiddleware(get_response=view_with_queries)
+
+        # Act & Assert
+        with self.assertNumQueries(3):
+            middleware(request)
+
+
+@override_settings(INSTRUMENTATION_ENABLED=True)
+class TestInstrumentationClient(SuperuserMixin, TestCase):
+    def setUp(self) -> None:
+        metrics_registry.reset()
+        self._setUpSuperuser()
+
+    def tearDown(self) -> None:
+        metrics_registry.reset()
+
+    def test_server_timing_header(self) -> None:
+        # Act
+        response = self.client.get(reverse("login"))
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("db;dur=", response["Server-Timing"])
+        self.assertIn("total;dur=", response["Server-Timing"])
+        self.assertEqual(metrics_registry.snapshot()["login"]["requests"], 1)
+
+    def test_query_count_matches(self) -> None:
+        # Arrange
+        self._logSuperuserIn()
+        metrics_registry.reset()
+
+        # Act
+        with CaptureQueriesContext(connection) as captured:
+            response = self.client.get(reverse("all_persons"))
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(f'desc="{len(captured.captured_queries)} queries"', response["Server-Timing"])
+        self.assertEqual(
+            metrics_registry.snapshot()["all_persons"]["query_count_max"],
+            len(captured.captured_queries),
+        )
+
+    def test_metrics_endpoint(self) -> None:
+        # Arrange
+        self._logSuperuserIn()
+        self.client.get(reverse("all_persons"))
+
+        # Act
+        response = self.client.get(reverse("instrumentation_metrics"))
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("all_persons", response.json()["views"])
+
+    def test_metrics_endpoint__requires_admin(self) -> None:
+        # Act
+        response = self.client.get(reverse("instrumentation_metrics"))
+
+        # Assert
+        self.assertEqual(response.status_code, 302)
+
+    @override_settings(INSTRUMENTATION_ENABLED=False)
+    def test_metrics_endpoint__disabled(self) -> None:
+        # Arrange
+        self._logSuperuserIn()
+
+        # Act
+        response = self.client.get(reverse("instrumentation_metrics"))
+
+        # Assert
+        self.assertEqual(response.status_code, 404)
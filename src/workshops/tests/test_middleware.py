@@ -6,6 +6,8 @@ from django.test import RequestFactory, TestCase
 from flags.sources import Condition, Flag  # type: ignore[import-untyped]
 
 from src.workshops.middleware.feature_flags import SaveSessionFeatureFlagMiddleware
+from src.workshops.middleware.version_check import VersionCheckMiddleware
+from src.workshops.utils.version import get_version
 
 
 class TestSaveSessionFeatureFlagMiddleware(TestCase):
@@ -113,3 +115,103 @@ class TestSaveSessionFeatureFlagMiddleware(TestCase):
 
         # Assert
         self.assertEqual(request.session.get("test"), False)
+
+    def test_call__no_query_parameters(self) -> None:
+        # Arrange
+        request = RequestFactory().get("/")
+        middleware = SaveSessionFeatureFlagMiddleware(get_response=lambda x: HttpResponse())
+
+        # Act
+        with patch("src.workshops.middleware.feature_flags.get_flags") as mock_get_flags:
+            middleware(request)
+
+        # Assert
+        mock_get_flags.assert_not_called()
+
+    def test_call__session_not_modified_if_value_unchanged(self) -> None:
+        # Arrange
+        request = RequestFactory().get("/?test=True")
+        session = SessionStore()
+        session["test"] = True
+        session.save()
+        session.modified = False
+        request.session = session
+
+        condition = Condition(condition="parameter", value="test=True")
+        flags = {"TEST_FLAG": Flag(name="TEST_FLAG", conditions=[condition])}
+        middleware = SaveSessionFeatureFlagMiddleware(get_response=lambda x: HttpResponse())
+
+        # Act
+        with patch("src.workshops.middleware.feature_flags.get_flags", return_value=flags):
+            middleware(request)
+
+        # Assert
+        self.assertIs(request.session.get("test"), True)
+        self.assertFalse(request.session.modified)
+
+    def test_enable_feature_flag__already_enabled(self) -> None:
+        # Arrange
+        request = MagicMock()
+        request.session.get.return_value = True
+        # Act
+        SaveSessionFeatureFlagMiddleware.enable_feature_flag(request, "test")
+        # Assert
+        request.session.__setitem__.assert_not_called()
+
+    def test_disable_feature_flag__already_disabled(self) -> None:
+        # Arrange
+        request = MagicMock()
+        request.session.get.return_value = False
+        # Act
+        SaveSessionFeatureFlagMiddleware.disable_feature_flag(request, "test")
+        # Assert
+        request.session.__setitem__.assert_not_called()
+
+
+class TestVersionCheckMiddleware(TestCase):
+    def test_version_path__short_circuits(self) -> None:
+        # Arrange
+        request = RequestFactory().get("/version/")
+        get_response = MagicMock()
+        middleware = VersionCheckMiddleware(get_response=get_response)
+
+        # Act
+        response = middleware(request)
+
+        # Assert
+        self.assertEqual(response.content.decode(), get_version())
+        get_response.assert_not_called()
+
+    def test_other_path__passes_through(self) -> None:
+        # Arrange
+        request = RequestFactory().get("/dashboard/")
+        expected = HttpResponse()
+        middleware = VersionCheckMiddleware(get_response=lambda x: expected)
+
+        # Act
+        response = middleware(request)
+
+        # Assert
+        self.assertIs(response, expected)
+
+    def test_version_endpoint__no_file_io(self) -> None:
+        # Act
+        with patch("builtins.open", wraps=open) as mock_open:
+            response = self.client.get("/version/")
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        mock_open.assert_not_called()
+
+    def test_normal_request__no_pyproject_toml_io(self) -> None:
+        # Arrange
+        self.client.get("/account/login/")  # warm up template loaders
+
+        # Act
+        with patch("builtins.open", wraps=open) as mock_open:
+            response = self.client.get("/account/login/")
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        opened_files = [str(call.args[0]) for call in mock_open.call_args_list if call.args]
+        self.assertFalse([file for file in opened_files if file.endswith("pyproject.toml")])
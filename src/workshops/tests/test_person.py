@@ -6,7 +6,9 @@ from urllib.parse import urlencode
 from django.contrib.auth import authenticate
 from django.contrib.auth.models import Group, Permission
 from django.core.exceptions import ValidationError
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django_comments.models import Comment
 from reversion.models import Version
@@ -1089,6 +1091,57 @@ class TestPersonMerging(TestBase):
         rv = self.client.post(self.url, data=self.strategy)
         self.assertEqual(rv.status_code, 302)
 
+    def test_merging_combined_duplicates_removed(self) -> None:
+        """Combining relations removes objects that would duplicate objects of
+        the base person, and moves the rest."""
+        # Arrange
+        # person A already has SWC instructor badge, person B has DC instructor badge
+        duplicate = self.person_b.award_set.create(badge=self.swc_instructor, awarded=date(2017, 1, 1))
+        moved = self.person_a.award_set.create(badge=self.lc_instructor, awarded=date(2018, 1, 1))
+        expected = set(self.person_b.award_set.all()) | {moved}
+        self.strategy["award_set"] = "combine"
+
+        # Act
+        rv = self.client.post(self.url, data=self.strategy)
+
+        # Assert
+        self.assertEqual(rv.status_code, 302)
+        self.assertEqual(set(Award.objects.filter(person=self.person_b)), expected)
+        self.assertIn(duplicate, expected)
+
+    def test_merging_many_related_objects_query_budget(self) -> None:
+        """Combining relations issues the same number of queries regardless of
+        the number of related objects."""
+        # Arrange
+        host = Organization.objects.create(domain="bulk.example.org", fullname="Bulk Organization")
+        events = Event.objects.bulk_create([Event(slug=f"bulk-event-{i}", host=host) for i in range(10_000)])
+        learner = Role.objects.get(name="learner")
+        Task.objects.bulk_create(
+            [Task(person=self.person_a, event=event, role=learner) for event in events[:5000]]
+            + [Task(person=self.person_b, event=event, role=learner) for event in events[4990:9990]]
+        )
+        Qualification.objects.bulk_create(
+            [
+                Qualification(person=person, lesson=self.git)
+                for person in (self.person_a, self.person_b)
+                for _ in range(5000)
+            ]
+        )
+        self.strategy["task_set"] = "combine"
+        self.strategy["qualification_set"] = "combine"
+        tasks_count = Task.objects.filter(person__in=[self.person_a, self.person_b]).count()
+
+        # Act
+        with CaptureQueriesContext(connection) as queries:
+            rv = self.client.post(self.url, data=self.strategy)
+
+        # Assert
+        self.assertEqual(rv.status_code, 302)
+        self.assertLess(len(queries), 300)
+        # 10 tasks were duplicated
+        self.assertEqual(self.person_b.task_set.count(), tasks_count - 10)
+        self.assertEqual(Qualification.objects.filter(person=self.person_b, lesson=self.git).count(), 10_000)
+
     def test_merging_comments_strategy1(self) -> None:
         """Ensure comments regarding persons are correctly merged using
         `merge_objects`.
@@ -0,0 +1,175 @@
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from typing import Any
+
+from django.conf import settings
+from django.test import SimpleTestCase
+
+from src.workshops.utils.resources import LazyResource, ResourceRegistry, resource_registry
+
+# Modules which must not be imported by merely starting the application.
+LAZY_MODULES = ("boto3", "botocore", "cairosvg")
+# Max RSS of a process that has set up Django and imported all URLconfs (views,
+# forms, models, receivers). It's generous, meant to catch regressions like
+# eagerly loaded datasets.
+STARTUP_RSS_BUDGET_MB = 300
+
+STARTUP_SCRIPT = f"""
+import json
+import resource
+import sys
+
+import django
+
+django.setup()
+
+from django.urls import get_resolver
+
+get_resolver().url_patterns
+
+from src.workshops.utils.resources import resource_registry
+
+print(json.dumps({{
+    "modules": [name for name in {LAZY_MODULES!r} if name in sys.modules],
+    "resources": resource_registry.loaded(),
+    "max_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+}}))
+"""
+
+
+class TestLazyResource(SimpleTestCase):
+    def test_created_on_first_use(self) -> None:
+        # Arrange
+        calls: list[int] = []
+
+        def factory() -> dict[str, int]:
+            calls.append(1)
+            return {"a": 1}
+
+        resource: Any = LazyResource("test", factory)
+
+        # Act
+        loaded_before = resource.loaded
+        value = resource["a"]
+
+        # Assert
+        self.assertFalse(loaded_before)
+        self.assertEqual(value, 1)
+        self.assertTrue(resource.loaded)
+        self.assertIn("a", resource)
+        self.assertEqual(resource.get("b", 2), 2)
+        self.assertEqual(len(calls), 1)
+
+    def test_created_once_when_accessed_concurrently(self) -> None:
+        # Arrange
+        calls: list[int] = []
+        barrier = threading.Barrier(8)
+
+        def factory() -> dict[str, int]:
+            calls.append(1)
+            time.sleep(0.05)
+            return {"a": 1}
+
+        resource: Any = LazyResource("test", factory)
+        results: list[int] = []
+
+        def access() -> None:
+            barrier.wait()
+            results.append(resource["a"])
+
+        threads = [threading.Thread(target=access) for _ in range(8)]
+
+        # Act
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Assert
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, [1] * 8)
+
+    def test_reset(self) -> None:
+        # Arrange
+        calls: list[int] = []
+
+        def factory() -> dict[str, int]:
+            calls.append(1)
+            return {"a": 1}
+
+        resource: Any = LazyResource("test", factory)
+        resource["a"]
+
+        # Act
+        resource.reset()
+        resource["a"]
+
+        # Assert
+        self.assertEqual(len(calls), 2)
+
+
+class TestResourceRegistry(SimpleTestCase):
+    def test_register_twice(self) -> None:
+        # Arrange
+        registry = ResourceRegistry()
+        registry.register("test", dict)
+
+        # Act & Assert
+        with self.assertRaises(ValueError):
+            registry.register("test", dict)
+
+    def test_warm_and_reset(self) -> None:
+        # Arrange
+        registry = ResourceRegistry()
+        registry.register("first", dict)
+        registry.register("second", list)
+
+        # Act
+        loaded_before = registry.loaded()
+        registry.warm("second")
+        loaded_after_warm = registry.loaded()
+        registry.warm()
+        loaded_after_warm_all = registry.loaded()
+        registry.reset()
+
+        # Assert
+        self.assertEqual(loaded_before, [])
+        self.assertEqual(loaded_after_warm, ["second"])
+        self.assertEqual(loaded_after_warm_all, ["first", "second"])
+        self.assertEqual(registry.loaded(), [])
+
+    def test_application_resources_registered(self) -> None:
+        self.assertEqual(resource_registry.names(), ["cairosvg", "iata_airports", "s3_client"])
+
+
+class TestStartupBudget(SimpleTestCase):
+    def test_heavy_resources_not_loaded_on_startup(self) -> None:
+        """Set up Django in a fresh interpreter, as in the test process heavy
+        resources may have been already loaded by other tests."""
+        # Arrange
+        env = {**os.environ, "DJANGO_SETTINGS_MODULE": os.environ.get("DJANGO_SETTINGS_MODULE", "config.settings")}
+
+        # Act
+        result = subprocess.run(
+            [sys.executable, "-c", STARTUP_SCRIPT],
+            cwd=settings.ROOT_DIR,
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        startup = json.loads(result.stdout.splitlines()[-1])
+
+        # Assert
+        self.assertEqual(startup["modules"], [])
+        self.assertEqual(startup["resources"], [])
+        max_rss_mb = startup["max_rss_kb"] / 1024
+        self.assertLess(
+            max_rss_mb,
+            STARTUP_RSS_BUDGET_MB,
+            f"Startup takes {max_rss_mb:.0f} MB of memory, budget is {STARTUP_RSS_BUDGET_MB} MB.",
+        )
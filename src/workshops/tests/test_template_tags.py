@@ -1,11 +1,18 @@
+import tracemalloc
+
+from django.contrib.contenttypes.models import ContentType
 from django.test import TestCase
+from django.utils import timezone
 from flags.sources import Condition, Flag  # type: ignore[import-untyped]
+from reversion.models import Revision, Version
 
+from src.workshops.models import Organization, Person
 from src.workshops.templatetags.feature_flag_conditions import (
     can_change_state,
     first_parameter_condition,
     parameter_strip_value,
 )
+from src.workshops.templatetags.revisions import last_modified
 
 
 class TestFeatureFlagConditions(TestCase):
@@ -60,3 +67,73 @@ class TestFeatureFlagConditions(TestCase):
         result = parameter_strip_value(url)
         # Assert
         self.assertEqual(result, "test")
+
+
+class TestLastModifiedTemplateTag(TestCase):
+    def setUp(self) -> None:
+        self.organization = Organization.objects.create(domain="example.org", fullname="Example")
+        self.creator = Person.objects.create(
+            personal="Harry", family="Potter", email="harry@potter.com", username="potter_harry"
+        )
+        self.editor = Person.objects.create(
+            personal="Hermione", family="Granger", email="hermione@granger.com", username="granger_hermione"
+        )
+
+    def create_versions(self, count: int, serialized_data: str = "{}") -> list[Version]:
+        users = [self.creator] + [self.editor] * (count - 1)
+        revisions = Revision.objects.bulk_create(
+            [Revision(date_created=timezone.now(), user=user, comment="") for user in users]
+        )
+        content_type = ContentType.objects.get_for_model(Organization)
+        return Version.objects.bulk_create(
+            [
+                Version(
+                    revision=revision,
+                    object_id=str(self.organization.pk),
+                    content_type=content_type,
+                    db="default",
+                    format="json",
+                    serialized_data=serialized_data,
+                    object_repr=str(self.organization),
+                )
+                for revision in revisions
+            ]
+        )
+
+    def test_last_modified__no_versions(self) -> None:
+        # Act
+        result = last_modified(self.organization)
+
+        # Assert
+        self.assertEqual(result, {"created": None, "last_modified": None})
+
+    def test_last_modified__single_version(self) -> None:
+        # Arrange
+        [version] = self.create_versions(1)
+
+        # Act
+        result = last_modified(self.organization)
+
+        # Assert
+        self.assertEqual(result, {"created": version, "last_modified": None})
+
+    def test_last_modified__long_history(self) -> None:
+        # Arrange
+        # each version has ~10 KB of data, ~10 MB in total
+        versions = self.create_versions(1000, serialized_data="x" * 10_000)
+
+        # Act
+        tracemalloc.start()
+        try:
+            with self.assertNumQueries(2):
+                result = last_modified(self.organization)
+                _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        # Assert
+        self.assertEqual(result["created"], versions[0])
+        self.assertEqual(result["created"].revision.user, self.creator)
+        self.assertEqual(result["last_modified"], versions[-1])
+        self.assertEqual(result["last_modified"].revision.user, self.editor)
+        self.assertLess(peak, 1024 * 1024)
@@ -2,27 +2,42 @@ from datetime import date, datetime, time, timedelta
 from typing import Any
 from unittest.mock import patch
 
+from django.core.paginator import PageNotAnInteger
 from django.test import RequestFactory, TestCase
 from django.utils import timezone
+from flags.models import FlagState  # type: ignore[import-untyped]
 
 from src.consents.models import Consent, Term
 from src.workshops.exceptions import InternalError
-from src.workshops.models import Event, Language, Organization, Person, WorkshopRequest
+from src.workshops.models import Event, Language, Organization, Person, Qualification, WorkshopRequest
 from src.workshops.tests.base import TestBase
 from src.workshops.utils.consents import archive_least_recent_active_consents
 from src.workshops.utils.dates import human_daterange
 from src.workshops.utils.emails import match_notification_email
-from src.workshops.utils.feature_flags import feature_flag_enabled
+from src.workshops.utils.feature_flags import (
+    CachedDatabaseFlagsSource,
+    feature_flag_enabled,
+    invalidate_flag_states_cache,
+)
+from src.workshops.utils.markdown import MarkdownRenderCache, markdown_cache_key
 from src.workshops.utils.metadata import (
     datetime_decode,
     datetime_match,
     metadata_deserialize,
     metadata_serialize,
 )
-from src.workshops.utils.pagination import Paginator
+from src.workshops.utils.pagination import (
+    MAX_ITEMS_PER_PAGE,
+    EstimatedCountPaginator,
+    NoCountPaginator,
+    Paginator,
+    get_pagination_items,
+)
+from src.workshops.utils.querysets import sync_many_to_many
 from src.workshops.utils.reports import reports_link, reports_link_hash
 from src.workshops.utils.urls import safe_next_or_default_url
 from src.workshops.utils.usernames import create_username
+from src.workshops.utils.version import get_version, load_version, read_version_from_toml
 from src.workshops.utils.views import assign
 
 
@@ -277,6 +292,126 @@ class TestPaginatorSections(TestBase):
         )
 
 
+class TestNoCountPaginator(TestBase):
+    def test_pages(self) -> None:
+        # Arrange
+        Organization.objects.bulk_create(
+            [Organization(domain=f"example{i}.org", fullname=f"Example {i}") for i in range(3)]
+        )
+        paginator = NoCountPaginator(Organization.objects.order_by("pk"), per_page=2)
+        organizations = list(Organization.objects.order_by("pk"))
+
+        # Act
+        with self.assertNumQueries(1):
+            first = paginator.page(1)
+            first_sections = list(paginator.paginate_sections())
+        last = paginator.page((len(organizations) + 1) // 2)
+        past_end = paginator.page(999)
+
+        # Assert
+        self.assertEqual(list(first), organizations[:2])
+        self.assertTrue(first.has_next())
+        self.assertFalse(first.has_previous())
+        self.assertEqual(first_sections, [1, 2])
+        self.assertFalse(last.has_next())
+        self.assertEqual(list(past_end), [])
+        self.assertFalse(past_end.has_next())
+
+    def test_invalid_page_number(self) -> None:
+        # Arrange
+        paginator = NoCountPaginator(Organization.objects.order_by("pk"), per_page=2)
+
+        # Act & Assert
+        self.assertEqual(paginator.page(-1).number, 1)
+        with self.assertRaises(PageNotAnInteger):
+            paginator.page("abc")
+
+
+class TestEstimatedCountPaginator(TestBase):
+    def test_small_estimate_replaced_with_count(self) -> None:
+        # Arrange
+        paginator = EstimatedCountPaginator(Organization.objects.order_by("pk"), per_page=2)
+
+        # Act
+        with patch("src.workshops.utils.pagination.table_rows_estimate", return_value=100):
+            count = paginator.count
+
+        # Assert
+        self.assertEqual(count, Organization.objects.count())
+        self.assertFalse(paginator.estimated)
+
+    def test_whole_table_estimate(self) -> None:
+        # Arrange
+        paginator = EstimatedCountPaginator(Organization.objects.order_by("pk"), per_page=2)
+
+        # Act
+        with patch("src.workshops.utils.pagination.table_rows_estimate", return_value=50_000):
+            count = paginator.count
+            page = paginator.page(2)
+
+        # Assert
+        self.assertEqual(count, 50_000)
+        self.assertTrue(paginator.estimated)
+        self.assertEqual(list(page), list(Organization.objects.order_by("pk")[2:4]))
+
+    def test_filtered_queryset_estimate(self) -> None:
+        # Arrange
+        paginator = EstimatedCountPaginator(Organization.objects.filter(fullname__contains="a"), per_page=2)
+
+        # Act
+        with patch("src.workshops.utils.pagination.query_rows_estimate", return_value=50_000) as estimate:
+            count = paginator.count
+
+        # Assert
+        self.assertEqual(count, 50_000)
+        estimate.assert_called_once()
+
+    def test_page_after_estimated_end(self) -> None:
+        # Arrange
+        paginator = EstimatedCountPaginator(Organization.objects.order_by("pk"), per_page=2)
+
+        # Act
+        with patch("src.workshops.utils.pagination.table_rows_estimate", return_value=50_000):
+            page = paginator.page(50_000)
+
+        # Assert
+        self.assertEqual(list(page), [])
+
+
+class TestGetPaginationItems(TestBase):
+    def test_all_items_capped(self) -> None:
+        # Arrange
+        request = RequestFactory().get("/", {"items_per_page": "all"})
+
+        # Act
+        page = get_pagination_items(request, Organization.objects.order_by("pk"))
+
+        # Assert
+        self.assertEqual(page.paginator.per_page, MAX_ITEMS_PER_PAGE)
+        self.assertEqual(list(page), list(Organization.objects.order_by("pk")))
+
+    def test_items_per_page_capped(self) -> None:
+        # Arrange
+        request = RequestFactory().get("/", {"items_per_page": str(MAX_ITEMS_PER_PAGE * 10)})
+
+        # Act
+        page = get_pagination_items(request, Organization.objects.order_by("pk"))
+
+        # Assert
+        self.assertEqual(page.paginator.per_page, MAX_ITEMS_PER_PAGE)
+
+    def test_paginator_class(self) -> None:
+        # Arrange
+        request = RequestFactory().get("/", {"page": "2", "items_per_page": "1"})
+
+        # Act
+        page = get_pagination_items(request, Organization.objects.order_by("pk"), NoCountPaginator)
+
+        # Assert
+        self.assertIsInstance(page.paginator, NoCountPaginator)
+        self.assertEqual(page.number, 2)
+
+
 class TestAssignUtil(TestBase):
     def setUp(self) -> None:
         """Set up RequestFactory for making fast fake requests."""
@@ -538,6 +673,49 @@ class TestArchiveLeastRecentActiveConsents(TestBase):
             self.assertEqual(consent.person, self.base_obj)
 
 
+class TestSyncManyToMany(TestBase):
+    def setUp(self) -> None:
+        self._setUpLessons()
+        self.person = Person.objects.create(personal="A", family="Person", username="testing-A")
+        Qualification.objects.create(person=self.person, lesson=self.git)
+        Qualification.objects.create(person=self.person, lesson=self.sql)
+
+    def test_same_state_as_set(self) -> None:
+        # Arrange
+        other = Person.objects.create(personal="B", family="Person", username="testing-B")
+        Qualification.objects.create(person=other, lesson=self.git)
+        Qualification.objects.create(person=other, lesson=self.sql)
+        lessons = [self.git, self.matlab]
+
+        # Act
+        result = sync_many_to_many(self.person.lessons, lessons)
+        other.lessons.set(lessons)
+
+        # Assert
+        self.assertEqual(result, (1, 1))
+        self.assertEqual(set(self.person.lessons.all()), set(other.lessons.all()))
+
+    def test_applies_difference_only(self) -> None:
+        # Arrange
+        kept = Qualification.objects.get(person=self.person, lesson=self.git)
+
+        # Act
+        with self.assertNumQueries(3):
+            sync_many_to_many(self.person.lessons, [self.git, self.r])
+
+        # Assert
+        self.assertTrue(Qualification.objects.filter(pk=kept.pk).exists())
+        self.assertEqual(set(self.person.lessons.all()), {self.git, self.r})
+
+    def test_no_changes(self) -> None:
+        # Act
+        with self.assertNumQueries(1):
+            result = sync_many_to_many(self.person.lessons, [self.git, self.sql])
+
+        # Assert
+        self.assertEqual(result, (0, 0))
+
+
 class TestFeatureFlagEnabled(TestCase):
     def test_feature_flag_enabled_decorator(self) -> None:
         with (
@@ -593,6 +771,59 @@ class TestFeatureFlagEnabled(TestCase):
             mock_logger.debug.assert_called_once_with(DEBUG_MSG)
 
 
+class TestCachedDatabaseFlagsSource(TestCase):
+    def setUp(self) -> None:
+        invalidate_flag_states_cache()
+
+    def tearDown(self) -> None:
+        invalidate_flag_states_cache()
+
+    def test_flag_states_queried_once(self) -> None:
+        # Arrange
+        FlagState.objects.create(name="TEST_FLAG", condition="boolean", value="True")
+        source = CachedDatabaseFlagsSource()
+
+        # Act & Assert
+        with self.assertNumQueries(1):
+            flags1 = source.get_flags()
+            flags2 = CachedDatabaseFlagsSource().get_flags()
+
+        self.assertEqual(list(flags1.keys()), ["TEST_FLAG"])
+        self.assertEqual(flags1.keys(), flags2.keys())
+
+    def test_cache_invalidated_on_flag_state_save(self) -> None:
+        # Arrange
+        source = CachedDatabaseFlagsSource()
+        self.assertEqual(source.get_flags(), {})
+
+        # Act
+        FlagState.objects.create(name="TEST_FLAG", condition="boolean", value="True")
+
+        # Assert
+        self.assertEqual(list(source.get_flags().keys()), ["TEST_FLAG"])
+
+    def test_cache_invalidated_on_flag_state_delete(self) -> None:
+        # Arrange
+        flag_state = FlagState.objects.create(name="TEST_FLAG", condition="boolean", value="True")
+        source = CachedDatabaseFlagsSource()
+        self.assertEqual(list(source.get_flags().keys()), ["TEST_FLAG"])
+
+        # Act
+        flag_state.delete()
+
+        # Assert
+        self.assertEqual(source.get_flags(), {})
+
+    def test_cache_expires(self) -> None:
+        # Arrange
+        source = CachedDatabaseFlagsSource()
+        source.get_flags()
+
+        # Act & Assert
+        with patch("src.workshops.utils.feature_flags.FLAG_STATES_CACHE_TIMEOUT", -1), self.assertNumQueries(1):
+            source.get_flags()
+
+
 class TestSafeNextOrDefaultURL(TestCase):
     def test_default_url_if_next_empty(self) -> None:
         # Arrange
@@ -638,3 +869,64 @@ class TestSafeNextOrDefaultURL(TestCase):
         url = safe_next_or_default_url(next_url, default_url)
         # Assert
         self.assertEqual(url, "/")  # Safe fallback
+
+
+class TestVersion(TestCase):
+    def tearDown(self) -> None:
+        load_version()
+
+    def test_load_version__from_toml(self) -> None:
+        # Act
+        with patch.dict("os.environ", {"AMY_VERSION": ""}):
+            version = load_version()
+        # Assert
+        self.assertEqual(version, read_version_from_toml())
+        self.assertEqual(get_version(), version)
+
+    def test_load_version__env_override(self) -> None:
+        # Act
+        with patch.dict("os.environ", {"AMY_VERSION": "1.2.3-test"}):
+            version = load_version()
+        # Assert
+        self.assertEqual(version, "1.2.3-test")
+        self.assertEqual(get_version(), "1.2.3-test")
+
+    def test_get_version__computed_once(self) -> None:
+        # Arrange
+        load_version()
+        # Act
+        with patch("src.workshops.utils.version.read_version_from_toml") as mock_read:
+            get_version()
+            get_version()
+        # Assert
+        mock_read.assert_not_called()
+
+
+class TestMarkdownRenderCache(TestCase):
+    def test_render(self) -> None:
+        # Arrange
+        markdown_cache = MarkdownRenderCache()
+
+        # Act
+        with self.assertNumQueries(0):
+            html1 = markdown_cache.render("**bold**")
+            html2 = markdown_cache.render("**bold**")
+
+        # Assert
+        self.assertEqual(html1, html2)
+        self.assertIn("<strong>bold</strong>", html1)
+        self.assertEqual(markdown_cache.stats.misses, 1)
+        self.assertEqual(markdown_cache.stats.hits, 1)
+        self.assertEqual(markdown_cache.stats.hit_ratio, 0.5)
+
+    def test_size_bounded(self) -> None:
+        # Arrange
+        markdown_cache = MarkdownRenderCache(maxsize=2)
+
+        # Act
+        for source in ["a", "b", "a", "c"]:
+            markdown_cache.render(source)
+
+        # Assert
+        # "b" was the least recently used render
+        self.assertEqual(list(markdown_cache._renders), [markdown_cache_key("a"), markdown_cache_key("c")])
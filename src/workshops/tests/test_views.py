@@ -1,9 +1,17 @@
+from datetime import datetime, timedelta
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection
+from django.db.models import Model
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
-from reversion.models import Revision
+from django.utils import timezone
+from reversion.models import Revision, Version
 from reversion.revisions import create_revision
 
-from src.workshops.models import Event, Role, Tag, Task
+from src.workshops.models import Event, Person, Role, Tag, Task
 from src.workshops.tests.base import TestBase
+from src.workshops.utils.pagination import encode_keyset_cursor
 
 
 class TestChangesLogView(TestBase):
@@ -55,3 +63,98 @@ class TestChangesLogView(TestBase):
         # check that links point to the correct versions
         expected = f'<a href="/workshops/version/{version.pk}/">{version}</a>'
         self.assertContains(rv, expected, html=True)
+
+    def create_revisions(self, count: int, obj: Model, user: Person | None = None) -> list[Revision]:
+        """Revisions one hour apart, the newest one an hour ago."""
+        now = timezone.now()
+        revisions = Revision.objects.bulk_create(
+            [Revision(date_created=now - timedelta(hours=count - i), user=user, comment="") for i in range(count)]
+        )
+        Version.objects.bulk_create(
+            [
+                Version(
+                    revision=revision,
+                    object_id=str(obj.pk),
+                    content_type=ContentType.objects.get_for_model(obj),
+                    db="default",
+                    format="json",
+                    serialized_data="[]",
+                    object_repr=f"{obj} #{i}",
+                )
+                for i, revision in enumerate(revisions)
+            ]
+        )
+        return revisions
+
+    def test_changes_log_keyset_pages(self) -> None:
+        # Arrange
+        Revision.objects.all().delete()
+        revisions = self.create_revisions(30, self.org_alpha)
+        url = reverse("changes_log")
+
+        # Act
+        first_page = self.client.get(url).context["log"]
+        second_page = self.client.get(url, {"older_than": first_page.older_cursor}).context["log"]
+        back_page = self.client.get(url, {"newer_than": second_page.newer_cursor}).context["log"]
+
+        # Assert
+        self.assertEqual([change.pk for change in first_page], [r.pk for r in revisions[::-1][:25]])
+        self.assertIsNone(first_page.newer_cursor)
+        self.assertEqual([change.pk for change in second_page], [r.pk for r in revisions[::-1][25:]])
+        self.assertIsNone(second_page.older_cursor)
+        self.assertEqual([change.pk for change in back_page], [change.pk for change in first_page])
+        self.assertIsNone(back_page.newer_cursor)
+
+    def test_changes_log_same_date_revisions(self) -> None:
+        # Arrange
+        Revision.objects.all().delete()
+        revisions = self.create_revisions(30, self.org_alpha)
+        Revision.objects.update(date_created=timezone.now())
+        url = reverse("changes_log")
+
+        # Act
+        first_page = self.client.get(url).context["log"]
+        second_page = self.client.get(url, {"older_than": first_page.older_cursor}).context["log"]
+
+        # Assert
+        self.assertEqual(
+            [change.pk for change in [*first_page, *second_page]],
+            [r.pk for r in revisions[::-1]],
+        )
+
+    def test_changes_log_query_count_independent_of_depth(self) -> None:
+        # Arrange
+        Revision.objects.all().delete()
+        revisions = self.create_revisions(100, self.org_alpha)
+        deep = revisions[10]
+        url = reverse("changes_log")
+        self.client.get(url)  # warm up caches, e.g. content types
+
+        # Act
+        with CaptureQueriesContext(connection) as first_page_queries:
+            self.client.get(url)
+        with CaptureQueriesContext(connection) as deep_page_queries:
+            rv = self.client.get(url, {"older_than": encode_keyset_cursor(deep.date_created, deep.pk)})
+
+        # Assert
+        self.assertEqual(len(first_page_queries), len(deep_page_queries))
+        self.assertEqual([change.pk for change in rv.context["log"]], [r.pk for r in revisions[9::-1]])
+
+    def test_changes_log_filters(self) -> None:
+        # Arrange
+        Revision.objects.all().delete()
+        by_admin = self.create_revisions(3, self.org_alpha, user=self.admin)
+        other = self.create_revisions(2, self.org_beta)
+        event_revisions = self.create_revisions(2, Event.objects.create(host=self.org_alpha, slug="2024-01-01-test"))
+        Revision.objects.filter(pk=other[0].pk).update(date_created=datetime(2020, 1, 10, 23, 0, tzinfo=timezone.utc))
+        url = reverse("changes_log")
+
+        # Act
+        by_user = self.client.get(url, {"user": self.admin.pk}).context["log"]
+        by_model = self.client.get(url, {"model": ContentType.objects.get_for_model(Event).pk}).context["log"]
+        by_date = self.client.get(url, {"changed_after": "2020-01-10", "changed_before": "2020-01-10"}).context["log"]
+
+        # Assert
+        self.assertEqual({change.pk for change in by_user}, {r.pk for r in by_admin})
+        self.assertEqual({change.pk for change in by_model}, {r.pk for r in event_revisions})
+        self.assertEqual([change.pk for change in by_date], [other[0].pk])
@@ -0,0 +1,73 @@
+from unittest.mock import MagicMock, patch
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import DatabaseError
+from django.test import TestCase
+from django.urls import get_resolver
+
+from config.wsgi import application, create_application
+from src.workshops.models import Person
+from src.workshops.utils import feature_flags
+from src.workshops.utils.resources import resource_registry
+from src.workshops.utils.warmup import compile_templates, warm_up
+
+
+@patch("src.workshops.utils.warmup.connections")
+class TestWarmUp(TestCase):
+    def setUp(self) -> None:
+        ContentType.objects.clear_cache()
+        feature_flags.invalidate_flag_states_cache()
+
+    def test_warm_up(self, mock_connections: MagicMock) -> None:
+        # Act
+        timings = warm_up()
+
+        # Assert
+        self.assertEqual(list(timings), ["url_resolvers", "templates", "content_types", "feature_flags", "resources"])
+        self.assertTrue(get_resolver()._populated)
+        self.assertIsNotNone(feature_flags._flag_states_cache)
+        with self.assertNumQueries(0):
+            ContentType.objects.get_for_model(Person)
+        mock_connections.close_all.assert_called_once()
+
+    def test_warm_up__resources(self, mock_connections: MagicMock) -> None:
+        # Arrange
+        resource_registry.reset("iata_airports")
+
+        # Act
+        warm_up(["iata_airports"])
+
+        # Assert
+        self.assertIn("iata_airports", resource_registry.loaded())
+
+    def test_warm_up__database_not_available(self, mock_connections: MagicMock) -> None:
+        # Act
+        with (
+            patch("src.workshops.utils.warmup.warm_content_types", side_effect=DatabaseError),
+            self.assertLogs("amy", "WARNING"),
+        ):
+            timings = warm_up()
+
+        # Assert
+        self.assertIn("feature_flags", timings)
+        mock_connections.close_all.assert_called_once()
+
+    def test_create_application(self, mock_connections: MagicMock) -> None:
+        # Act
+        result = create_application()
+
+        # Assert
+        self.assertIs(result, application)
+        mock_connections.close_all.assert_called_once()
+
+
+class TestCompileTemplates(TestCase):
+    def test_project_templates_only(self) -> None:
+        # Act
+        result = compile_templates()
+
+        # Assert
+        self.assertEqual(result.errors, {})
+        self.assertIn("navigation.html", result.compiled)
+        self.assertIn("mailing/training_request.txt", result.compiled)
+        self.assertNotIn("admin/base.html", result.compiled)
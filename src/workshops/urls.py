@@ -5,6 +5,7 @@ from src.workshops import views
 urlpatterns = [
     # utility views
     path("log/", views.changes_log, name="changes_log"),
+    path("instrumentation/", views.instrumentation_metrics, name="instrumentation_metrics"),
     path("version/<int:version_id>/", views.object_changes, name="object_changes"),
     path("workshop_staff/", views.workshop_staff, name="workshop_staff"),
     path("workshop_staff/csv/", views.workshop_staff_csv, name="workshop_staff_csv"),
@@ -0,0 +1,597 @@
+"""Benchmark harness for the hottest AMY views and API endpoints.
+
+Scenarios are run with Django test client against a dedicated Postgres database
+seeded with `fake_database` data. See `manage.py benchmark --help`."""
+
+import itertools
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from datetime import date, timedelta
+from io import StringIO
+from pathlib import Path
+from random import seed as random_seed
+from typing import Any, TypedDict
+from urllib.parse import urlencode
+from urllib.request import urlopen
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.contrib.sites.models import Site
+from django.core.management import call_command
+from django.db import connection
+from django.db.models import Count
+from django.template.loaders.cached import Loader as CachedLoader
+from django.test import Client
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.crypto import get_random_string
+from django_comments.models import Comment
+from faker import Faker
+from reversion.models import Revision, Version
+
+from src.api.models import ChangeFeedEntry
+from src.consents.models import Consent, Term
+from src.dashboard.panels import invalidate_all_dashboard_panels
+from src.recruitment.models import InstructorRecruitment
+from src.workshops.models import Event, Organization, Person, TrainingProgress, TrainingRequirement
+from src.workshops.utils.fragment_cache import fragment_cache
+from src.workshops.utils.markdown import markdown_cache
+from src.workshops.utils.pagination import encode_keyset_cursor
+from src.workshops.utils.warmup import django_template_engines
+
+# Same order as `make dev_database`.
+SEED_SCRIPTS = (
+    "seed_badges",
+    "seed_communityroles",
+    "seed_training_requirements",
+    "seed_involvements",
+    "seed_emails",
+    "seed_event_categories",
+    "seed_benefits",
+    "seed_account_benefit_discounts",
+)
+
+BENCHMARK_ADMIN_USERNAME = "benchmark-admin"
+
+CHANGE_FEED_BATCH_SIZE = 1000
+REVISION_HISTORY_BATCH_SIZE = 1000
+TRAINING_PROGRESS_BATCH_SIZE = 1000
+OPEN_RECRUITMENTS_BATCH_SIZE = 1000
+# Requirements checked by instructor eligibility.
+TRAINING_PROGRESS_REQUIREMENTS = ("Training", "Get Involved", "Welcome Session", "Demo")
+
+
+@dataclass
+class Scenario:
+    name: str
+    # Called after the database is seeded, so that URLs can point to existing objects.
+    url: Callable[[], str]
+    # Called before each request (untimed), e.g. to clear caches.
+    before_request: Callable[[], None] | None = None
+
+
+@dataclass
+class ScenarioResult:
+    name: str
+    url: str
+    status_code: int
+    repeat: int
+    wall_time_ms_min: float
+    wall_time_ms_median: float
+    wall_time_ms_max: float
+    query_count: int
+    peak_memory_kb: float
+    cpu_time_ms_median: float = 0.0
+
+
+class ScenarioComparison(TypedDict):
+    name: str
+    wall_time_ms_median: float
+    baseline_wall_time_ms_median: float
+    wall_time_change_pct: float
+    query_count: int
+    baseline_query_count: int
+
+
+def busiest_person() -> Person:
+    return Person.objects.annotate(num_tasks=Count("task")).order_by("-num_tasks", "pk")[0]
+
+
+def busiest_event() -> Event:
+    return Event.objects.annotate(num_tasks=Count("task")).order_by("-num_tasks", "pk")[0]
+
+
+def change_feed_since_before_end(entries: int) -> str:
+    """`since` parameter reading the last `entries` entries of the change feed. It's
+    omitted for shorter feeds, which are then read from the start."""
+    cursors = ChangeFeedEntry.objects.order_by("-transaction_id", "-id")[entries : entries + 1]
+    if not cursors:
+        return ""
+    return "&" + urlencode({"since": str(cursors[0].cursor)})
+
+
+def changes_log_cursor_at_depth(revisions: int) -> str:
+    """Cursor of the changes log page starting `revisions` deep."""
+    found = Revision.objects.order_by("-date_created", "-pk")[revisions : revisions + 1]
+    if not found:
+        return ""
+    return "?" + urlencode({"older_than": encode_keyset_cursor(found[0].date_created, found[0].pk)})
+
+
+def most_commented_person() -> Person:
+    content_type = ContentType.objects.get_for_model(Person)
+    person_pk = (
+        Comment.objects.filter(content_type=content_type)
+        .values("object_pk")
+        .annotate(num_comments=Count("pk"))
+        .order_by("-num_comments")
+        .values_list("object_pk", flat=True)
+        .first()
+    )
+    return Person.objects.get(pk=person_pk) if person_pk else busiest_person()
+
+
+def clear_markdown_cache() -> None:
+    markdown_cache.clear()
+
+
+SCENARIOS: list[Scenario] = [
+    Scenario("all_persons", lambda: reverse("all_persons")),
+    Scenario(
+        "person_details_comments_cached",
+        lambda: reverse("person_details", args=[most_commented_person().pk]),
+    ),
+    Scenario(
+        "person_details_comments_uncached",
+        lambda: reverse("person_details", args=[most_commented_person().pk]),
+        before_request=clear_markdown_cache,
+    ),
+    Scenario("person_details", lambda: reverse("person_details", args=[busiest_person().pk])),
+    Scenario("all_persons_deep_page", lambda: reverse("all_persons") + "?page=100"),
+    Scenario("all_events", lambda: reverse("all_events")),
+    Scenario("all_events_all_items", lambda: reverse("all_events") + "?items_per_page=all"),
+    Scenario("event_details", lambda: reverse("event_details", args=[busiest_event().slug])),
+    Scenario("dashboard_search", lambda: reverse("search") + "?term=an&no_redirect=1"),
+    Scenario("all_instructorrecruitment", lambda: reverse("all_instructorrecruitment")),
+    Scenario("upcoming_teaching_opportunities", lambda: reverse("upcoming-teaching-opportunities")),
+    # unassigned events: the largest dashboard panels
+    Scenario(
+        "admin_dashboard_cold",
+        lambda: reverse("admin-dashboard") + "?assigned_to=",
+        before_request=invalidate_all_dashboard_panels,
+    ),
+    Scenario("admin_dashboard_warm", lambda: reverse("admin-dashboard") + "?assigned_to="),
+    Scenario("all_trainees", lambda: reverse("all_trainees")),
+    Scenario("all_trainees_eligible", lambda: reverse("all_trainees") + "?is_instructor=eligible"),
+    Scenario("all_trainingrequests", lambda: reverse("all_trainingrequests")),
+    Scenario("api_v2_person_list", lambda: reverse("api-v2:person-list") + "?page_size=100"),
+    Scenario("api_v2_event_list", lambda: reverse("api-v2:event-list") + "?page_size=100"),
+    Scenario("api_v2_task_list", lambda: reverse("api-v2:task-list") + "?page_size=100"),
+    Scenario("api_v2_membership_list", lambda: reverse("api-v2:membership-list") + "?page_size=100"),
+    Scenario("api_v2_scheduledemail_list", lambda: reverse("api-v2:scheduledemail-list") + "?page_size=100"),
+    Scenario("changes_log_first_page", lambda: reverse("changes_log")),
+    Scenario(
+        "changes_log_deep_page",
+        lambda: reverse("changes_log") + changes_log_cursor_at_depth(Revision.objects.count() // 2),
+    ),
+    Scenario("api_v2_changes_oldest", lambda: reverse("api-v2:changes") + "?limit=1000"),
+    Scenario(
+        "api_v2_changes_newest",
+        lambda: reverse("api-v2:changes") + "?limit=1000" + change_feed_since_before_end(1000),
+    ),
+]
+
+
+# Pages rendering the most templates, benchmarked with cold and warm template
+# caches by `benchmark --templates`.
+TEMPLATE_SCENARIOS = (
+    "all_persons",
+    "person_details",
+    "all_events",
+    "event_details",
+    "all_instructorrecruitment",
+    "upcoming_teaching_opportunities",
+    "admin_dashboard_warm",
+    "all_trainees",
+    "all_trainingrequests",
+    "changes_log_first_page",
+)
+
+
+def clear_template_caches() -> None:
+    """Forget compiled templates and rendered fragments, as in a freshly started
+    worker."""
+    for engine in django_template_engines():
+        for loader in engine.engine.template_loaders:
+            if isinstance(loader, CachedLoader):
+                loader.reset()
+    fragment_cache.clear()
+
+
+def template_scenarios(scenarios: list[Scenario]) -> list[Scenario]:
+    """Variants of given scenarios of `TEMPLATE_SCENARIOS` pages, rendered with cold
+    and with warm template caches."""
+    variants = []
+    for scenario in scenarios:
+        if scenario.name in TEMPLATE_SCENARIOS:
+            variants += [
+                Scenario(f"{scenario.name}_cold_templates", scenario.url, before_request=clear_template_caches),
+                Scenario(f"{scenario.name}_warm_templates", scenario.url, before_request=scenario.before_request),
+            ]
+    return variants
+
+
+def seed_change_feed_history(rows: int, batch_size: int = CHANGE_FEED_BATCH_SIZE) -> None:
+    """Write `rows` change feed entries of existing persons, one transaction
+    per batch."""
+    content_type = ContentType.objects.get_for_model(Person)
+    person_pks = itertools.cycle(Person.objects.order_by("pk").values_list("pk", flat=True))
+    entries = (
+        ChangeFeedEntry(content_type=content_type, object_pk=str(pk), action=ChangeFeedEntry.Action.UPDATED)
+        for pk in itertools.islice(person_pks, rows)
+    )
+    for batch in itertools.batched(entries, batch_size, strict=False):
+        ChangeFeedEntry.objects.bulk_create(batch)
+
+
+def seed_revision_history(rows: int, batch_size: int = REVISION_HISTORY_BATCH_SIZE) -> None:
+    """Write `rows` revisions (one version of an existing person each), one minute
+    apart, ending now."""
+    content_type = ContentType.objects.get_for_model(Person)
+    persons = itertools.cycle(Person.objects.order_by("pk").values_list("pk", "username"))
+    users = itertools.cycle(Person.objects.filter(is_superuser=True).values_list("pk", flat=True) or [None])
+    start = timezone.now() - timedelta(minutes=rows)
+
+    for batch in itertools.batched(enumerate(itertools.islice(persons, rows)), batch_size, strict=False):
+        revisions = Revision.objects.bulk_create(
+            [Revision(date_created=start + timedelta(minutes=i), user_id=next(users), comment="") for i, _ in batch]
+        )
+        Version.objects.bulk_create(
+            [
+                Version(
+                    revision=revision,
+                    object_id=str(pk),
+                    content_type=content_type,
+                    db="default",
+                    format="json",
+                    serialized_data=json.dumps([{"model": "workshops.person", "pk": pk, "fields": {}}]),
+                    object_repr=username,
+                )
+                for revision, (_, (pk, username)) in zip(revisions, batch, strict=True)
+            ]
+        )
+
+
+def seed_training_progress(rows: int, batch_size: int = TRAINING_PROGRESS_BATCH_SIZE) -> None:
+    """Write `rows` training progresses, cycling through persons and requirements
+    checked by instructor eligibility. Most of them are passed."""
+    requirements = TrainingRequirement.objects.filter(name__in=TRAINING_PROGRESS_REQUIREMENTS).values_list(
+        "pk", flat=True
+    )
+    persons = Person.objects.order_by("pk").values_list("pk", flat=True)
+    if not requirements or not persons:
+        return
+
+    pairs = itertools.product(persons, requirements)
+    states = itertools.cycle("ppppppnfa")
+    for batch in itertools.batched(itertools.islice(itertools.cycle(pairs), rows), batch_size, strict=False):
+        TrainingProgress.objects.bulk_create(
+            [
+                TrainingProgress(trainee_id=person_pk, requirement_id=requirement_pk, state=next(states))
+                for person_pk, requirement_pk in batch
+            ]
+        )
+
+
+def seed_open_recruitments(rows: int, batch_size: int = OPEN_RECRUITMENTS_BATCH_SIZE) -> None:
+    """Write `rows` upcoming events with location and open instructor recruitment,
+    one transaction per batch."""
+    host = Organization.objects.order_by("pk").first()
+    if not rows or not host:
+        return
+
+    today = date.today()
+    for batch in itertools.batched(range(rows), batch_size, strict=False):
+        events = Event.objects.bulk_create(
+            [
+                Event(
+                    slug=f"{today + timedelta(days=1 + i % 365):%Y-%m-%d}-benchmark-recruitment-{i}",
+                    host=host,
+                    start=today + timedelta(days=1 + i % 365),
+                    end=today + timedelta(days=2 + i % 365),
+                    venue="Benchmark venue",
+                    latitude=0,
+                    longitude=0,
+                )
+                for i in batch
+            ]
+        )
+        InstructorRecruitment.objects.bulk_create([InstructorRecruitment(event=event, status="o") for event in events])
+
+
+def seed_comments(rows: int) -> None:
+    """Write `rows` Markdown comments regarding the busiest person."""
+    if not rows:
+        return
+
+    person = busiest_person()
+    site = Site.objects.get_current()
+    faker = Faker()
+    Comment.objects.bulk_create(
+        [
+            Comment(
+                content_type=ContentType.objects.get_for_model(Person),
+                object_pk=str(person.pk),
+                site=site,
+                user=person,
+                comment=(
+                    f"**{faker.sentence()}**\n\n{faker.paragraph()}\n\n"
+                    f"- {faker.sentence()}\n- [{faker.word()}]({faker.url()})\n\n`{faker.word()}`"
+                ),
+                submit_date=timezone.now(),
+            )
+            for _ in range(rows)
+        ]
+    )
+
+
+def seed_benchmark_database(
+    scale: int,
+    seed: int,
+    change_feed_rows: int = 0,
+    revisions: int = 0,
+    comments: int = 0,
+    training_progresses: int = 0,
+    open_recruitments: int = 0,
+) -> None:
+    """Populate the database with deterministic fake data `scale` times the size of
+    the regular development dataset, `change_feed_rows` change feed entries,
+    `revisions` revisions, `comments` comments regarding the busiest person,
+    `training_progresses` additional training progresses and `open_recruitments`
+    upcoming events with open instructor recruitment."""
+    # imported here to avoid loading all management commands on module import
+    from src.workshops.management.commands.fake_database import Command as FakeDatabaseCommand
+
+    Faker.seed(seed)
+    random_seed(seed)
+
+    for script in SEED_SCRIPTS:
+        call_command("runscript", script, stdout=StringIO())
+
+    FakeDatabaseCommand(stdout=StringIO()).populate_bulk(scale=scale)
+    seed_change_feed_history(change_feed_rows)
+    seed_revision_history(revisions)
+    seed_comments(comments)
+    seed_training_progress(training_progresses)
+    seed_open_recruitments(open_recruitments)
+
+
+def get_benchmark_admin() -> Person:
+    try:
+        return Person.objects.get(username=BENCHMARK_ADMIN_USERNAME)
+    except Person.DoesNotExist:
+        pass
+
+    admin = Person.objects.create_superuser(
+        username=BENCHMARK_ADMIN_USERNAME,
+        personal="Benchmark",
+        family="Admin",
+        email="benchmark-admin@example.org",
+        password=get_random_string(32),
+    )
+
+    # consent to required terms, otherwise every request is redirected by
+    # `TermsMiddleware`
+    terms = Term.objects.filter(required_type=Term.PROFILE_REQUIRE_TYPE).active().prefetch_active_options()
+    old_consents = {consent.term_id: consent for consent in Consent.objects.filter(person=admin).active()}
+    for term in terms:
+        Consent.reconsent(old_consents[term.pk], term.options[0])  # type: ignore
+
+    return admin
+
+
+def run_scenario(client: Client, scenario: Scenario, repeat: int) -> ScenarioResult:
+    url = scenario.url()
+
+    # warm-up request: fills template and URL resolver caches
+    client.get(url)
+
+    timings: list[float] = []
+    cpu_timings: list[float] = []
+    query_count = 0
+    status_code = 0
+    for _ in range(repeat):
+        if scenario.before_request:
+            scenario.before_request()
+        with CaptureQueriesContext(connection) as queries:
+            start = time.perf_counter()
+            cpu_start = time.process_time()
+            response = client.get(url)
+            cpu_timings.append((time.process_time() - cpu_start) * 1000)
+            timings.append((time.perf_counter() - start) * 1000)
+        query_count = len(queries.captured_queries)
+        status_code = response.status_code
+
+    # memory is measured separately, because tracing allocations slows down
+    # the request considerably
+    if scenario.before_request:
+        scenario.before_request()
+    tracemalloc.start()
+    try:
+        client.get(url)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return ScenarioResult(
+        name=scenario.name,
+        url=url,
+        status_code=status_code,
+        repeat=repeat,
+        wall_time_ms_min=round(min(timings), 3),
+        wall_time_ms_median=round(statistics.median(timings), 3),
+        wall_time_ms_max=round(max(timings), 3),
+        query_count=query_count,
+        peak_memory_kb=round(peak / 1024, 1),
+        cpu_time_ms_median=round(statistics.median(cpu_timings), 3),
+    )
+
+
+def run_scenarios(scenarios: list[Scenario], repeat: int) -> list[ScenarioResult]:
+    client = Client()
+    client.force_login(get_benchmark_admin())
+    return [run_scenario(client, scenario, repeat) for scenario in scenarios]
+
+
+def run_scenarios_with_instrumentation(scenarios: list[Scenario], repeat: int, enabled: bool) -> list[ScenarioResult]:
+    """Run scenarios with the instrumentation middleware enabled or disabled; the
+    middleware chain is built by the new client used for the run."""
+    with override_settings(INSTRUMENTATION_ENABLED=enabled):
+        return run_scenarios(scenarios, repeat)
+
+
+def build_report(results: list[ScenarioResult], **meta: Any) -> dict[str, Any]:
+    return {
+        "meta": meta,
+        "scenarios": {result.name: asdict(result) for result in results},
+    }
+
+
+def save_report(report: dict[str, Any], path: Path) -> None:
+    path.write_text(json.dumps(report, indent=2, sort_keys=True))
+
+
+def load_report(path: Path) -> dict[str, Any]:
+    return json.loads(path.read_text())  # type: ignore[no-any-return]
+
+
+def compare_reports(report: dict[str, Any], baseline: dict[str, Any]) -> list[ScenarioComparison]:
+    """Compare median wall time and query count of scenarios present in both
+    reports."""
+    comparisons: list[ScenarioComparison] = []
+
+    for name, result in report["scenarios"].items():
+        if name not in baseline["scenarios"]:
+            continue
+
+        baseline_result = baseline["scenarios"][name]
+        baseline_median = baseline_result["wall_time_ms_median"]
+        change_pct = (result["wall_time_ms_median"] - baseline_median) / baseline_median * 100 if baseline_median else 0
+
+        comparisons.append(
+            {
+                "name": name,
+                "wall_time_ms_median": result["wall_time_ms_median"],
+                "baseline_wall_time_ms_median": baseline_median,
+                "wall_time_change_pct": round(change_pct, 1),
+                "query_count": result["query_count"],
+                "baseline_query_count": baseline_result["query_count"],
+            }
+        )
+
+    return comparisons
+
+
+@dataclass
+class ServerBenchmarkResult:
+    name: str
+    preload: bool
+    workers: int
+    # from spawning gunicorn until the first request of each worker is answered
+    startup_ms: float
+    first_request_ms_median: float
+    first_request_ms_max: float
+    # sums over master and worker processes; PSS divides shared pages between
+    # processes, so it doesn't count memory shared after fork multiple times
+    total_rss_kb: float
+    total_pss_kb: float
+
+
+def child_pids(pid: int) -> list[int]:
+    """PIDs of all descendants of a process (Linux only)."""
+    children = Path(f"/proc/{pid}/task/{pid}/children").read_text().split()
+    return [descendant for child in map(int, children) for descendant in (child, *child_pids(child))]
+
+
+def process_memory_kb(pid: int) -> tuple[int, int]:
+    """RSS and PSS of a process in KiB (Linux only)."""
+    memory = {}
+    for line in Path(f"/proc/{pid}/smaps_rollup").read_text().splitlines():
+        key, _, value = line.partition(":")
+        if key in ("Rss", "Pss"):
+            memory[key] = int(value.split()[0])
+    return memory["Rss"], memory["Pss"]
+
+
+def wait_for_port(host: str, port: int, timeout: float) -> None:
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            socket.create_connection((host, port), timeout=timeout).close()
+            return
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(0.05)
+
+
+def timed_get(url: str, timeout: float) -> float:
+    start = time.perf_counter()
+    with urlopen(url, timeout=timeout) as response:
+        response.read()
+    return (time.perf_counter() - start) * 1000
+
+
+def run_server_benchmark(
+    name: str, preload: bool, workers: int, port: int, path: str, timeout: float = 120
+) -> ServerBenchmarkResult:
+    """Start gunicorn with `config/gunicorn_config.py`, send one request per worker
+    concurrently (sync workers take one at a time, so they're spread between
+    workers) and measure memory of all gunicorn processes afterwards."""
+    host = "127.0.0.1"
+    env = {
+        **os.environ,
+        "AMY_GUNICORN_PRELOAD": str(preload),
+        "AMY_GUNICORN_WORKERS": str(workers),
+        "AMY_GUNICORN_WORKER_CLASS": "sync",
+        "AMY_GUNICORN_THREADS": "1",
+        "AMY_GUNICORN_BIND": f"{host}:{port}",
+    }
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", "--config", "python:config.gunicorn_config"],
+        cwd=settings.ROOT_DIR,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        wait_for_port(host, port, timeout)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            latencies = list(executor.map(lambda _: timed_get(f"http://{host}:{port}{path}", timeout), range(workers)))
+        startup_ms = (time.perf_counter() - start) * 1000
+        memory = [process_memory_kb(pid) for pid in (process.pid, *child_pids(process.pid))]
+    finally:
+        process.terminate()
+        process.wait(timeout)
+
+    return ServerBenchmarkResult(
+        name=name,
+        preload=preload,
+        workers=workers,
+        startup_ms=round(startup_ms, 3),
+        first_request_ms_median=round(statistics.median(latencies), 3),
+        first_request_ms_max=round(max(latencies), 3),
+        total_rss_kb=sum(rss for rss, _ in memory),
+        total_pss_kb=sum(pss for _, pss in memory),
+    )
@@ -1,11 +1,21 @@
 import logging
-from collections.abc import Callable
+import time
+from collections.abc import Callable, Iterator, Mapping
+from functools import cached_property
 from typing import Any
 
+from django.http import HttpRequest
+from flags.sources import DatabaseFlagsSource, Flag, get_flags  # type: ignore[import-untyped]
 from flags.state import flag_enabled  # type: ignore[import-untyped]
 
 logger = logging.getLogger("amy")
 
+# Signal-based invalidation only reaches the current process, so other workers
+# pick up FlagState changes after this many seconds.
+FLAG_STATES_CACHE_TIMEOUT = 60
+
+_flag_states_cache: tuple[float, list[Any]] | None = None
+
 
 def feature_flag_enabled(feature_flag: str) -> Callable[..., Any]:
     """Check if the feature flag is enabled before running the function.
@@ -29,3 +39,49 @@ def feature_flag_enabled(feature_flag: str) -> Callable[..., Any]:
         return wrapper
 
     return func_wrapper
+
+
+def invalidate_flag_states_cache() -> None:
+    global _flag_states_cache
+    _flag_states_cache = None
+
+
+class CachedDatabaseFlagsSource(DatabaseFlagsSource):  # type: ignore[misc]
+    """Flag source reading `FlagState` rows once per process (per
+    `FLAG_STATES_CACHE_TIMEOUT`) instead of once per request."""
+
+    def get_queryset(self) -> list[Any]:
+        global _flag_states_cache
+        now = time.monotonic()
+
+        if _flag_states_cache is None or now - _flag_states_cache[0] > FLAG_STATES_CACHE_TIMEOUT:
+            _flag_states_cache = (now, list(super().get_queryset()))
+
+        return _flag_states_cache[1]
+
+
+class LazyFeatureFlags(Mapping[str, bool]):
+    """Per-request mapping of flag name to flag state. A flag's conditions are only
+    checked when the flag is read, and the result is memoised for the request."""
+
+    def __init__(self, request: HttpRequest) -> None:
+        self.request = request
+        self._states: dict[str, bool] = {}
+
+    @cached_property
+    def flags(self) -> dict[str, Flag]:
+        return get_flags(request=self.request)  # type: ignore[no-any-return]
+
+    def __getitem__(self, name: str) -> bool:
+        if name not in self._states:
+            self._states[name] = self.flags[name].check_state(request=self.request) is True
+        return self._states[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.flags)
+
+    def __len__(self) -> int:
+        return len(self.flags)
+
+    def enabled(self) -> list[Flag]:
+        return [flag for name, flag in self.flags.items() if self[name]]
@@ -0,0 +1,97 @@
+"""Cache of rendered template fragments, see `{% fragment_cache %}` tag.
+
+Fragments are keyed by their name and versions of the objects they depend on:
+objects with `last_updated_at` are versioned by it, other objects by values of
+their concrete fields, so changed objects result in a new key and fragments never
+need to be invalidated. Each worker process keeps the most recently used
+fragments in memory (bounded LRU); the shared (database) cache isn't used, as
+reading it would take as long as rendering the fragment.
+
+Changes of related objects that aren't passed to the tag (e.g. a renamed badge
+shown next to an award) are picked up when the fragment expires."""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from django.db.models import Model
+
+FRAGMENT_CACHE_TIMEOUT = 10 * 60
+# Max number of fragments kept in memory by each worker.
+FRAGMENT_CACHE_SIZE = 4096
+
+
+@dataclass
+class FragmentCacheStats:
+    hits: int = 0
+    misses: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses}
+
+
+def object_version(obj: Model) -> tuple[Any, ...]:
+    label = obj._meta.label_lower
+    if hasattr(obj, "last_updated_at"):
+        return (label, obj.pk, obj.last_updated_at)
+    # deferred fields are skipped instead of being loaded
+    return (label, *(obj.__dict__.get(field.attname) for field in obj._meta.concrete_fields))
+
+
+def fragment_version(value: Any) -> Any:
+    """Hashable representation of a value a fragment depends on. Querysets and
+    other iterables are evaluated."""
+    if isinstance(value, Model):
+        return object_version(value)
+    if isinstance(value, Mapping):
+        return tuple((fragment_version(key), fragment_version(item)) for key, item in value.items())
+    if isinstance(value, Iterable) and not isinstance(value, str | bytes):
+        return tuple(fragment_version(item) for item in value)
+    return value
+
+
+def fragment_cache_key(name: str, vary_on: Iterable[Any]) -> str:
+    digest = hashlib.sha256(repr(fragment_version(vary_on)).encode()).hexdigest()
+    return f"fragment:{name}:{digest}"
+
+
+class FragmentCache:
+    def __init__(self, maxsize: int = FRAGMENT_CACHE_SIZE, timeout: float = FRAGMENT_CACHE_TIMEOUT) -> None:
+        self.maxsize = maxsize
+        self.timeout = timeout
+        self.stats = FragmentCacheStats()
+        self._lock = threading.Lock()
+        # key -> (expiration time, rendered fragment)
+        self._fragments: OrderedDict[str, tuple[float, str]] = OrderedDict()
+
+    def get_or_render(self, name: str, vary_on: Iterable[Any], render: Callable[[], str]) -> str:
+        key = fragment_cache_key(name, vary_on)
+        now = time.monotonic()
+
+        with self._lock:
+            cached = self._fragments.get(key)
+            if cached is not None and cached[0] > now:
+                self._fragments.move_to_end(key)
+                self.stats.hits += 1
+                return cached[1]
+            self.stats.misses += 1
+
+        html = render()
+        with self._lock:
+            self._fragments[key] = (now + self.timeout, html)
+            self._fragments.move_to_end(key)
+            while len(self._fragments) > self.maxsize:
+                self._fragments.popitem(last=False)
+        return html
+
+    def clear(self) -> None:
+        with self._lock:
+            self._fragments.clear()
+            self.stats = FragmentCacheStats()
+
+
+fragment_cache = FragmentCache()
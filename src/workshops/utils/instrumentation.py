@@ -0,0 +1,127 @@
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+# Upper bounds (in milliseconds) of request wall time histogram buckets.
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, float("inf"))
+
+
+class QueryCounter:
+    """Database execute wrapper counting queries, SQL time and duplicated queries.
+
+    Use with `connection.execute_wrapper(counter)`."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.duration = 0.0  # seconds
+        self.statements: Counter[tuple[str, str]] = Counter()
+
+    def __call__(
+        self,
+        execute: Callable[..., Any],
+        sql: str,
+        params: Any,
+        many: bool,
+        context: dict[str, Any],
+    ) -> Any:
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - start
+            self.count += 1
+            self.statements[(sql, repr(params))] += 1
+
+    @property
+    def duplicates(self) -> int:
+        """Number of queries that repeat an already executed SQL with the same
+        parameters."""
+        return sum(count - 1 for count in self.statements.values())
+
+
+@dataclass
+class RequestMetrics:
+    view_name: str
+    method: str
+    status: int
+    duration_ms: float
+    query_count: int
+    query_duration_ms: float
+    duplicate_queries: int
+
+    def server_timing(self) -> str:
+        return (
+            f'db;dur={self.query_duration_ms:.1f};desc="{self.query_count} queries", '
+            f"app;dur={self.duration_ms - self.query_duration_ms:.1f}, "
+            f"total;dur={self.duration_ms:.1f}"
+        )
+
+
+@dataclass
+class ViewHistogram:
+    requests: int = 0
+    errors: int = 0
+    duration_ms_total: float = 0.0
+    duration_ms_max: float = 0.0
+    query_count_total: int = 0
+    query_count_max: int = 0
+    query_duration_ms_total: float = 0.0
+    duplicate_queries_total: int = 0
+    buckets: list[int] = field(default_factory=lambda: [0] * len(LATENCY_BUCKETS_MS))
+
+    def add(self, metrics: RequestMetrics) -> None:
+        self.requests += 1
+        self.errors += int(metrics.status >= 500)
+        self.duration_ms_total += metrics.duration_ms
+        self.duration_ms_max = max(self.duration_ms_max, metrics.duration_ms)
+        self.query_count_total += metrics.query_count
+        self.query_count_max = max(self.query_count_max, metrics.query_count)
+        self.query_duration_ms_total += metrics.query_duration_ms
+        self.duplicate_queries_total += metrics.duplicate_queries
+        for i, upper_bound in enumerate(LATENCY_BUCKETS_MS):
+            if metrics.duration_ms <= upper_bound:
+                self.buckets[i] += 1
+                break
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "duration_ms_avg": round(self.duration_ms_total / self.requests, 3) if self.requests else 0,
+            "duration_ms_max": round(self.duration_ms_max, 3),
+            "query_count_avg": round(self.query_count_total / self.requests, 3) if self.requests else 0,
+            "query_count_max": self.query_count_max,
+            "query_duration_ms_total": round(self.query_duration_ms_total, 3),
+            "duplicate_queries_total": self.duplicate_queries_total,
+            "latency_histogram_ms": {
+                ("+Inf" if bound == float("inf") else str(bound)): count
+                for bound, count in zip(LATENCY_BUCKETS_MS, self.buckets, strict=True)
+            },
+        }
+
+
+class MetricsRegistry:
+    """In-process aggregate of request metrics per view name. Each worker process
+    keeps its own registry."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._views: dict[str, ViewHistogram] = {}
+
+    def record(self, metrics: RequestMetrics) -> None:
+        with self._lock:
+            self._views.setdefault(metrics.view_name, ViewHistogram()).add(metrics)
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        with self._lock:
+            return {view_name: histogram.as_dict() for view_name, histogram in sorted(self._views.items())}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._views.clear()
+
+
+metrics_registry = MetricsRegistry()
@@ -0,0 +1,60 @@
+"""Request-scoped batch loaders for template tags (DataLoader pattern).
+
+A template tag evaluated once per object in a loop would otherwise run one query
+per object. Instead, keys of all objects can be queued beforehand with `prime()`
+and are then loaded together with a single query on the first `load()`. Loaded
+values are kept for the rest of the request, so repeated lookups (e.g. in
+included templates) don't hit the database."""
+
+from abc import ABC, abstractmethod
+from collections.abc import Hashable, Iterable
+from typing import Any, Self
+
+from django.http import HttpRequest
+
+REQUEST_ATTRIBUTE = "_batch_loaders"
+
+
+class BatchLoader[K: Hashable, V](ABC):
+    def __init__(self) -> None:
+        self._pending: set[K] = set()
+        self._loaded: dict[K, V] = {}
+
+    @classmethod
+    def for_request(cls, request: HttpRequest | None) -> Self:
+        """Loader shared by all templates rendered in the request. Without
+        a request (e.g. templates rendered outside of views), a new loader is
+        returned."""
+        if request is None:
+            return cls()
+        loaders: dict[type[BatchLoader[Any, Any]], Any] = request.__dict__.setdefault(REQUEST_ATTRIBUTE, {})
+        if cls not in loaders:
+            loaders[cls] = cls()
+        return loaders[cls]  # type: ignore[no-any-return]
+
+    def prime(self, keys: Iterable[K]) -> None:
+        """Queue keys to be loaded together with the next `load()`."""
+        self._pending.update(key for key in keys if key not in self._loaded)
+
+    def load(self, key: K) -> V:
+        if key not in self._loaded:
+            self._pending.add(key)
+            self.dispatch()
+        return self._loaded[key]
+
+    def dispatch(self) -> None:
+        keys, self._pending = self._pending, set()
+        values = self.batch_load(keys)
+        for key in keys:
+            self._loaded[key] = values[key] if key in values else self.missing(key)
+
+    @abstractmethod
+    def batch_load(self, keys: set[K]) -> dict[K, V]:
+        """Load values of all keys with a single query. Keys without a value can
+        be omitted."""
+        raise NotImplementedError()
+
+    @abstractmethod
+    def missing(self, key: K) -> V:
+        """Value of a key that `batch_load()` didn't return."""
+        raise NotImplementedError()
@@ -0,0 +1,82 @@
+"""Cached Markdown rendering.
+
+Rendered HTML is keyed by a hash of the Markdown source, so it never needs to be
+invalidated. Each worker process keeps the most recently used renders in memory
+(bounded LRU). There's no shared tier: the default cache is stored in the database,
+and a query per render costs about as much as rendering the Markdown again."""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, cast
+
+from markdownx.utils import markdownify
+
+# Change to invalidate cached renders, e.g. after changing Markdown extensions.
+MARKDOWN_CACHE_VERSION = 1
+# Max number of renders kept in memory by each worker.
+MARKDOWN_CACHE_SIZE = 2048
+# Longer sources aren't cached.
+MARKDOWN_CACHE_MAX_SOURCE_LENGTH = 64 * 1024
+
+
+@dataclass
+class MarkdownCacheStats:
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hit_ratio, 3),
+        }
+
+
+def markdown_cache_key(source: str) -> str:
+    digest = hashlib.sha256(source.encode()).hexdigest()
+    return f"markdown:{MARKDOWN_CACHE_VERSION}:{digest}"
+
+
+class MarkdownRenderCache:
+    def __init__(self, maxsize: int = MARKDOWN_CACHE_SIZE) -> None:
+        self.maxsize = maxsize
+        self.stats = MarkdownCacheStats()
+        self._lock = threading.Lock()
+        self._renders: OrderedDict[str, str] = OrderedDict()
+
+    def render(self, source: str) -> str:
+        key = markdown_cache_key(source)
+        with self._lock:
+            html = self._renders.get(key)
+            if html is not None:
+                self._renders.move_to_end(key)
+                self.stats.hits += 1
+                return html
+
+        html = cast(str, markdownify(source))  # type: ignore[no-untyped-call]
+        with self._lock:
+            self.stats.misses += 1
+            if len(source) <= MARKDOWN_CACHE_MAX_SOURCE_LENGTH:
+                self._renders[key] = html
+                while len(self._renders) > self.maxsize:
+                    self._renders.popitem(last=False)
+        return html
+
+    def clear(self) -> None:
+        with self._lock:
+            self._renders.clear()
+            self.stats = MarkdownCacheStats()
+
+
+markdown_cache = MarkdownRenderCache()
+
+
+def render_markdown(source: str) -> str:
+    return markdown_cache.render(source)
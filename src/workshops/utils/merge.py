@@ -1,8 +1,11 @@
 from collections.abc import Sequence
+from functools import reduce
+from operator import or_
+from typing import Any
 
 from django.contrib.contenttypes.models import ContentType
 from django.db import IntegrityError, transaction
-from django.db.models import Model
+from django.db.models import Exists, Field, Model, OuterRef, Q, QuerySet, UniqueConstraint
 from django_comments.models import Comment
 
 from src.consents.models import Consent, TrainingRequestConsent
@@ -13,6 +16,54 @@ from src.workshops.utils.consents import (
 )
 
 
+def unique_together_with(model: type[Model], field: Field[Any, Any]) -> list[tuple[list[str], Q | None]]:
+    """Other fields (and optional condition) of each unique constraint of `model`
+    that includes `field`."""
+    constraints: list[tuple[list[str], Q | None]] = []
+    if field.unique:
+        constraints.append(([], None))
+    for fields in model._meta.unique_together:
+        if field.name in fields:
+            constraints.append(([name for name in fields if name != field.name], None))
+    for constraint in model._meta.constraints:
+        if isinstance(constraint, UniqueConstraint) and field.name in constraint.fields:
+            constraints.append(([name for name in constraint.fields if name != field.name], constraint.condition))
+    return constraints
+
+
+def combine_related(manager: Any, to_add: QuerySet[Any], integrity_errors: list[str]) -> None:
+    """Relate objects from `to_add` to the manager's instance with a constant
+    number of queries.
+
+    M2M links are added with a single INSERT. For reverse FK relations, objects
+    that would become duplicates (violating a unique constraint) of objects
+    already related to the instance are removed first, and the rest is moved
+    with a single UPDATE."""
+    if hasattr(manager, "through"):
+        manager.add(*to_add.values_list("pk", flat=True))
+        return
+
+    field = manager.field
+    conflicts = []
+    for other_fields, condition in unique_together_with(to_add.model, field):
+        duplicates = to_add.model._base_manager.filter(
+            **{field.name: manager.instance}, **{name: OuterRef(name) for name in other_fields}
+        )
+        if condition is None:
+            conflicts.append(Q(Exists(duplicates)))
+        else:
+            conflicts.append(Q(Exists(duplicates.filter(condition))) & condition)
+
+    if conflicts:
+        try:
+            with transaction.atomic():
+                to_add.filter(reduce(or_, conflicts)).delete()
+        except IntegrityError as e:
+            integrity_errors.append(str(e))
+
+    to_add.update(**{field.name: manager.instance})
+
+
 def merge_objects[M: Model](
     object_a: M,
     object_b: M,
@@ -125,21 +176,13 @@ def merge_objects[M: Model](
                 if manager == related_b:
                     to_add = related_a.all()
 
-                # Some entries may cause IntegrityError (violation of
+                # Some entries would cause IntegrityError (violation of
                 # uniqueness constraint) because they are duplicates *after*
                 # being added by the manager.
                 # In this case they must be removed to not cause
                 # on_delete=PROTECT violation after merging
                 # (merging_obj.delete()).
-                for element in to_add:
-                    try:
-                        with transaction.atomic():
-                            manager.add(element)
-                    except IntegrityError:
-                        try:
-                            element.delete()
-                        except IntegrityError as e:
-                            integrity_errors.append(str(e))
+                combine_related(manager, to_add, integrity_errors)
 
             elif attr == "consent_set" and value == "most_recent":
                 # Special case: consents should be merge with a "most recent" strategy.
@@ -1,15 +1,25 @@
-from collections.abc import Iterable
+import json
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from functools import cached_property
 from itertools import chain
-from typing import TypeVar
+from typing import Any, TypeVar
 
 from django.core.paginator import EmptyPage, Page, PageNotAnInteger
 from django.core.paginator import Paginator as DjangoPaginator
-from django.db.models import Model, QuerySet
+from django.db import connections
+from django.db.models import Model, Q, QuerySet
 from django.http import HttpRequest
 
 _T = TypeVar("_T")
 
 ITEMS_PER_PAGE = 25
+# `?items_per_page=all` shows at most this many items
+MAX_ITEMS_PER_PAGE = 1000
+# estimates lower than this are replaced with exact counts
+ESTIMATED_COUNT_THRESHOLD = 10_000
+KEYSET_CURSOR_SEPARATOR = "_"
 
 
 class Paginator(DjangoPaginator[_T]):
@@ -89,8 +99,124 @@ class Paginator(DjangoPaginator[_T]):
         return pagination
 
 
-def get_pagination_items[MT: Model](request: HttpRequest, all_objects: QuerySet[MT]) -> Page[MT]:
-    """Select paginated items."""
+def is_whole_table(queryset: QuerySet[Any]) -> bool:
+    """Whether queryset selects (at most) one row per row of model's table."""
+    query = queryset.query
+    return not query.where and not query.distinct and not query.combinator and not query.is_sliced
+
+
+def table_rows_estimate(queryset: QuerySet[Any]) -> int:
+    """Number of rows in queryset's table according to Postgres statistics, or -1
+    if the table hasn't been analyzed yet."""
+    with connections[queryset.db].cursor() as cursor:
+        cursor.execute(
+            "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass", [queryset.model._meta.db_table]
+        )
+        row = cursor.fetchone()
+    return int(row[0]) if row else -1
+
+
+def query_rows_estimate(queryset: QuerySet[Any]) -> int:
+    """Number of rows returned by queryset according to Postgres query planner."""
+    plan = json.loads(queryset.order_by().explain(format="json"))
+    return int(plan["Plan"]["Plan Rows"])
+
+
+class EstimatedCountPaginator(Paginator[_T]):
+    """Paginator for large tables. Instead of `COUNT(*)` it uses table statistics
+    (for whole tables) or query planner estimate (for filtered querysets), unless
+    the estimate is lower than `ESTIMATED_COUNT_THRESHOLD`.
+
+    Estimated number of pages may be off, so pages after the estimated last page
+    are served too (possibly empty)."""
+
+    estimated = False
+
+    @cached_property
+    def count(self) -> int:
+        if isinstance(self.object_list, QuerySet):
+            if is_whole_table(self.object_list):
+                estimate = table_rows_estimate(self.object_list)
+            else:
+                estimate = query_rows_estimate(self.object_list)
+
+            if estimate >= ESTIMATED_COUNT_THRESHOLD:
+                self.estimated = True
+                return estimate
+
+        return super().count
+
+    def validate_number(self, number: int | float | str | None) -> int:
+        try:
+            return super().validate_number(number)
+        except EmptyPage:
+            if not self.estimated or int(number) < 1:  # type: ignore[arg-type]
+                raise
+            return int(number)  # type: ignore[arg-type]
+
+    def page(self, number: int | str) -> Page[_T]:
+        number = self.validate_number(number)
+        if not self.estimated:
+            return super().page(number)
+
+        self._page_number = number
+        bottom = (number - 1) * self.per_page
+        return self._get_page(self.object_list[bottom : bottom + self.per_page], number, self)
+
+
+class NoCountPage(Page[_T]):
+    def __init__(self, object_list: Sequence[_T], number: int, paginator: NoCountPaginator[_T], has_next: bool):
+        super().__init__(object_list, number, paginator)
+        self._has_next = has_next
+
+    def has_next(self) -> bool:
+        return self._has_next
+
+    def start_index(self) -> int:
+        if not self.object_list:
+            return 0
+        return self.paginator.per_page * (self.number - 1) + 1
+
+    def end_index(self) -> int:
+        return self.paginator.per_page * (self.number - 1) + len(self.object_list)
+
+
+class NoCountPaginator(Paginator[_T]):
+    """Paginator that never counts objects. It fetches one object more than
+    `per_page` to find out if there's a next page, so only pages up to the next
+    one are linked to."""
+
+    _has_next = False
+
+    def validate_number(self, number: int | float | str | None) -> int:
+        try:
+            if isinstance(number, float) and not number.is_integer():
+                raise ValueError
+            number = int(number)  # type: ignore[arg-type]
+        except (TypeError, ValueError) as exc:
+            raise PageNotAnInteger("That page number is not an integer") from exc
+        # pages after the last one are just empty
+        return max(number, 1)
+
+    def page(self, number: int | str) -> NoCountPage[_T]:
+        number = self.validate_number(number)
+        self._page_number = number
+        bottom = (number - 1) * self.per_page
+        objects = list(self.object_list[bottom : bottom + self.per_page + 1])
+        self._has_next = len(objects) > self.per_page
+        return NoCountPage(objects[: self.per_page], number, self, has_next=self._has_next)
+
+    def paginate_sections(self) -> Iterable[int | None]:
+        index = int(self._page_number or 1)
+        last = index + 1 if self._has_next else index
+        return range(max(index - 4, 1), last + 1)
+
+
+def get_pagination_items[MT: Model](
+    request: HttpRequest, all_objects: QuerySet[MT], paginator_class: type[Paginator[MT]] = Paginator
+) -> Page[MT]:
+    """Select paginated items. Use `paginator_class` to choose how (or if) all
+    objects are counted."""
 
     # Get parameters.
     items = request.GET.get("items_per_page", ITEMS_PER_PAGE)
@@ -100,14 +226,15 @@ def get_pagination_items[MT: Model](request: HttpRequest, all_objects: QuerySet[
         except ValueError:
             items = ITEMS_PER_PAGE
     else:
-        # Show everything.
-        items = all_objects.count()
+        # Show everything, but not more than the limit.
+        items = MAX_ITEMS_PER_PAGE
+    items = min(max(items, 1), MAX_ITEMS_PER_PAGE)
 
     # Figure out where we are.
     page = request.GET.get("page", 1)
 
     # Show selected items.
-    paginator = Paginator(all_objects, items)
+    paginator = paginator_class(all_objects, items)
 
     # Select the pages.
     try:
@@ -122,3 +249,77 @@ def get_pagination_items[MT: Model](request: HttpRequest, all_objects: QuerySet[
         result = paginator.page(paginator.num_pages)
 
     return result
+
+
+@dataclass
+class KeysetPage[MT: Model]:
+    """Page of objects ordered newest first by (date field, pk). Unlike `Page`, it
+    doesn't count all objects, and reading deep pages costs the same as the first one."""
+
+    object_list: list[MT]
+    # cursors for `newer_than`/`older_than` query parameters
+    newer_cursor: str | None
+    older_cursor: str | None
+
+    def __iter__(self) -> Iterator[MT]:
+        return iter(self.object_list)
+
+    def __len__(self) -> int:
+        return len(self.object_list)
+
+
+def encode_keyset_cursor(date: datetime, pk: int) -> str:
+    return f"{date.isoformat()}{KEYSET_CURSOR_SEPARATOR}{pk}"
+
+
+def decode_keyset_cursor(cursor: str) -> tuple[datetime, int] | None:
+    """Return `None` for malformed cursors."""
+    date, _, pk = cursor.rpartition(KEYSET_CURSOR_SEPARATOR)
+    try:
+        return datetime.fromisoformat(date), int(pk)
+    except ValueError:
+        return None
+
+
+def get_keyset_page_items[MT: Model](
+    request: HttpRequest, all_objects: QuerySet[MT], date_field: str, items_per_page: int = ITEMS_PER_PAGE
+) -> KeysetPage[MT]:
+    """Select page of objects before (`older_than`) or after (`newer_than`)
+    a cursor, or the newest objects."""
+
+    def key(obj: MT) -> str:
+        return encode_keyset_cursor(getattr(obj, date_field), obj.pk)
+
+    newer_than = decode_keyset_cursor(request.GET.get("newer_than", ""))
+    older_than = decode_keyset_cursor(request.GET.get("older_than", ""))
+
+    if newer_than:
+        date, pk = newer_than
+        # the first condition allows using range scan over (date, pk) index
+        objects = list(
+            all_objects.filter(**{f"{date_field}__gte": date})
+            .filter(Q(**{f"{date_field}__gt": date}) | Q(pk__gt=pk))
+            .order_by(date_field, "pk")[: items_per_page + 1]
+        )
+        has_newer = len(objects) > items_per_page
+        objects = objects[:items_per_page][::-1]
+        return KeysetPage(
+            objects,
+            newer_cursor=key(objects[0]) if has_newer else None,
+            older_cursor=key(objects[-1]) if objects else request.GET["newer_than"],
+        )
+
+    if older_than:
+        date, pk = older_than
+        all_objects = all_objects.filter(**{f"{date_field}__lte": date}).filter(
+            Q(**{f"{date_field}__lt": date}) | Q(pk__lt=pk)
+        )
+
+    objects = list(all_objects.order_by(f"-{date_field}", "-pk")[: items_per_page + 1])
+    has_older = len(objects) > items_per_page
+    objects = objects[:items_per_page]
+    return KeysetPage(
+        objects,
+        newer_cursor=(key(objects[0]) if objects else request.GET["older_than"]) if older_than else None,
+        older_cursor=key(objects[-1]) if has_older else None,
+    )
@@ -0,0 +1,54 @@
+from collections.abc import Iterable
+from typing import Any
+
+from django.db.models import F, Func, IntegerField, Model, QuerySet, Subquery
+
+
+class SubqueryCount(Subquery):
+    """Count rows of a (usually `OuterRef`-filtered) queryset in a correlated
+    subquery.
+
+    Unlike `Count()` annotations, subqueries don't multiply rows when several
+    relations are counted at once. An aggregate without GROUP BY always returns
+    a single row, so the result is never NULL."""
+
+    output_field = IntegerField()
+
+    def __init__(self, queryset: QuerySet[Any], **kwargs: Any) -> None:
+        queryset = (
+            queryset.order_by()
+            .annotate(
+                _count=Func(
+                    F("pk"),
+                    function="COUNT",
+                    template="%(function)s(DISTINCT %(expressions)s)",
+                    output_field=IntegerField(),
+                )
+            )
+            .values("_count")
+        )
+        super().__init__(queryset, **kwargs)
+
+
+def sync_many_to_many(manager: Any, targets: Iterable[Model]) -> tuple[int, int]:
+    """Make M2M relation `manager` (e.g. `person.lessons`) contain exactly `targets`.
+
+    Only the difference is applied: rows of the through model are read with one
+    query, removed with one `DELETE` and added with one `bulk_create()`. Unlike
+    `manager.set()` no `m2m_changed` signals are sent. Returns number of added
+    and removed rows."""
+    through = manager.through
+    source = {manager.source_field_name: manager.instance}
+    target_id_field = f"{manager.target_field_name}_id"
+
+    current = set(through.objects.filter(**source).values_list(target_id_field, flat=True))
+    wanted = {target.pk for target in targets}
+
+    removed = current - wanted
+    if removed:
+        through.objects.filter(**source, **{f"{target_id_field}__in": removed}).delete()
+
+    added = wanted - current
+    through.objects.bulk_create(through(**source, **{target_id_field: target_id}) for target_id in sorted(added))
+
+    return len(added), len(removed)
@@ -0,0 +1,104 @@
+import importlib
+import threading
+from collections.abc import Callable
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, cast
+
+from airportsdata import Airport
+from django.utils.functional import LazyObject, empty
+
+if TYPE_CHECKING:
+    from botocore.client import BaseClient
+
+
+class LazyResource(LazyObject):
+    """Proxy to a heavy module-level singleton (dataset, API client, optional
+    module) created on first use, at most once per process.
+
+    Unlike `SimpleLazyObject`, concurrent first accesses from multiple threads
+    create the resource only once."""
+
+    def __init__(self, name: str, factory: Callable[[], Any]) -> None:
+        # set through `__dict__`, as `LazyObject.__setattr__` forwards to the wrapped object
+        self.__dict__["_name"] = name
+        self.__dict__["_factory"] = factory
+        self.__dict__["_lock"] = threading.Lock()
+        super().__init__()
+
+    def _setup(self) -> None:
+        with self._lock:
+            if self._wrapped is empty:
+                self._wrapped = self._factory()
+
+    @property
+    def loaded(self) -> bool:
+        return self._wrapped is not empty
+
+    def reset(self) -> None:
+        with self._lock:
+            self._wrapped = empty
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__}: {self._name}{'' if self.loaded else ' (not loaded)'}>"
+
+
+class ResourceRegistry:
+    """Named lazy resources of the process. Each worker process creates its own
+    resources, unless they were warmed up before fork."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._resources: dict[str, LazyResource] = {}
+
+    def register[T](self, name: str, factory: Callable[[], T]) -> T:
+        """Register a resource and return its proxy, typed as the resource itself."""
+        with self._lock:
+            if name in self._resources:
+                raise ValueError(f"Resource {name!r} is already registered.")
+            resource = self._resources[name] = LazyResource(name, factory)
+        return cast(T, resource)
+
+    def warm(self, *names: str) -> None:
+        """Create given resources (all if no names are given) now instead of on
+        first use."""
+        for name in names or list(self._resources):
+            self._resources[name]._setup()
+
+    def reset(self, *names: str) -> None:
+        """Drop given resources (all if no names are given); they're created
+        again on next use."""
+        for name in names or list(self._resources):
+            self._resources[name].reset()
+
+    def loaded(self) -> list[str]:
+        return sorted(name for name, resource in self._resources.items() if resource.loaded)
+
+    def names(self) -> list[str]:
+        return sorted(self._resources)
+
+
+resource_registry = ResourceRegistry()
+
+
+def _load_iata_airports() -> dict[str, Airport]:
+    import airportsdata
+
+    return airportsdata.load("IATA")
+
+
+def _create_s3_client() -> BaseClient:
+    import boto3
+
+    return boto3.client("s3")
+
+
+def _import_cairosvg() -> ModuleType:
+    return importlib.import_module("cairosvg")
+
+
+# ~10k airports, parsed from a CSV file
+iata_airports = resource_registry.register("iata_airports", _load_iata_airports)
+# importing boto3 alone takes a noticeable part of worker boot time
+s3_client = resource_registry.register("s3_client", _create_s3_client)
+# needed only for rendering instructor badge certificates
+cairosvg = resource_registry.register("cairosvg", _import_cairosvg)
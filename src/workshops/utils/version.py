@@ -0,0 +1,33 @@
+import os
+from pathlib import Path
+from typing import cast
+
+import toml  # type: ignore[import-untyped]
+
+PYPROJECT_TOML_FILE = Path(__file__).parent.parent.parent.parent / "pyproject.toml"
+VERSION_ENV_VARIABLE = "AMY_VERSION"
+
+_version: str | None = None
+
+
+def read_version_from_toml() -> str:
+    data = toml.load(PYPROJECT_TOML_FILE)
+    return cast(str, data["project"]["version"])
+
+
+def load_version() -> str:
+    """Compute AMY version and store it for the lifetime of the process.
+
+    `AMY_VERSION` environment variable takes precedence over `pyproject.toml`, so that
+    container builds can bake the version in without shipping the TOML file."""
+    global _version
+    _version = os.environ.get(VERSION_ENV_VARIABLE) or read_version_from_toml()
+    return _version
+
+
+def get_version() -> str:
+    """Return AMY version computed at startup. Falls back to computing it on first use
+    if the app registry wasn't initialised (e.g. in standalone scripts)."""
+    if _version is None:
+        return load_version()
+    return _version
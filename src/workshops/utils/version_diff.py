@@ -0,0 +1,118 @@
+"""Diff between two versions (django-reversion) of an object.
+
+Related objects referenced by any relation field in either version are resolved
+together, with one `in_bulk()` query per related model. Versions never change,
+so computed diffs are cached per versions pair."""
+
+from collections import defaultdict
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any, cast
+
+from django.core.cache import cache
+from django.db.models import Field, Model
+from django.utils.html import format_html, format_html_join
+from django.utils.safestring import SafeString, mark_safe
+from reversion.models import Version
+from reversion_compare.helpers import SEMANTIC, html_diff
+
+# Related objects may be renamed, so cached diffs expire after some time.
+VERSION_DIFF_CACHE_TIMEOUT = 60 * 60
+
+type RelatedObjects = dict[type[Model], dict[Any, Model]]
+
+
+@dataclass(frozen=True)
+class FieldDiff:
+    verbose_name: str
+    html: SafeString
+
+
+def related_pks(version: Version, field: Field[Any, Any]) -> list[Any]:
+    """PKs of objects referenced by relation field in given version."""
+    value = version.field_dict.get(field.get_attname())
+    if field.many_to_one or field.one_to_one:
+        # {left,right}.field_dict[field_name] is a PK, None, or does not exist
+        return [value] if value else []
+    return list(value or [])
+
+
+def resolve_related_objects(versions: Iterable[Version], fields: Iterable[Field[Any, Any]]) -> RelatedObjects:
+    pks_by_model: dict[type[Model], set[Any]] = defaultdict(set)
+    for field in fields:
+        if field.is_relation and field.related_model is not None:
+            for version in versions:
+                pks_by_model[cast(type[Model], field.related_model)].update(related_pks(version, field))
+
+    return {model: model._default_manager.in_bulk(pks) for model, pks in pks_by_model.items() if pks}
+
+
+def relation_labels(css_class: str, prefix: str, objects: Iterable[Model | Any]) -> SafeString:
+    return format_html_join(
+        "",
+        '<a class="label {}" href="{}">{}{}</a>',
+        (
+            (css_class, obj.get_absolute_url() if hasattr(obj, "get_absolute_url") else "#", prefix, obj)
+            for obj in objects
+        ),
+    )
+
+
+def relation_diff(left_pks: list[Any], right_pks: list[Any], objects: dict[Any, Model]) -> SafeString:
+    """Labels of related objects. Objects that don't exist anymore are
+    represented by their PKs."""
+    # Relations that exist only in the current version
+    additions = [pk for pk in right_pks if pk not in left_pks]
+    # Relations that exist only in the previous version
+    deletions = [pk for pk in left_pks if pk not in right_pks]
+    # Relations that exist only in both versions
+    consistent = [pk for pk in left_pks if pk in right_pks]
+
+    return format_html(
+        "{}{}{}",
+        relation_labels("label-default", "", (objects.get(pk, pk) for pk in consistent)),
+        relation_labels("label-success", "+", (objects.get(pk, pk) for pk in additions)),
+        relation_labels("label-danger", "-", (objects.get(pk, pk) for pk in deletions)),
+    )
+
+
+def semantic_diff(left: Version, right: Version, field_name: str) -> SafeString:
+    left_txt = left.field_dict[field_name] or ""
+    right_txt = right.field_dict[field_name] or ""
+    return mark_safe(
+        cast(
+            SafeString,
+            html_diff(left_txt, right_txt, cleanup=SEMANTIC),  # type: ignore[no-untyped-call]
+        )
+    )
+
+
+def compute_version_diff(left: Version, right: Version, fields: list[Field[Any, Any]]) -> list[FieldDiff]:
+    objects = resolve_related_objects([left, right], fields)
+
+    diff = []
+    for field in fields:
+        if field.name == "id":
+            continue
+
+        if field.is_relation:
+            html = relation_diff(
+                related_pks(left, field),
+                related_pks(right, field),
+                objects.get(cast(type[Model], field.related_model), {}),
+            )
+        else:
+            html = semantic_diff(left, right, field.name)
+
+        diff.append(FieldDiff(str(field.verbose_name), html))
+
+    return diff
+
+
+def get_version_diff(left: Version, right: Version, fields: list[Field[Any, Any]]) -> list[FieldDiff]:
+    key = f"version_diff:{left.pk}:{right.pk}"
+    diff: list[FieldDiff] | None = cache.get(key)
+    if diff is None:
+        diff = compute_version_diff(left, right, fields)
+        cache.set(key, diff, VERSION_DIFF_CACHE_TIMEOUT)
+    return diff
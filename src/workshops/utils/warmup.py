@@ -0,0 +1,119 @@
+"""Warm-up of process-wide caches, run by gunicorn master before forking workers
+(see `config/gunicorn_config.py`), so that workers share the memory and don't
+pay for it on their first request."""
+
+import logging
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from django.apps import apps
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.db import DatabaseError, connections
+from django.template import TemplateDoesNotExist, TemplateSyntaxError, engines
+from django.template.backends.django import DjangoTemplates
+from django.template.utils import get_app_template_dirs
+from django.urls import URLResolver, get_resolver
+
+from src.workshops.utils.feature_flags import CachedDatabaseFlagsSource
+from src.workshops.utils.resources import resource_registry
+
+logger = logging.getLogger("amy")
+
+# Extensions of files in template directories rendered with Django templates.
+TEMPLATE_EXTENSIONS = (".html", ".txt")
+
+
+@dataclass
+class TemplateCompilation:
+    compiled: list[str] = field(default_factory=list)
+    errors: dict[str, Exception] = field(default_factory=dict)
+
+
+def django_template_engines() -> list[DjangoTemplates]:
+    return [engine for engine in engines.all() if isinstance(engine, DjangoTemplates)]
+
+
+def project_template_names(engine: DjangoTemplates) -> list[str]:
+    """Names of templates in the engine's directories (including app directories)
+    within the project, i.e. without templates of third-party apps."""
+    directories = [*engine.engine.dirs, *(get_app_template_dirs("templates") if engine.engine.app_dirs else ())]
+    names: set[str] = set()
+    for directory in map(Path, directories):
+        if not directory.is_relative_to(settings.APPS_DIR):
+            continue
+        for path in directory.rglob("*"):
+            if path.is_file() and path.suffix in TEMPLATE_EXTENSIONS:
+                names.add(path.relative_to(directory).as_posix())
+    return sorted(names)
+
+
+def compile_templates() -> TemplateCompilation:
+    """Compile all project templates; the cached template loader keeps them for
+    the rest of the process life."""
+    result = TemplateCompilation()
+    for engine in django_template_engines():
+        for template_name in project_template_names(engine):
+            try:
+                engine.get_template(template_name)
+            except (TemplateSyntaxError, TemplateDoesNotExist) as exc:
+                result.errors[template_name] = exc
+            else:
+                result.compiled.append(template_name)
+    return result
+
+
+def populate_url_resolver(resolver: URLResolver) -> None:
+    # otherwise reverse lookups of each resolver are built on first `reverse()`
+    resolver._populate()
+    for pattern in resolver.url_patterns:
+        if isinstance(pattern, URLResolver):
+            populate_url_resolver(pattern)
+
+
+def warm_url_resolvers() -> None:
+    populate_url_resolver(get_resolver())
+
+
+def warm_templates() -> None:
+    for template_name, exc in compile_templates().errors.items():
+        logger.error(f"Template {template_name} failed to compile: {exc}")
+
+
+def warm_content_types() -> None:
+    ContentType.objects.get_for_models(*apps.get_models())
+
+
+def warm_feature_flags() -> None:
+    CachedDatabaseFlagsSource().get_queryset()
+
+
+def warm_up(resources: Sequence[str] = ()) -> dict[str, float]:
+    """Run all warm-up steps and return their durations in milliseconds. Steps
+    that need the database are skipped with a warning if it's not available.
+
+    Database connections are closed afterwards, so that they aren't shared by
+    forked processes."""
+    steps: dict[str, Callable[[], None]] = {
+        "url_resolvers": warm_url_resolvers,
+        "templates": warm_templates,
+        "content_types": warm_content_types,
+        "feature_flags": warm_feature_flags,
+        "resources": lambda: resource_registry.warm(*resources) if resources else None,
+    }
+    timings: dict[str, float] = {}
+
+    try:
+        for name, step in steps.items():
+            start = time.perf_counter()
+            try:
+                step()
+            except DatabaseError as exc:
+                logger.warning(f"Warm-up step {name} failed: {exc}")
+            timings[name] = (time.perf_counter() - start) * 1000
+    finally:
+        connections.close_all()
+
+    return timings
@@ -28,18 +28,22 @@ from django.db.models import (
     F,
     FloatField,
     IntegerField,
+    OuterRef,
     Prefetch,
     ProtectedError,
     Q,
     QuerySet,
+    Subquery,
     Sum,
     Value,
     When,
 )
 from django.forms import HiddenInput
 from django.http import (
+    Http404,
     HttpRequest,
     HttpResponse,
+    JsonResponse,
 )
 from django.shortcuts import get_object_or_404, redirect, render
 from django.urls import reverse, reverse_lazy
@@ -118,6 +122,7 @@ from src.workshops.consts import IATA_AIRPORTS
 from src.workshops.exceptions import InternalError
 from src.workshops.filters import (
     BadgeAwardsFilter,
+    ChangesLogFilter,
     EventFilter,
     PersonFilter,
     TaskFilter,
@@ -155,16 +160,25 @@ from src.workshops.models import (
 )
 from src.workshops.signals import create_comment_signal
 from src.workshops.utils.access import OnlyForAdminsMixin, admin_required, login_required
+from src.workshops.utils.instrumentation import metrics_registry
+from src.workshops.utils.markdown import markdown_cache
 from src.workshops.utils.merge import merge_objects
-from src.workshops.utils.pagination import get_pagination_items
+from src.workshops.utils.pagination import (
+    EstimatedCountPaginator,
+    NoCountPaginator,
+    get_keyset_page_items,
+    get_pagination_items,
+)
 from src.workshops.utils.person_upload import (
     PersonTaskEntry,
     create_uploaded_persons_tasks,
     upload_person_task_csv,
     verify_upload_person_task,
 )
+from src.workshops.utils.querysets import sync_many_to_many
 from src.workshops.utils.urls import safe_next_or_default_url
 from src.workshops.utils.usernames import create_username
+from src.workshops.utils.version_diff import get_version_diff
 from src.workshops.utils.views import failed_to_delete
 
 logger = logging.getLogger("amy")
@@ -179,12 +193,30 @@ def logout_then_login_with_msg(request: AuthenticatedHttpRequest) -> HttpRespons
 
 @admin_required
 def changes_log(request: AuthenticatedHttpRequest) -> HttpResponse:
-    log = Revision.objects.all().select_related("user").prefetch_related("version_set").order_by("-date_created")
-    log_paginated = get_pagination_items(request, log)
-    context = {"log": log_paginated}
+    # only the newest version of each revision is linked to
+    latest_version = Version.objects.filter(revision=OuterRef("pk")).order_by("-pk")[:1]
+    log = (
+        Revision.objects.select_related("user")
+        .only("date_created", "user__personal")
+        .annotate(
+            version_pk=Subquery(latest_version.values("pk")),
+            version_repr=Subquery(latest_version.values("object_repr")),
+        )
+    )
+    filter = ChangesLogFilter(request.GET, queryset=log)
+    log_paginated = get_keyset_page_items(request, filter.qs, "date_created")
+    context = {"log": log_paginated, "filter": filter}
     return render(request, "workshops/changes_log.html", context)
 
 
+@admin_required
+def instrumentation_metrics(request: AuthenticatedHttpRequest) -> HttpResponse:
+    """Per-view request metrics aggregated by the current worker process."""
+    if not settings.INSTRUMENTATION_ENABLED:
+        raise Http404("Instrumentation is disabled.")
+    return JsonResponse({"views": metrics_registry.snapshot(), "markdown_cache": markdown_cache.stats.as_dict()})
+
+
 # ------------------------------------------------------------
 
 PERSON_HAS_NO_AIRPORT_ALERT = "{person} has no airport information on record."
@@ -194,6 +226,7 @@ class AllPersons(OnlyForAdminsMixin, AMYListView[Person]):
     context_object_name = "all_persons"
     template_name = "workshops/all_persons.html"
     filter_class = PersonFilter
+    paginator_class = EstimatedCountPaginator
     queryset = Person.objects.prefetch_related(
         Prefetch(
             "badges",
@@ -600,11 +633,8 @@ class PersonUpdate(OnlyForAdminsMixin, UserPassesTestMixin, AMYUpdateView[Person
 
     def form_valid(self, form: PersonForm) -> HttpResponse:
         self.object = form.save(commit=False)
-        # remove existing Qualifications for user
-        Qualification.objects.filter(person=self.object).delete()
-        # add new Qualifications
-        for lesson in form.cleaned_data.pop("lessons"):
-            Qualification.objects.create(person=self.object, lesson=lesson)
+        # replace existing Qualifications for user
+        sync_many_to_many(self.object.lessons, form.cleaned_data.pop("lessons"))
         result = super().form_valid(form)
 
         user_tasks = Task.objects.filter(person=self.object, event__isnull=False).select_related("event")
@@ -921,6 +951,7 @@ class AllEvents(OnlyForAdminsMixin, AMYListView[Event]):
         .order_by("-start")
     )
     filter_class = EventFilter
+    paginator_class = EstimatedCountPaginator
     title = "All Events"
 
 
@@ -1446,6 +1477,7 @@ class AllTasks(OnlyForAdminsMixin, AMYListView[Task]):
     context_object_name = "all_tasks"
     template_name = "workshops/all_tasks.html"
     filter_class = TaskFilter
+    paginator_class = NoCountPaginator
     queryset = Task.objects.select_related("event", "person", "role").prefetch_related(
         Prefetch(
             "person__consent_set",
@@ -2175,13 +2207,15 @@ def object_changes(request: AuthenticatedHttpRequest, version_id: int) -> HttpRe
         """Applies the correct ordering to the given version queryset."""
         return queryset.order_by("-pk" if history_latest_first else "pk")
 
-    # get action list
-    action_list: list[dict[str, Any]] = [
-        {"version": version, "revision": version.revision}
-        for version in _order(Version.objects.get_for_object(obj).select_related("revision__user"))
-    ]
+    # get action list; objects can have long histories, so it's paginated
+    action_page = get_pagination_items(
+        request,
+        _order(Version.objects.get_for_object(obj).select_related("revision__user").defer("serialized_data")),
+    )
+    action_list: list[dict[str, Any]] = [{"version": version, "revision": version.revision} for version in action_page]
+    comparable = action_page.paginator.count >= 2
 
-    if len(action_list) >= 2:
+    if len(action_list) >= 2 and action_page.number == 1:
         # this preselects radio buttons
         if history_latest_first:
             action_list[0]["first"] = True
@@ -2190,7 +2224,7 @@ def object_changes(request: AuthenticatedHttpRequest, version_id: int) -> HttpRe
             action_list[-1]["first"] = True
             action_list[-2]["second"] = True
 
-    if request.GET:
+    if "version_id1" in request.GET or "version_id2" in request.GET:
         form = SelectDiffForm(request.GET)
         if form.is_valid():
             version_id1 = form.cleaned_data["version_id1"]
@@ -2213,10 +2247,15 @@ def object_changes(request: AuthenticatedHttpRequest, version_id: int) -> HttpRe
         "version1": version1,
         "version2": version2,
         "revision": version2.revision,
-        "fields": [f for f in obj._meta.get_fields() if f.concrete],  # type: ignore[union-attr]
+        "diff": get_version_diff(
+            version1,
+            version2,
+            [f for f in obj._meta.get_fields() if f.concrete],  # type: ignore[union-attr,misc]
+        ),
         "action": "",
         "compare_view": True,
         "action_list": action_list,
-        "comparable": len(action_list) >= 2,
+        "action_page": action_page,
+        "comparable": comparable,
     }
     return render(request, "workshops/object_diff.html", context)
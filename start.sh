@@ -1,10 +1,7 @@
 #!/bin/bash
 
-uv run python manage.py check --fail-level WARNING
-
-uv run python manage.py migrate
-
-uv run python manage.py createcachetable
+# system checks, template compilation, cache tables and migrations (skipped when migration files haven't changed)
+uv run python manage.py startup
 
 uv run python manage.py runscript seed_badges
 uv run python manage.py runscript seed_communityroles
@@ -17,10 +14,5 @@ uv run python manage.py runscript seed_account_benefit_discounts
 
 uv run python manage.py create_superuser
 
-uv run gunicorn \
-    --workers=4 \
-    --bind=0.0.0.0:80 \
-    --access-logfile - \
-    --capture-output \
-    --env DJANGO_SETTINGS_MODULE=config.settings \
-    config.wsgi
+# workers, threads and preloading are configured with `AMY_GUNICORN_*` environment variables
+uv run gunicorn --config python:config.gunicorn_config